@@ -0,0 +1,52 @@
+"""
+Source corpus shared by the benchmark scripts.
+
+The ``cpython`` submodule is used when it is checked out, otherwise the
+standard library of the running interpreter.
+"""
+
+import ast
+import pathlib
+import sysconfig
+from typing import Iterator
+from typing import List as LIST
+from typing import Tuple as TUPLE
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def corpus_dir() -> pathlib.Path:
+    lib = ROOT / "cpython" / "Lib"
+    if lib.is_dir():
+        return lib
+
+    return pathlib.Path(sysconfig.get_paths()["stdlib"])
+
+
+def iter_sources(limit: int = 0) -> Iterator[TUPLE[pathlib.Path, str]]:
+    """Yield ``(path, source)`` for every parseable module of the corpus."""
+
+    count = 0
+    for path in sorted(corpus_dir().rglob("*.py")):
+        if {"site-packages", "test", "pydoc_data"} & set(path.parts):
+            continue
+
+        try:
+            source = path.read_text(encoding="utf-8")
+            ast.parse(source)
+        except (SyntaxError, UnicodeDecodeError, ValueError, OSError):
+            continue
+
+        yield path, source
+
+        count += 1
+        if limit and count >= limit:
+            break
+
+
+def load_sources(limit: int = 0) -> LIST[TUPLE[pathlib.Path, str]]:
+    return list(iter_sources(limit))
+
+
+def largest_source(limit: int = 0) -> TUPLE[pathlib.Path, str]:
+    return max(load_sources(limit), key=lambda item: item[1].count("\n"))
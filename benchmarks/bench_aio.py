@@ -0,0 +1,113 @@
+"""
+Writing and reading the corpus from an event loop: blocking calls against the
+coroutine variants, with the longest stall of a 1 ms heartbeat task on the loop.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_aio.py --files 200
+"""
+
+import argparse
+import ast
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from _corpus import load_sources
+
+from asttrs import Module, from_files_async, to_files_async
+
+
+async def heartbeat(stalls):
+    last = time.perf_counter()
+    while True:
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        stalls.append(now - last - 0.001)
+        last = now
+
+
+async def measure(work):
+    stalls = []
+    beat = asyncio.ensure_future(heartbeat(stalls))
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+
+    # lets the heartbeat record a stall that lasted until the end
+    await asyncio.sleep(0.01)
+    beat.cancel()
+    return elapsed, max(stalls, default=0.0)
+
+
+async def run(args, folder):
+    trees = []
+    for _, source in load_sources(args.files):
+        tree = Module.from_source(source)
+        try:
+            ast.parse(tree.to_source())
+        except SyntaxError:  # not rendered back faithfully, see to_source()
+            continue
+        trees.append(tree)
+
+    paths = [os.path.join(folder, f"m{idx}.py") for idx in range(len(trees))]
+    items = list(zip(paths, trees))
+    formatted = items[: args.formatted]
+
+    async def blocking_write():
+        for path, tree in items:
+            tree.to_file(path)
+
+    async def blocking_read():
+        for path in paths:
+            Module.from_file(path)
+
+    async def blocking_format():
+        for path, tree in formatted:
+            tree.to_file(path, formatted=True)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        cases = [
+            ("to_file", blocking_write),
+            ("to_files_async", lambda: to_files_async(items, limit=args.limit)),
+            (
+                "  + processes",
+                lambda: to_files_async(items, executor=pool, limit=args.limit),
+            ),
+            ("from_file", blocking_read),
+            ("from_files_async", lambda: from_files_async(paths, limit=args.limit)),
+            (
+                "  + processes",
+                lambda: from_files_async(paths, executor=pool, limit=args.limit),
+            ),
+            (f"to_file formatted ({len(formatted)})", blocking_format),
+            (
+                "to_files_async formatted",
+                lambda: to_files_async(formatted, formatted=True, limit=args.limit),
+            ),
+        ]
+
+        print(f"{len(trees)} modules, limit {args.limit}, {args.workers} workers")
+        for name, work in cases:
+            elapsed, stall = await measure(work)
+            print(
+                f"{name:<28} {elapsed * 1e3:8.0f} ms, loop stalled {stall * 1e3:7.1f} ms"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--formatted", type=int, default=16)
+    parser.add_argument("--limit", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        asyncio.run(run(args, folder))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Ahead-of-time generated node classes vs the attrs-decorated ones: the time
+and memory to load the node classes, and the conversion of the largest source.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_aot.py --repeat 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import json, resource, sys, time, tracemalloc
+
+traced = sys.argv[1] == "memory"
+if traced:
+    tracemalloc.start()
+
+start = time.perf_counter()
+
+import asttrs
+asttrs.Module
+
+result = {"time": time.perf_counter() - start, "module": asttrs._ast._module}
+if traced:
+    result["memory"] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+if len(sys.argv) > 2:
+    source = open(sys.argv[2]).read()
+    start = time.perf_counter()
+    asttrs.Module.from_source(source)
+    result["convert"] = time.perf_counter() - start
+
+result["rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps(result))
+"""
+
+
+def run(aot, mode, *args):
+    # bytecode is cached, as it is for an installed package
+    env = dict(os.environ, ASTTRS_AOT="1" if aot else "0")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", CHILD, mode, *args],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    from _corpus import largest_source
+
+    path, _ = largest_source()
+
+    results = {}
+    for aot in (False, True):
+        run(aot, "time")  # warm up the bytecode cache
+        runs = [run(aot, "time") for _ in range(args.repeat)]
+        memory = run(aot, "memory")["memory"]
+        convert = min(run(aot, "time", str(path))["convert"] for _ in range(3))
+
+        results[aot] = (
+            runs[0]["module"],
+            statistics.median(r["time"] for r in runs),
+            memory,
+            statistics.median(r["rss"] for r in runs),
+            convert,
+        )
+
+    print(f"corpus: {path}")
+    for module, t, mem, rss, convert in results.values():
+        print(
+            f"{module:<20} import {t * 1e3:7.1f} ms, {mem / 1024:7.0f} KiB allocated,"
+            f" max rss {rss / 1024:6.1f} MiB, from_source {convert * 1e3:7.1f} ms"
+        )
+
+    base, aot = results[False], results[True]
+    print(
+        f"import {base[1] / aot[1]:.1f}x faster,"
+        f" {(base[2] - aot[2]) / 1024:.0f} KiB less allocated"
+    )
+
+
+if __name__ == "__main__":
+    main()
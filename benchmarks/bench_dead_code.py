@@ -0,0 +1,141 @@
+"""
+remove_dead_code() on generated modules: the import time saved, and the cost of
+the pass over the corpus, first run (scopes analyzed) and again (cached).
+
+Each generated module imports a dozen stdlib modules, uses two of them, and
+defines private helpers, most of them never called. Import times are the
+median of *repeat* fresh interpreters, with the bytecode cached.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_dead_code.py --modules 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from _corpus import load_sources
+
+from asttrs import Module, remove_dead_code
+
+IMPORTS = """
+import json
+import re
+import csv
+import decimal
+import fractions
+import statistics
+import difflib
+import email.message
+import http.client
+import xml.dom.minidom
+import urllib.request
+import logging
+from dataclasses import dataclass, field
+"""
+
+HELPER = """
+def _helper_{i}(value):
+    result = decimal.Decimal(value) + fractions.Fraction(1, 3)
+    return json.dumps(str(result))
+    logging.debug("unreachable")
+"""
+
+ENTRY = """
+def handle_{i}(payload):
+    return re.sub(r"\\s+", " ", json.dumps(payload))
+"""
+
+CHILD = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+__import__(sys.argv[2])
+print(time.perf_counter() - start)
+"""
+
+
+def generate(helpers):
+    parts = [IMPORTS]
+    parts += [HELPER.format(i=i) for i in range(helpers)]
+    parts += [ENTRY.format(i=i) for i in range(helpers // 10 + 1)]
+    return "".join(parts)
+
+
+def import_time(path, package, repeat):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    def run():
+        out = subprocess.run(
+            [sys.executable, "-c", CHILD, path, package],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return float(out)
+
+    run()  # writes the bytecode
+    return statistics.median(run() for _ in range(repeat))
+
+
+def write_package(root, name, sources):
+    os.makedirs(os.path.join(root, name))
+    lines = []
+    for idx, source in enumerate(sources):
+        with open(os.path.join(root, name, f"gen_{idx}.py"), "w") as f:
+            f.write(source)
+        lines.append(f"from . import gen_{idx}\n")
+
+    with open(os.path.join(root, name, "__init__.py"), "w") as f:
+        f.writelines(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=20)
+    parser.add_argument("--helpers", type=int, default=50)
+    parser.add_argument("--files", type=int, default=300, help="of the corpus")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    sources = [generate(args.helpers)] * args.modules
+    trees = [Module.from_source(source) for source in sources]
+
+    start = time.perf_counter()
+    stripped = [remove_dead_code(tree).to_source() for tree in trees]
+    elapsed = time.perf_counter() - start
+
+    size = sum(map(len, sources))
+    print(
+        f"{args.modules} generated modules, {size / 1024:.0f} KiB ->"
+        f" {sum(map(len, stripped)) / 1024:.0f} KiB, pass and to_source {elapsed * 1e3:.0f} ms"
+    )
+
+    with tempfile.TemporaryDirectory() as root:
+        write_package(root, "original", [t.to_source() for t in trees])
+        write_package(root, "stripped", stripped)
+
+        before = import_time(root, "original", args.repeat)
+        after = import_time(root, "stripped", args.repeat)
+
+    print(f"import original  {before * 1e3:7.1f} ms")
+    print(f"import stripped  {after * 1e3:7.1f} ms  ({after / before - 1:+.0%})")
+
+    corpus = [Module.from_source(source) for _, source in load_sources(args.files)]
+    for label in ("first run", "cached"):
+        start = time.perf_counter()
+        changed = sum(remove_dead_code(tree) is not tree for tree in corpus)
+        elapsed = time.perf_counter() - start
+        print(
+            f"corpus {label:<9} {len(corpus)} modules in {elapsed * 1e3:6.0f} ms,"
+            f" {changed} changed"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+diff() on a large module, against a fresh parse and against an edited copy.
+
+    $ PYTHONPATH=src python benchmarks/bench_diff.py --nodes 100000
+"""
+
+import argparse
+import difflib
+import random
+import time
+
+from _corpus import iter_sources
+
+from asttrs import Constant, Cursor, Module, diff, walk
+
+
+def build_source(nodes):
+    parts, total = [], 0
+    for _, source in iter_sources():
+        parts.append(source)
+        total += sum(1 for _ in walk(Module.from_source(source)))
+        if total >= nodes:
+            break
+
+    return parts, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edits", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    parts, total = build_source(args.nodes)
+    source = "\n".join(parts)
+    old = Module.from_source(source)
+
+    rng = random.Random(args.seed)
+    constants = list(Cursor(old).find(Constant))
+    edited = old
+    for cur in rng.sample(constants, args.edits):
+        cur = Cursor.at(edited, cur.path)
+        edited = cur.replace(Constant(value="changed")).root()
+
+    half = len(parts) // 2
+    reparsed = Module.from_source(
+        "\n".join(parts[:half] + ["inserted = 1"] + parts[half:])
+    )
+
+    for label, new in [("edited copy", edited), ("fresh parse", reparsed)]:
+        start = time.perf_counter()
+        ops = diff(old, new)
+        elapsed = time.perf_counter() - start
+        print(f"{label:12s}: {total} nodes, {len(ops)} ops, {elapsed * 1e3:8.1f} ms")
+
+    start = time.perf_counter()
+    list(
+        difflib.unified_diff(
+            old.to_source().splitlines(), reparsed.to_source().splitlines()
+        )
+    )
+    print(f"text diff of to_source(): {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
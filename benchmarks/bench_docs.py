@@ -0,0 +1,82 @@
+"""
+Memory of the node classes with their docstrings left on disk, as loaded by
+default, vs with all of them read in, as every process paid when they were
+embedded in the generated modules.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_docs.py --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import json, resource, sys, tracemalloc
+
+tracemalloc.start()
+
+import asttrs
+asttrs.Module
+
+module = asttrs._ast._asttrs
+if sys.argv[1] == "loaded":
+    for value in list(vars(module).values()):
+        if isinstance(value, type):
+            value.__doc__
+
+print(json.dumps({
+    "memory": tracemalloc.get_traced_memory()[0],
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "docs": sum(len(v.__doc__ or "") for v in vars(module).values() if isinstance(v, type)),
+}))
+"""
+
+
+def run(mode):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", CHILD, mode],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run("lazy")  # warm up the bytecode cache
+
+    results = {}
+    for mode in ("loaded", "lazy"):
+        runs = [run(mode) for _ in range(args.repeat)]
+        results[mode] = (
+            statistics.median(r["memory"] for r in runs),
+            statistics.median(r["rss"] for r in runs),
+        )
+        docs = runs[0]["docs"]
+
+    print(f"docstrings: {docs / 1024:.0f} KiB")
+    for mode, (memory, rss) in results.items():
+        print(
+            f"{mode:<7} {memory / 1024:7.0f} KiB allocated, max rss {rss / 1024:6.1f} MiB"
+        )
+
+    (m0, r0), (m1, r1) = results["loaded"], results["lazy"]
+    print(
+        f"saved: {(m0 - m1) / 1024:.0f} KiB allocated, {(r0 - r1) / 1024:.1f} MiB rss"
+    )
+
+
+if __name__ == "__main__":
+    main()
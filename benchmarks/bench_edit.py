@@ -0,0 +1,46 @@
+"""
+apply_edits() vs one Cursor.replace() (a root-to-leaf evolve chain) per edit.
+
+    $ PYTHONPATH=src python benchmarks/bench_edit.py --edits 500
+"""
+
+import argparse
+import time
+
+from _corpus import largest_source
+
+from asttrs import Cursor, Module, Name, apply_edits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edits", type=int, default=500)
+    args = parser.parse_args()
+
+    path, source = largest_source()
+    tree = Module.from_source(source)
+
+    # Names are leaves, so the edits never nest in each other.
+    names = list(Cursor(tree).find(Name))[: args.edits]
+    edits = [(cur.path, cur.node.evolve(id=cur.node.id + "_")) for cur in names]
+
+    start = time.perf_counter()
+    sequential = tree
+    for target, new in edits:
+        sequential = Cursor.at(sequential, target).replace(new).root()
+    t_sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = apply_edits(tree, edits)
+    t_batch = time.perf_counter() - start
+
+    assert batch == sequential
+
+    print(f"corpus: {path}, {len(edits)} edits")
+    print(f"sequential evolve: {t_sequential * 1e3:9.2f} ms")
+    print(f"apply_edits:       {t_batch * 1e3:9.2f} ms")
+    print(f"speedup: {t_sequential / t_batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
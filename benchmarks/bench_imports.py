@@ -0,0 +1,51 @@
+"""
+build_graph() over the corpus: serial, parallel, and re-run from the cache.
+
+    $ PYTHONPATH=src python benchmarks/bench_imports.py --workers 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from _corpus import corpus_dir
+
+from asttrs import imports
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    graph = func()
+    elapsed = time.perf_counter() - start
+    edges = sum(len(v) for v in graph.values())
+    print(f"{label:24s}: {len(graph)} modules, {edges} edges, {elapsed:6.2f} s")
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    root = corpus_dir()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, "imports.json")
+
+        serial = timed("1 worker", lambda: imports.build_graph(root, workers=1))
+
+        imports._IMPORTS.clear()
+        label = f"{args.workers} workers"
+        parallel = timed(
+            label, lambda: imports.build_graph(root, workers=args.workers, cache=cache)
+        )
+        assert parallel == serial
+
+        imports._IMPORTS.clear()
+        timed("re-run, cache file", lambda: imports.build_graph(root, cache=cache))
+        timed("re-run, in memory", lambda: imports.build_graph(root))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+reparse() after a single-line edit against a full Module.from_source.
+
+    $ PYTHONPATH=src python benchmarks/bench_incremental.py --lines 20000
+"""
+
+import argparse
+import random
+import re
+import time
+
+from _corpus import iter_sources
+
+from asttrs import Module, TextEdit, reparse
+
+
+def build_source(lines):
+    parts, total = [], 0
+    for _, source in iter_sources():
+        parts.append(source)
+        total += source.count("\n")
+        if total >= lines:
+            break
+
+    return "\n".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=20_000)
+    parser.add_argument("--edits", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    source = build_source(args.lines)
+    mod = Module.from_source(source)
+    # the first call computes the statement spans of a module it has not seen
+    mod = reparse(mod, source, TextEdit(start=0, end=0, text=""))
+
+    rng = random.Random(args.seed)
+    incremental = full = 0.0
+    for _ in range(args.edits):
+        offset = rng.choice([m.start() for m in re.finditer(" = ", source)]) + 1
+        # "x = value" -> "x = (value)": one line changes, the module stays valid
+        end = source.index("\n", offset)
+        edit = TextEdit(
+            start=offset + 2, end=end, text="(" + source[offset + 2 : end] + ")"
+        )
+        new_source = edit.apply(source)
+
+        try:
+            start = time.perf_counter()
+            expected = Module.from_source(new_source)
+            full += time.perf_counter() - start
+        except SyntaxError:
+            continue
+
+        start = time.perf_counter()
+        new = reparse(mod, source, edit)
+        incremental += time.perf_counter() - start
+
+        assert new == expected
+        mod, source = new, new_source
+
+    count = args.edits
+    print(f"{source.count(chr(10))} lines, {count} single-line edits")
+    print(f"from_source: {full / count * 1e3:8.2f} ms per edit")
+    print(
+        f"reparse:     {incremental / count * 1e3:8.2f} ms per edit"
+        f" ({full / incremental:.0f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+memory_report() over the corpus: throughput, and the bytes per node class.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_memory.py --files 300
+"""
+
+import argparse
+import time
+
+from _corpus import load_sources
+
+from asttrs import Module
+from asttrs.stats import memory_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    sources = load_sources(args.files)
+
+    start = time.perf_counter()
+    trees = [Module.from_source(source) for _, source in sources]
+    t_parse = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = memory_report(*trees)
+    elapsed = time.perf_counter() - start
+
+    total = report.total
+    print(
+        f"{len(trees)} modules, {total.count:,} objects, {total.bytes / 2 ** 20:.1f} MiB"
+    )
+    print(
+        f"memory_report: {elapsed * 1e3:.0f} ms,"
+        f" {total.count / elapsed / 1e6:.2f} M objects/s"
+        f" (from_source of the same modules: {t_parse * 1e3:.0f} ms)"
+    )
+    print(
+        f"shared:  {report.shared.count:>10,} {report.shared.bytes / 2 ** 20:8.1f} MiB"
+    )
+    print(
+        f"strings: {report.strings.count:>10,} {report.strings.bytes / 2 ** 20:8.1f} MiB"
+    )
+
+    groups = [("containers", report.containers), ("other", report.other)]
+    groups.append(("nodes", dict(list(report.nodes.items())[: args.top])))
+    for title, usages in groups:
+        print(f"{title}:")
+        for name, usage in usages.items():
+            print(f"  {name:<16} {usage.count:>10,} {usage.bytes / 2 ** 20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+minify() over the corpus: bytes saved against to_source(), and render speed.
+
+Sizes are given as is and gzip-compressed, for code sent over the wire.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_minify.py --files 300
+"""
+
+import argparse
+import gc
+import time
+import zlib
+
+from _corpus import load_sources
+
+from asttrs import Module, minify
+
+
+def render(trees, func, repeat):
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            results = [func(tree) for tree in trees]
+            elapsed = min(elapsed, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    trees = [Module.from_source(source) for _, source in load_sources(args.files)]
+
+    modes = [
+        ("to_source", lambda tree: tree.to_source()),
+        ("minify", minify),
+        ("-docstrings", lambda tree: minify(tree, docstrings=False)),
+        (
+            "+rename",
+            lambda tree: minify(tree, docstrings=False, rename_locals=True),
+        ),
+    ]
+
+    print(f"{len(trees)} modules")
+    print(f"{'':<12} {'bytes':>12} {'gzipped':>12} {'ms':>8}")
+    baseline = None
+    for name, func in modes:
+        results, elapsed = render(trees, func, args.repeat)
+        size = sum(len(out.encode()) for out in results)
+        packed = sum(len(zlib.compress(out.encode(), 6)) for out in results)
+        if baseline is None:
+            baseline = size, packed
+
+        print(
+            f"{name:<12} {size:>12,} {packed:>12,} {elapsed * 1e3:>8.0f}"
+            f"  ({size / baseline[0]:.0%} / {packed / baseline[1]:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+optimize() over the corpus, and the runtime of generated code before and after.
+
+The generated function uses what CPython's compiler leaves to the runtime:
+comparisons and ``and`` / ``or`` of constants, the branches they decide and
+f-strings of constants.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_optimize.py --files 300
+"""
+
+import argparse
+import gc
+import time
+import timeit
+
+from _corpus import load_sources
+
+from asttrs import Module, optimize, walk
+
+GENERATED = """
+def handler(x, log=None):
+    if 3 > 2 and not None:
+        scale = 60 * 60 * 24
+    else:
+        scale = 1
+    if 1 > 2 or False:
+        log(f"{'debug'}: {x}")
+    label = f"{'id'}-{1 + 1:03d}-{'v' * 2!r}"
+    flag = True and x
+    kind = "big" if 10 ** 3 >= 1000 else "small"
+    return x * scale, label, flag, kind
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    trees = [Module.from_source(source) for _, source in load_sources(args.files)]
+    nodes = sum(1 for tree in trees for _ in walk(tree))
+
+    elapsed = float("inf")
+    for _ in range(args.repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            results = [optimize(tree) for tree in trees]
+            elapsed = min(elapsed, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    changed = sum(new is not old for new, old in zip(results, trees))
+    print(
+        f"optimize: {len(trees)} modules, {nodes:,} nodes in {elapsed * 1e3:.0f} ms,"
+        f" {nodes / elapsed / 1e6:.2f} M nodes/s, {changed} modules changed"
+    )
+
+    tree = Module.from_source(GENERATED)
+    timings = {}
+    for name, source in (
+        ("original", tree.to_source()),
+        ("optimized", optimize(tree).to_source()),
+    ):
+        namespace = {}
+        exec(compile(source, "<generated>", "exec"), namespace)
+        handler = namespace["handler"]
+        timings[name] = min(
+            timeit.repeat(lambda: handler(3), number=args.calls, repeat=args.repeat)
+        )
+        print(f"{name:<10} {timings[name] / args.calls * 1e9:6.0f} ns per call")
+
+    print(f"speedup: {timings['original'] / timings['optimized']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
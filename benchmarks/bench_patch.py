@@ -0,0 +1,57 @@
+"""
+Patch size and latency: make_patch/apply_patch vs to_json and reparsing.
+
+    $ PYTHONPATH=src python benchmarks/bench_patch.py --edits 20
+"""
+
+import argparse
+import json
+import random
+import time
+
+from _corpus import largest_source
+
+from asttrs import Cursor, Module, Name, apply_edits, apply_patch, make_patch
+
+
+def timed(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    path, source = largest_source()
+    old = Module.from_source(source)
+
+    rng = random.Random(args.seed)
+    names = rng.sample(list(Cursor(old).find(Name)), args.edits)
+    new = apply_edits(old, [(c.path, c.node.evolve(id=c.node.id + "_")) for c in names])
+    new_source = new.to_source()
+
+    t_make, patch = timed(lambda: make_patch(old, new))
+    payload = json.dumps(patch)
+    full = new.to_json()
+
+    t_apply, result = timed(lambda: apply_patch(old, json.loads(payload)))
+    t_parse, _ = timed(lambda: Module.from_source(new_source))
+
+    assert result == new
+
+    print(f"corpus: {path}, {args.edits} edits")
+    print(f"patch:   {len(payload):>10} bytes, make {t_make * 1e3:8.2f} ms")
+    print(f"to_json: {len(full):>10} bytes ({len(full) / len(payload):.0f}x larger)")
+    print(f"apply_patch: {t_apply * 1e3:8.2f} ms")
+    print(f"from_source: {t_parse * 1e3:8.2f} ms ({t_parse / t_apply:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
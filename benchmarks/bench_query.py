@@ -0,0 +1,100 @@
+"""
+Compiled patterns vs a naive recursive comparison over the stdlib corpus.
+
+    $ PYTHONPATH=src python benchmarks/bench_query.py
+"""
+
+import argparse
+import time
+
+import attr
+
+from _corpus import load_sources
+
+from asttrs import ANY, AST, Attribute, Call, Capture, Module, P, compile_pattern, walk
+
+
+def naive_match(pat, value, caps):
+    if pat is ANY or pat is Ellipsis:
+        return True
+
+    if isinstance(pat, Capture):
+        if not naive_match(pat.pattern, value, caps):
+            return False
+        caps[pat.name] = value
+        return True
+
+    if isinstance(pat, P):
+        if not isinstance(value, pat.cls):
+            return False
+        return all(
+            naive_match(sub, getattr(value, k), caps) for k, sub in pat.fields.items()
+        )
+
+    if isinstance(pat, list):
+        return (
+            isinstance(value, list)
+            and len(pat) == len(value)
+            and all(naive_match(p, v, caps) for p, v in zip(pat, value))
+        )
+
+    return pat == value
+
+
+def naive_search(pattern, value, found):
+    if isinstance(value, list):
+        for el in value:
+            naive_search(pattern, el, found)
+
+    elif isinstance(value, AST):
+        caps = {}
+        if naive_match(pattern, value, caps):
+            found.append((value, caps))
+
+        for fd in attr.fields(type(value)):
+            naive_search(pattern, getattr(value, fd.name), found)
+
+
+def naive_findall(pattern, trees):
+    found = []
+    for tree in trees:
+        naive_search(pattern, tree, found)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=0, help="number of modules")
+    args = parser.parse_args()
+
+    trees = [Module.from_source(src) for _, src in load_sources(args.limit)]
+    nodes = sum(1 for tree in trees for _ in walk(tree))
+
+    pattern = P(
+        Call,
+        func=P(Attribute, attr="join"),
+        args=[Capture("arg")],
+    )
+
+    start = time.perf_counter()
+    compiled = compile_pattern(pattern)
+    t_compile = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matches = compiled.findall(trees)
+    t_compiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = naive_findall(pattern, trees)
+    t_naive = time.perf_counter() - start
+
+    assert [m.node for m in matches] == [node for node, _ in expected]
+
+    print(f"corpus: {len(trees)} modules, {nodes} nodes, {len(matches)} matches")
+    print(f"compile:  {t_compile * 1e3:9.2f} ms")
+    print(f"compiled: {t_compiled:9.3f} s  ({nodes / t_compiled / 1e6:.1f} M nodes/s)")
+    print(f"naive:    {t_naive:9.3f} s  ({nodes / t_naive / 1e6:.1f} M nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+analyze_scopes() against symtable over the corpus, checking they agree.
+
+    $ PYTHONPATH=src python benchmarks/bench_scope.py --files 300
+"""
+
+import argparse
+import symtable
+import time
+
+from _corpus import load_sources
+
+from asttrs import Module, analyze_scopes
+
+
+def summarize_table(table, out):
+    symbols = frozenset(
+        (s.get_name(), s.is_local(), s.is_global(), s.is_free(), s.is_parameter())
+        for s in table.get_symbols()
+        if not s.get_name().startswith(".") and s.get_name() != "__class__"
+    )
+    out.append((table.get_name(), symbols))
+    for child in table.get_children():
+        summarize_table(child, out)
+    return out
+
+
+def summarize_scope(scope, out):
+    symbols = frozenset(
+        (n, s.is_local(), s.is_global(), s.is_free(), s.is_parameter())
+        for n, s in scope.symbols.items()
+        if n != "__class__"
+    )
+    out.append((scope.name, symbols))
+    for child in scope.children:
+        summarize_scope(child, out)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=300)
+    args = parser.parse_args()
+
+    sources = load_sources(args.files)
+    trees = [Module.from_source(source) for _, source in sources]
+
+    start = time.perf_counter()
+    tables = [symtable.symtable(source, str(path), "exec") for path, source in sources]
+    t_symtable = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scopes = [analyze_scopes(tree) for tree in trees]
+    t_first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tree in trees:
+        analyze_scopes(tree)
+    t_cached = time.perf_counter() - start
+
+    # one new statement per module: only the module scope is summarized again
+    edited = [
+        tree.evolve(body=tree.body + Module.from_source("added = 1").body)
+        for tree in trees
+    ]
+    start = time.perf_counter()
+    for tree in edited:
+        analyze_scopes(tree)
+    t_edited = time.perf_counter() - start
+
+    mismatches = sum(
+        summarize_table(table, []) != summarize_scope(scope, [])
+        for table, scope in zip(tables, scopes)
+    )
+
+    print(f"{len(sources)} modules, {mismatches} disagreeing with symtable")
+    print(f"symtable (from source): {t_symtable * 1e3:8.1f} ms")
+    print(f"analyze_scopes, first:  {t_first * 1e3:8.1f} ms")
+    print(f"analyze_scopes, cached: {t_cached * 1e3:8.1f} ms")
+    print(f"analyze_scopes, edited: {t_edited * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Throughput and peak memory of every conversion stage over the stdlib corpus.
+
+Each stage runs on every module of the corpus, timed as the best of *repeat*
+calls, and is reported in nodes/s and source bytes/s, with the largest
+tracemalloc peak of a single call. Modules ``to_source`` does not render back
+faithfully are left out of the corpus; a call that raises on the others fails
+the run. Results can be saved as JSON and compared against a saved baseline,
+e.g. one per ``_py3_*`` schema, run with the matching interpreter:
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_stages.py --files 100 \\
+        --save base-3.11.json
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_stages.py --files 100 \\
+        --baseline base-3.11.json --threshold 0.1
+
+The comparison exits with status 1 when a stage is slower, or its peak
+memory larger, than the baseline by more than *threshold*, or raised.
+
+``from_dict`` / ``from_json`` are not stages: ``to_dict`` does not record the
+node classes, so a tree cannot be structured back from it.
+"""
+
+import argparse
+import ast
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from _corpus import corpus_dir, load_sources
+
+import asttrs
+from asttrs import Module, walk
+
+_TMP = os.path.join(tempfile.gettempdir(), "asttrs_bench_stages.py")
+
+# stage -> (input from the tree and the source, the measured call)
+STAGES = {
+    "from_source": (lambda tree, source: source, Module.from_source),
+    "to_ast": (lambda tree, source: tree, lambda tree: tree.to_ast()),
+    "to_source": (lambda tree, source: tree, lambda tree: tree.to_source()),
+    "to_dict": (lambda tree, source: tree, lambda tree: tree.to_dict()),
+    # bytes constants are not JSON serializable
+    "to_json": (lambda tree, source: tree, lambda tree: tree.to_json(default=repr)),
+    "evolve": (
+        lambda tree, source: list(walk(tree)),
+        lambda nodes: [node.evolve() for node in nodes],
+    ),
+    "to_file": (
+        lambda tree, source: tree,
+        lambda tree: tree.to_file(_TMP, formatted=True),
+    ),
+}
+
+# compared metrics: (name, whether larger is better)
+METRICS = (("nodes_per_s", True), ("peak_bytes", False))
+
+
+def measure(name, samples, repeat, memory):
+    prepare, call = STAGES[name]
+
+    seconds = nodes = size = peak = errors = 0
+    error = None
+    for tree, source, count in samples:
+        try:
+            arg = prepare(tree, source)
+
+            elapsed = float("inf")
+            for _ in range(repeat):
+                # as timeit does, keep the cyclic gc out of the timings
+                gc.collect()
+                gc.disable()
+                try:
+                    start = time.perf_counter()
+                    call(arg)
+                    elapsed = min(elapsed, time.perf_counter() - start)
+                finally:
+                    gc.enable()
+
+            if memory:
+                tracemalloc.start()
+                call(arg)
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+
+        except Exception as exc:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            errors += 1
+            error = error or f"{type(exc).__name__}: {exc}"
+            continue
+
+        seconds += elapsed
+        nodes += count
+        size += len(source.encode("utf-8"))
+
+    return {
+        "seconds": seconds,
+        "nodes": nodes,
+        "bytes": size,
+        "nodes_per_s": nodes / seconds if seconds else 0.0,
+        "bytes_per_s": size / seconds if seconds else 0.0,
+        "peak_bytes": peak if memory else None,
+        "errors": errors,
+        "error": error,
+    }
+
+
+def run(files, stages, repeat, memory):
+    samples, skipped = [], 0
+    for _, source in load_sources(files):
+        tree = Module.from_source(source)
+        try:
+            ast.parse(tree.to_source())
+        except (SyntaxError, NotImplementedError):
+            skipped += 1
+            continue
+
+        count = sum(1 for _ in ast.walk(ast.parse(source)))
+        samples.append((tree, source, count))
+
+    return {
+        "python": platform.python_version(),
+        "schema": asttrs._ast._module,
+        "corpus": str(corpus_dir()),
+        "files": len(samples),
+        "skipped": skipped,
+        "stages": {name: measure(name, samples, repeat, memory) for name in stages},
+    }
+
+
+def compare(result, baseline, threshold):
+    """Yield ``(stage, metric, ratio, regressed)`` against *baseline*; a stage
+    that raised is reported with its ``errors`` and regressed."""
+
+    for name, stats in result["stages"].items():
+        if stats["errors"]:
+            yield name, "errors", float(stats["errors"]), True
+
+        base = baseline["stages"].get(name)
+        if base is None:
+            continue
+
+        for metric, higher_is_better in METRICS:
+            new, old = stats.get(metric), base.get(metric)
+            # nothing to compare with, or not measured (--no-memory)
+            if not old or new is None:
+                continue
+
+            ratio = new / old
+            if higher_is_better:
+                regressed = ratio < 1 - threshold
+            else:
+                regressed = ratio > 1 + threshold
+
+            yield name, metric, ratio, regressed
+
+
+def report(result):
+    print(
+        f"python {result['python']}, {result['schema']},"
+        f" {result['files']} files of {result['corpus']}"
+        f" ({result['skipped']} not rendered back faithfully)"
+    )
+    for name, stats in result["stages"].items():
+        peak = stats["peak_bytes"]
+        peak = f"{peak / 2 ** 20:8.1f} MiB" if peak is not None else " " * 12
+        print(
+            f"{name:<12} {stats['nodes_per_s']:12,.0f} nodes/s"
+            f" {stats['bytes_per_s'] / 2 ** 10:10,.0f} KiB/s  peak {peak}"
+            f"  errors {stats['errors']}"
+        )
+        if stats["error"]:
+            print(f"{'':<12} {stats['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--files", type=int, default=100, help="0 for all")
+    parser.add_argument(
+        "--stages", nargs="+", choices=list(STAGES), default=list(STAGES)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    result = run(args.files, args.stages, args.repeat, not args.no_memory)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(result, f, indent=2)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        report(result)
+
+    baseline = {"stages": {}}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        if baseline.get("schema") != result["schema"]:
+            print(f"note: baseline schema is {baseline.get('schema')}", file=sys.stderr)
+
+    regressions = 0
+    for name, metric, ratio, regressed in compare(result, baseline, args.threshold):
+        regressions += regressed
+        if metric == "errors":
+            print(
+                f"{name:<12} raised on {ratio:.0f} files  REGRESSION", file=sys.stderr
+            )
+            continue
+
+        mark = "  REGRESSION" if regressed else ""
+        print(f"{name:<12} {metric:<12} {ratio:6.2f}x baseline{mark}", file=sys.stderr)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+template().substitute() against from_source() of a formatted string.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_template.py --count 2000
+"""
+
+import argparse
+import time
+
+from asttrs import Constant, Module, template
+
+SOURCE = """
+def $name(self, $args):
+    '''Return the field of the record.'''
+    if self.$field is None:
+        raise ValueError($message)
+    return self.$field
+"""
+
+
+def from_template(i):
+    return template(SOURCE).substitute(
+        name=f"get_{i}",
+        args=["a", "b"],
+        field=f"field_{i}",
+        message=Constant(value=f"field_{i} is unset"),
+    )
+
+
+def from_fstring(i):
+    return Module.from_source(f"""
+def get_{i}(self, a, b):
+    '''Return the field of the record.'''
+    if self.field_{i} is None:
+        raise ValueError({f"field_{i} is unset"!r})
+    return self.field_{i}
+""")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {}
+    for label, func in (
+        ("from_source(f-string)", from_fstring),
+        ("template", from_template),
+    ):
+        start = time.perf_counter()
+        trees = [func(i) for i in range(args.count)]
+        results[label] = (time.perf_counter() - start, trees)
+
+    (t_src, expected), (t_tpl, actual) = results.values()
+    assert actual == expected
+
+    print(f"{args.count} functions")
+    for label, (elapsed, _) in results.items():
+        print(
+            f"{label:<22} {elapsed * 1e3:8.1f} ms, {elapsed / args.count * 1e6:7.1f} us each"
+        )
+    print(f"template is {t_src / t_tpl:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
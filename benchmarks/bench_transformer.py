@@ -0,0 +1,78 @@
+"""
+asttrs.NodeTransformer vs ast.NodeTransformer through to_ast/from_ast.
+
+    $ PYTHONPATH=src python benchmarks/bench_transformer.py
+"""
+
+import argparse
+import ast
+import time
+
+from _corpus import largest_source
+
+from asttrs import Module, NodeTransformer
+
+
+class RenameAsttrs(NodeTransformer):
+    def __init__(self, old, new):
+        self.old, self.new = old, new
+
+    def visit_Name(self, node):
+        return node.evolve(id=self.new) if node.id == self.old else node
+
+
+class RenameAst(ast.NodeTransformer):
+    def __init__(self, old, new):
+        self.old, self.new = old, new
+
+    def visit_Name(self, node):
+        if node.id == self.old:
+            node.id = self.new
+        return node
+
+
+def _best(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--name", default="len", help="name to rename")
+    args = parser.parse_args()
+
+    path, source = largest_source()
+    tree = Module.from_source(source)
+
+    def run_asttrs():
+        return RenameAsttrs(args.name, "renamed").visit(tree)
+
+    def run_ast():
+        return Module.from_ast(RenameAst(args.name, "renamed").visit(tree.to_ast()))
+
+    t_asttrs, new = _best(run_asttrs, args.repeat)
+    t_ast, expected = _best(run_ast, args.repeat)
+
+    assert new == expected
+
+    shared = sum(a is b for a, b in zip(tree.body, new.body))
+    hits = sum(
+        1 for n in ast.walk(tree.to_ast()) if getattr(n, "id", None) == args.name
+    )
+
+    print(f"corpus: {path} ({len(source)} bytes, {hits} renamed names)")
+    print(f"asttrs.NodeTransformer:           {t_asttrs * 1e3:9.2f} ms")
+    print(f"ast.NodeTransformer + round trip: {t_ast * 1e3:9.2f} ms")
+    print(
+        f"speedup: {t_ast / t_asttrs:.1f}x, shared statements: {shared}/{len(tree.body)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
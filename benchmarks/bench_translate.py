@@ -0,0 +1,68 @@
+"""
+translate() over the corpus, to an older schema and back, against parsing the
+source again with from_source().
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_translate.py --files 300
+"""
+
+import argparse
+import gc
+import time
+
+from _corpus import load_sources
+
+from asttrs import Module, TranslationError, translate, walk
+
+
+def timed(func, items, repeat):
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            results = [func(item) for item in items]
+            elapsed = min(elapsed, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--version", default="3.8")
+    args = parser.parse_args()
+
+    sources, trees = [], []
+    for _, source in load_sources(args.files):
+        tree = Module.from_source(source)
+        try:
+            translate(tree, args.version)
+        except TranslationError:
+            continue
+        sources.append(source)
+        trees.append(tree)
+
+    nodes = sum(1 for tree in trees for _ in walk(tree))
+    print(f"{len(trees)} modules, {nodes:,} nodes")
+
+    _, t_parse = timed(Module.from_source, sources, args.repeat)
+    old, t_down = timed(lambda tree: translate(tree, args.version), trees, args.repeat)
+    back, t_up = timed(translate, old, args.repeat)
+    assert back == trees
+
+    for name, elapsed in (
+        ("from_source", t_parse),
+        (f"translate to {args.version}", t_down),
+        ("translate back", t_up),
+    ):
+        print(
+            f"{name:<18} {elapsed * 1e3:7.0f} ms, {nodes / elapsed / 1e6:.2f} M nodes/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Cost of validation over the corpus: validate() on whole trees, and from_source
+with and without StrictMode checking every node constructed.
+
+    $ PYTHONPATH=src python -W ignore benchmarks/bench_validate.py --files 300
+"""
+
+import argparse
+import gc
+import time
+
+from _corpus import load_sources
+
+from asttrs import Module, StrictMode, validate, walk
+
+
+def best(func, args, repeat):
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for arg in args:
+                func(arg)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sources = [source for _, source in load_sources(args.files)]
+    trees = [Module.from_source(source) for source in sources]
+    nodes = sum(1 for tree in trees for _ in walk(tree))
+
+    t_validate = best(validate, trees, args.repeat)
+    t_walk = best(lambda tree: sum(1 for _ in walk(tree)), trees, args.repeat)
+    t_parse = best(Module.from_source, sources, args.repeat)
+    with StrictMode():
+        t_strict = best(Module.from_source, sources, args.repeat)
+
+    print(f"{len(trees)} modules, {nodes:,} nodes")
+    print(
+        f"validate:    {t_validate * 1e3:7.0f} ms, {nodes / t_validate / 1e6:.2f} M nodes/s"
+        f" (walk: {t_walk * 1e3:.0f} ms)"
+    )
+    print(f"from_source: {t_parse * 1e3:7.0f} ms")
+    print(
+        f"  strict:    {t_strict * 1e3:7.0f} ms, {t_strict / t_parse - 1:+.0%}"
+        f" ({(t_strict - t_parse) / nodes * 1e9:.0f} ns per node)"
+    )
+
+
+if __name__ == "__main__":
+    main()
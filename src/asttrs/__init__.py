@@ -1 +1,101 @@
-from ._ast import *  # noqa
+"""
+asttrs: an attrs-style wrapper for python ast.
+
+Nothing but this module runs on ``import asttrs``: node classes are loaded on
+first access of any of them, and every helper from the submodule defining it,
+through the module-level ``__getattr__`` (PEP 562).
+"""
+
+import sys
+
+# ``typing`` is left out on purpose: importing it costs more than this module.
+_HELPERS = {
+    "from_files_async": "_aio",
+    "to_files_async": "_aio",
+    "Cursor": "_cursor",
+    "DiffOp": "_diff",
+    "diff": "_diff",
+    "Insert": "_edit",
+    "apply_edits": "_edit",
+    "TextEdit": "_incremental",
+    "reparse": "_incremental",
+    "NodeIndex": "_index",
+    "node_index": "_index",
+    "Instrumentation": "_instrument",
+    "minify": "_minify",
+    "optimize": "_optimize",
+    "remove_dead_code": "_optimize",
+    "apply_patch": "_patch",
+    "make_patch": "_patch",
+    "ANY": "_query",
+    "Capture": "_query",
+    "CompiledPattern": "_query",
+    "P": "_query",
+    "PatternMatch": "_query",
+    "compile_pattern": "_query",
+    "Scope": "_scope",
+    "Symbol": "_scope",
+    "analyze_scopes": "_scope",
+    "Template": "_template",
+    "template": "_template",
+    "TranslationError": "_translate",
+    "translate": "_translate",
+    "StrictMode": "_validate",
+    "ValidationError": "_validate",
+    "validate": "_validate",
+    "NodeTransformer": "_visitor",
+    "NodeVisitor": "_visitor",
+    "iter_child_nodes": "_walk",
+    "iter_fields": "_walk",
+    "walk": "_walk",
+}
+
+# public submodules, imported on attribute access as well
+_SUBMODULES = frozenset(
+    {"imports", "stats", "utils", "v3_7", "v3_8", "v3_9", "v3_10", "v3_11", "v3_12"}
+)
+
+_NODE_NAMES = []  # type: list
+
+
+def _import(name: str) -> object:
+    # ``__import__`` rather than ``importlib``, which ``-X importtime`` misses
+    fullname = f"{__name__}.{name}"
+    __import__(fullname)
+
+    return sys.modules[fullname]
+
+
+def _load_nodes() -> list:
+    if not _NODE_NAMES:
+        module = _import("_ast")
+        namespace = globals()
+
+        for name, value in vars(module).items():
+            if not name.startswith("_") and name not in _HELPERS:
+                namespace.setdefault(name, value)
+                _NODE_NAMES.append(name)
+
+    return _NODE_NAMES
+
+
+def __getattr__(name: str) -> object:
+    if name in _HELPERS:
+        module = _import(_HELPERS[name])
+        value = globals()[name] = getattr(module, name)
+        return value
+
+    if name in _SUBMODULES:
+        return _import(name)
+
+    if name == "__all__":
+        return sorted(set(_load_nodes()) | set(_HELPERS))
+
+    if not name.startswith("_") and name in _load_nodes():
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_load_nodes()) | set(_HELPERS) | _SUBMODULES)
@@ -0,0 +1,155 @@
+"""
+Coroutine variants of the file API, for use on an asyncio event loop.
+
+Reading, parsing, rendering and writing run in an executor (the loop's default
+thread pool unless one is given; a ``ProcessPoolExecutor`` takes the parsing
+off the interpreter lock as well), and formatting runs black and isort as
+asyncio subprocesses. A semaphore bounds how many files are in flight.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterable
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+from typing import Type, Union
+
+from ._base import AST
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def _read(cls: Type[AST], filepath: PathLike) -> AST:
+    return cls.from_file(filepath)
+
+
+def _render(tree: AST) -> str:
+    return tree.to_source()
+
+
+def _write(filepath: PathLike, code: str) -> None:
+    with open(filepath, "w") as f:
+        f.write(code)
+
+
+async def _run(executor: Optional[Executor], func: Callable[..., Any], *args: Any):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args))
+
+
+class _Unbounded:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+def _bound(semaphore: Optional[asyncio.Semaphore]) -> Any:
+    return semaphore if semaphore is not None else _Unbounded()
+
+
+async def from_file_async(
+    cls: Type[AST],
+    filepath: PathLike,
+    executor: Optional[Executor] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> AST:
+    async with _bound(semaphore):
+        return await _run(executor, _read, cls, filepath)
+
+
+async def to_file_async(
+    tree: AST,
+    filepath: PathLike,
+    formatted: bool = False,
+    executor: Optional[Executor] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> None:
+    from asttrs.utils import blacking_async, isorting_async
+
+    async with _bound(semaphore):
+        code = await _run(executor, _render, tree)
+
+        if formatted:
+            code = await blacking_async(await isorting_async(code))
+
+        await _run(executor, _write, filepath, code)
+
+
+def _semaphore(limit: Optional[int]) -> Optional[asyncio.Semaphore]:
+    if limit is None:
+        return None
+
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, not {limit!r}")
+
+    return asyncio.Semaphore(limit)
+
+
+async def from_files_async(
+    filepaths: Iterable[PathLike],
+    cls: Optional[Type[AST]] = None,
+    executor: Optional[Executor] = None,
+    limit: Optional[int] = 8,
+) -> LIST[AST]:
+    """Parse *filepaths* concurrently, at most *limit* at a time, into a list
+    of *cls* trees (``Module`` by default), in order.
+
+    The first error raised cancels the files not yet done.
+    """
+
+    if cls is None:
+        from ._ast import Module as cls  # type: ignore
+
+    semaphore = _semaphore(limit)
+
+    return await _gather(
+        from_file_async(cls, path, executor, semaphore) for path in filepaths
+    )
+
+
+async def to_files_async(
+    items: Iterable[TUPLE[PathLike, AST]],
+    formatted: bool = False,
+    executor: Optional[Executor] = None,
+    limit: Optional[int] = 8,
+) -> None:
+    """Write every ``(filepath, tree)`` of *items* concurrently, at most
+    *limit* at a time.
+
+    >>> import asyncio, os, tempfile
+    >>> from asttrs import Module
+    >>> folder = tempfile.mkdtemp()
+    >>> items = [
+    ...     (os.path.join(folder, f"m{i}.py"), Module.from_source(f"x = {i}"))
+    ...     for i in range(3)
+    ... ]
+    >>> asyncio.run(to_files_async(items, limit=2))
+    >>> trees = asyncio.run(from_files_async(path for path, _ in items))
+    >>> [tree.to_source().strip() for tree in trees]
+    ['x = 0', 'x = 1', 'x = 2']
+    """
+
+    semaphore = _semaphore(limit)
+
+    await _gather(
+        to_file_async(tree, path, formatted, executor, semaphore)
+        for path, tree in items
+    )
+
+
+async def _gather(coros: Iterable[Any]) -> LIST[Any]:
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+
+    try:
+        return await asyncio.gather(*tasks)
+
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
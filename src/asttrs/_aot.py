@@ -0,0 +1,195 @@
+"""
+Runtime support of the ahead-of-time generated node modules (``_py3_*_aot``).
+
+Those modules hold the classes of the attrs-based ``_py3_*`` modules with the
+methods attrs would generate written out, so importing them creates plain
+slotted classes. ``__attrs_attrs__`` is computed on first access only, which
+keeps them usable with ``attr.fields``, ``attr.evolve``, ``attr.asdict`` and
+cattrs as before. Class docstrings live in a JSON file next to the module, read
+the first time any of them is asked for (``help()``, doctest).
+"""
+
+import inspect
+import json
+import os
+import sys
+from operator import itemgetter
+from typing import Any
+from typing import Dict as DICT
+from typing import Optional
+from typing import Tuple as TUPLE
+
+import attr
+
+NOTHING = attr.NOTHING
+
+# default of the sequence fields, ``attr.ib(factory=list)``
+FACTORY_LIST = attr.Factory(list)
+
+_ATTRIBUTE_PARAMS = frozenset(inspect.signature(attr.Attribute.__init__).parameters)
+
+
+def _attribute(name: str, default: Any, type: Any) -> attr.Attribute:
+    # the keywords of ``Attribute`` vary between attrs releases
+    kwargs = dict(
+        name=name,
+        default=default,
+        validator=None,
+        repr=True,
+        cmp=None,
+        eq=True,
+        eq_key=None,
+        order=True,
+        order_key=None,
+        hash=None,
+        init=True,
+        inherited=False,
+        metadata=None,
+        type=type,
+        converter=None,
+        kw_only=True,
+        on_setattr=None,
+        alias=name,
+        alias_is_default=True,
+    )
+
+    return attr.Attribute(**{k: v for k, v in kwargs.items() if k in _ATTRIBUTE_PARAMS})
+
+
+def _attributes_class(cls_name: str, names: TUPLE[str, ...]) -> type:
+    body: DICT[str, Any] = {"__slots__": ()}
+    for idx, name in enumerate(names):
+        body[name] = property(itemgetter(idx))
+
+    return type(f"{cls_name}Attributes", (tuple,), body)
+
+
+class LazyFields:
+    """``__attrs_attrs__`` of a generated class, built on first access.
+
+    *defaults* maps the field names, in order, to their defaults. The field
+    types are taken from the class annotations.
+    """
+
+    def __init__(self, **defaults: Any):
+        self.defaults = defaults
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> tuple:
+        cls = self.owner
+        annotations = cls.__dict__.get("__annotations__", {})
+
+        names = tuple(self.defaults)
+        fields = _attributes_class(cls.__name__, names)(
+            _attribute(name, default, annotations.get(name))
+            for name, default in self.defaults.items()
+        )
+
+        # replace the descriptor: the next lookups are plain attribute reads
+        setattr(cls, self.name, fields)
+
+        return fields
+
+
+class DocFile:
+    """The docstrings of the generated module *path*, read on first use."""
+
+    def __init__(self, path: str):
+        self.path = os.path.splitext(path)[0] + ".json"
+        self.docs: Optional[DICT[str, str]] = None
+
+    def get(self, name: str) -> Optional[str]:
+        if self.docs is None:
+            with open(self.path, encoding="utf-8") as f:
+                self.docs = json.load(f)
+
+        return self.docs.get(name)
+
+
+class LazyDoc:
+    """``__doc__`` of a generated class, looked up in *docs* on first access."""
+
+    def __init__(self, docs: DocFile):
+        self.docs = docs
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+
+    def __get__(self, instance: Any, owner: type) -> Optional[str]:
+        cls = self.owner
+
+        # docstrings are stripped under ``python -OO``
+        doc = self.docs.get(cls.__name__) if sys.flags.optimize < 2 else None
+        cls.__doc__ = doc
+
+        return doc
+
+
+def add_match_args(namespace: DICT[str, Any]) -> None:
+    """Give the classes with fields of a generated module the empty
+    ``__match_args__`` attrs adds to keyword-only classes, on 3.10+ only."""
+
+    if sys.version_info < (3, 10):
+        return
+
+    for value in list(namespace.values()):
+        if isinstance(value, type) and "__attrs_attrs__" in value.__dict__:
+            value.__match_args__ = ()
+
+
+def _values(obj: Any) -> tuple:
+    return tuple(getattr(obj, name) for name in obj._fields)
+
+
+def ne(self, other):
+    result = self.__eq__(other)
+    if result is NotImplemented:
+        return NotImplemented
+
+    return not result
+
+
+def lt(self, other):
+    if other.__class__ is self.__class__:
+        return _values(self) < _values(other)
+
+    return NotImplemented
+
+
+def le(self, other):
+    if other.__class__ is self.__class__:
+        return _values(self) <= _values(other)
+
+    return NotImplemented
+
+
+def gt(self, other):
+    if other.__class__ is self.__class__:
+        return _values(self) > _values(other)
+
+    return NotImplemented
+
+
+def ge(self, other):
+    if other.__class__ is self.__class__:
+        return _values(self) >= _values(other)
+
+    return NotImplemented
+
+
+def getstate(self):
+    return {name: getattr(self, name) for name in self._fields}
+
+
+def setstate(self, state):
+    if isinstance(state, tuple):
+        for name, value in zip(self._fields, state):
+            object.__setattr__(self, name, value)
+
+    else:
+        for name in self._fields:
+            if name in state:
+                object.__setattr__(self, name, state[name])
@@ -3,48 +3,20 @@ Abstract Syntax Trees: https://docs.python.org/3/library/ast.html
 """
 
 import ast as _ast
+import os
 import sys
 import warnings
 from typing import Type
 
+from . import _versions
 from ._base import AST, immutable
 
-if (3, 7) <= sys.version_info < (3, 8):
-    import asttrs._py3_7 as _asttrs
-    from asttrs._py3_7 import *  # noqa
+_module = _versions.module_name(_versions.CURRENT)
+_asttrs = _versions.load(_versions.CURRENT)
 
-    pass
-
-
-elif (3, 8) <= sys.version_info < (3, 9):
-    import asttrs._py3_8 as _asttrs
-    from asttrs._py3_8 import *  # noqa
-
-    pass
-
-elif (3, 9) <= sys.version_info < (3, 10):
-    import asttrs._py3_9 as _asttrs
-    from asttrs._py3_9 import *  # noqa
-
-    pass
-
-elif (3, 10) <= sys.version_info < (3, 11):
-    import asttrs._py3_10 as _asttrs
-    from asttrs._py3_10 import *  # noqa
-
-    pass
-
-elif (3, 11) <= sys.version_info < (3, 12):
-    import asttrs._py3_11 as _asttrs
-    from asttrs._py3_11 import *  # noqa
-
-    pass
-
-else:
-    import asttrs._py3_12 as _asttrs
-    from asttrs._py3_12 import *  # noqa
-
-    pass
+globals().update(
+    (name, value) for name, value in vars(_asttrs).items() if not name.startswith("_")
+)
 
 
 if (3, 11) <= sys.version_info:
@@ -84,3 +56,10 @@ class Comment(stmt):
         )
 
         return Expr(value=Name(id=cmt, ctx=Store())).to_ast()
+
+
+# ASTTRS_STRICT=1 validates every node constructed, see asttrs.StrictMode
+if os.environ.get("ASTTRS_STRICT", "0") != "0":
+    from ._validate import StrictMode
+
+    StrictMode().enable()
@@ -6,15 +6,28 @@ from typing import Dict as DICT
 from typing import List as LIST
 from typing import Optional
 from typing import Tuple as TUPLE
-from typing import Type, Union
+from typing import TYPE_CHECKING, Type, Union
 
-import ast_decompiler
 import attr
-import cattr
+
+from ._versions import foreign
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
 
 immutable = attr.s(auto_attribs=True, slots=True, frozen=True, kw_only=True)
 
 
+def _field_names(cls: type) -> TUPLE[str, ...]:
+    # ahead-of-time generated classes carry their field names in ``_fields``
+    names = cls.__dict__.get("_fields")
+    if names is None:
+        names = tuple(f.name for f in attr.fields(cls)) if attr.has(cls) else ()
+
+    return names
+
+
 @immutable
 class Serializable:
     def to_dict(self, recurse=True, **kwargs):
@@ -22,6 +35,8 @@ class Serializable:
 
     @classmethod
     def from_dict(cls, data: DICT):
+        import cattr
+
         return cattr.structure_attrs_fromdict(data, cls)
 
     @classmethod
@@ -62,12 +77,17 @@ class AST(Serializable):
 
         return getattr(asttrs, _ast_type.__name__)
 
-    def to_ast(self) -> _ast.AST:
-        cls = type(self)
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
 
-        fields: TUPLE[attr.Attribute, ...] = (
-            attr.fields(cls) if attr.has(cls) else tuple()
-        )
+        # The classes of another version's schema convert through the running
+        # one's, decided once here rather than on every node converted.
+        if AST in cls.__bases__ and foreign(cls) is not None:
+            cls.to_ast = _foreign_to_ast  # type: ignore
+            cls.from_ast = classmethod(_foreign_from_ast)  # type: ignore
+
+    def to_ast(self) -> _ast.AST:
+        fields = _field_names(type(self))
 
         ast_type = self.infer_ast_type()
 
@@ -75,8 +95,7 @@ class AST(Serializable):
 
         kwargs = {}
 
-        for fd in fields:
-            name = fd.name
+        for name in fields:
             if name in ast_fields:
 
                 value = getattr(self, name)
@@ -109,7 +128,14 @@ class AST(Serializable):
         
         raise TypeError(f"Type dismatch -> got: {mod.__class__.__name__}, expected: {cls.__name__}")
 
-    def to_source(self) -> str:
+    def to_source(self, minified: bool = False) -> str:
+        if minified:
+            from asttrs._minify import minify
+
+            return minify(self)
+
+        import ast_decompiler
+
         return ast_decompiler.decompile(self.to_ast())
 
     def show(self) -> None:
@@ -135,8 +161,34 @@ class AST(Serializable):
             f.write(code)
 
     @classmethod
-    def from_ast(cls, _ast_obj: _ast.AST) -> Optional[Union[LIST["AST"], "AST"]]:
+    async def from_file_async(
+        cls,
+        filepath: str,
+        executor: Optional["Executor"] = None,
+        semaphore: Optional["asyncio.Semaphore"] = None,
+    ) -> "AST":
+        """``from_file`` in *executor*, holding *semaphore* if given."""
+
+        from asttrs._aio import from_file_async
 
+        return await from_file_async(cls, filepath, executor, semaphore)
+
+    async def to_file_async(
+        self,
+        filepath: str,
+        formatted: bool = False,
+        executor: Optional["Executor"] = None,
+        semaphore: Optional["asyncio.Semaphore"] = None,
+    ) -> None:
+        """``to_file`` with rendering and writing in *executor*, and black and
+        isort run as asyncio subprocesses, holding *semaphore* if given."""
+
+        from asttrs._aio import to_file_async
+
+        return await to_file_async(self, filepath, formatted, executor, semaphore)
+
+    @classmethod
+    def from_ast(cls, _ast_obj: _ast.AST) -> Optional[Union[LIST["AST"], "AST"]]:
         if isinstance(
             _ast_obj, (int, str, bytes, float, complex, type(Ellipsis), type(None))
         ):
@@ -153,8 +205,8 @@ class AST(Serializable):
 
             return _cls(
                 **{
-                    f.name: cls.from_ast(getattr(_ast_obj, f.name, None))
-                    for f in attr.fields(_cls)
+                    name: cls.from_ast(getattr(_ast_obj, name, None))
+                    for name in _field_names(_cls)
                 }
             )
 
@@ -162,6 +214,24 @@ class AST(Serializable):
             raise TypeError(_ast_obj)
 
 
+def _foreign_to_ast(self: AST) -> _ast.AST:
+    from asttrs._translate import translate
+
+    return translate(self).to_ast()
+
+
+def _foreign_from_ast(cls: type, _ast_obj: _ast.AST) -> Any:
+    from asttrs._translate import translate
+
+    version = foreign(cls)
+    result = AST.from_ast(_ast_obj)
+
+    if isinstance(result, LIST):
+        return [translate(el, version) for el in result]
+
+    return translate(result, version) if isinstance(result, AST) else result
+
+
 @immutable
 class Example(Serializable):
     source: str
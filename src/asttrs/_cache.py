@@ -0,0 +1,47 @@
+"""
+Caches keyed by node identity.
+
+Nodes are frozen, so anything derived from a (sub)tree stays valid for as long
+as that object is alive. Nodes holding lists are not hashable, hence the
+``id()`` keys; entries are dropped as soon as the key object is collected.
+Cached values must not keep the key object itself alive.
+"""
+
+import weakref
+from typing import Any, Callable
+from typing import Dict as DICT
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityCache(Generic[T]):
+    def __init__(self):
+        self._data: DICT[int, T] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, obj: Any) -> bool:
+        return id(obj) in self._data
+
+    def get(self, obj: Any, default: Any = None) -> Any:
+        return self._data.get(id(obj), default)
+
+    def set(self, obj: Any, value: T) -> T:
+        key = id(obj)
+        if key not in self._data:
+            weakref.finalize(obj, self._data.pop, key, None)
+
+        self._data[key] = value
+
+        return value
+
+    def get_or_create(self, obj: Any, factory: Callable[[Any], T]) -> T:
+        try:
+            return self._data[id(obj)]
+        except KeyError:
+            return self.set(obj, factory(obj))
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,254 @@
+"""
+Zipper-style cursors over immutable asttrs trees.
+
+A :class:`Cursor` is a node together with the way back to the root: its parent
+cursor and the field (and list index) it hangs from. Moving around is free,
+and :meth:`Cursor.replace` rebuilds only the nodes on the path to the root, so
+an edit costs O(depth) instead of a full-tree copy.
+"""
+
+from typing import Any, Iterator
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+from typing import Type, Union
+
+from ._base import AST
+from ._walk import _WALK_TABLES, _walk_entry, child_fields
+
+Path = TUPLE[Union[str, int], ...]
+
+
+class Cursor:
+    """A position in a tree.
+
+    >>> from asttrs import FunctionDef, Module, Name, Return
+    >>> tree = Module.from_source("def f(x):\\n    return x")
+    >>> name = next(Cursor(tree).find(Name))
+    >>> name.path
+    ('body', 0, 'body', 0, 'value')
+    >>> name.enclosing(FunctionDef).node.name
+    'f'
+    >>> name.replace(name.node.evolve(id="y")).root().show()
+    def f(x):
+        return y
+    """
+
+    __slots__ = ("node", "parent", "field", "index")
+
+    def __init__(
+        self,
+        node: AST,
+        parent: Optional["Cursor"] = None,
+        field: Optional[str] = None,
+        index: Optional[int] = None,
+    ):
+        self.node = node
+        self.parent = parent
+        self.field = field
+        self.index = index
+
+    def __repr__(self):
+        return f"Cursor({type(self.node).__name__} at {self.path!r})"
+
+    @property
+    def path(self) -> Path:
+        """Steps from the root: field names, and list indexes for list fields."""
+
+        steps: LIST[Union[str, int]] = []
+        cur = self
+        while cur.parent is not None:
+            if cur.index is not None:
+                steps.append(cur.index)
+            steps.append(cur.field)
+            cur = cur.parent
+
+        return tuple(reversed(steps))
+
+    @property
+    def depth(self) -> int:
+        depth = 0
+        cur = self.parent
+        while cur is not None:
+            depth += 1
+            cur = cur.parent
+
+        return depth
+
+    def root(self) -> AST:
+        """Return the root node of the tree this cursor belongs to."""
+
+        cur = self
+        while cur.parent is not None:
+            cur = cur.parent
+
+        return cur.node
+
+    def ancestors(self) -> Iterator["Cursor"]:
+        """Yield the parent, grand-parent, ... up to the root."""
+
+        cur = self.parent
+        while cur is not None:
+            yield cur
+            cur = cur.parent
+
+    def enclosing(self, *types: Type[AST]) -> Optional["Cursor"]:
+        """Return the closest ancestor whose node is an instance of *types*."""
+
+        for cur in self.ancestors():
+            if isinstance(cur.node, types):
+                return cur
+
+        return None
+
+    def child(self, field: str, index: Optional[int] = None) -> "Cursor":
+        value = getattr(self.node, field)
+        if index is not None:
+            value = value[index]
+
+        if not isinstance(value, AST):
+            raise TypeError(f"{field!r} does not hold a node: {value!r}")
+
+        return Cursor(value, self, field, index)
+
+    def children(self) -> TUPLE["Cursor", ...]:
+        """Return cursors to the direct child nodes, in field order."""
+
+        node = self.node
+        result = []
+
+        for name, _ in child_fields(type(node)):
+            value = getattr(node, name)
+
+            if isinstance(value, list):
+                for idx, el in enumerate(value):
+                    if isinstance(el, AST):
+                        result.append(Cursor(el, self, name, idx))
+
+            elif isinstance(value, AST):
+                result.append(Cursor(value, self, name))
+
+        return tuple(result)
+
+    @property
+    def siblings(self) -> TUPLE["Cursor", ...]:
+        """Return the other nodes of the list this node is an element of."""
+
+        if self.parent is None or self.index is None:
+            return ()
+
+        values = getattr(self.parent.node, self.field)
+
+        return tuple(
+            Cursor(el, self.parent, self.field, idx)
+            for idx, el in enumerate(values)
+            if idx != self.index and isinstance(el, AST)
+        )
+
+    def _sibling(self, offset: int) -> Optional["Cursor"]:
+        if self.parent is None or self.index is None:
+            return None
+
+        values = getattr(self.parent.node, self.field)
+        idx = self.index + offset
+
+        if 0 <= idx < len(values) and isinstance(values[idx], AST):
+            return Cursor(values[idx], self.parent, self.field, idx)
+
+        return None
+
+    @property
+    def next_sibling(self) -> Optional["Cursor"]:
+        return self._sibling(1)
+
+    @property
+    def prev_sibling(self) -> Optional["Cursor"]:
+        return self._sibling(-1)
+
+    def find(self, types: Any = None) -> Iterator["Cursor"]:
+        """Yield cursors for this node and its descendants in document order,
+        restricted to instances of *types* if given, like :func:`walk`."""
+
+        if types is not None and not isinstance(types, tuple):
+            types = (types,)
+
+        table = _WALK_TABLES.setdefault(types, {})
+
+        stack = [self]
+        while stack:
+            cur = stack.pop()
+            cls = type(cur.node)
+
+            try:
+                found, fields = table[cls]
+            except KeyError:
+                found, fields = table[cls] = _walk_entry(cls, types)
+
+            if found:
+                yield cur
+
+            node = cur.node
+            for name, is_seq in fields:
+                value = getattr(node, name)
+
+                if is_seq:
+                    for idx in range(len(value or ()) - 1, -1, -1):
+                        if isinstance(value[idx], AST):
+                            stack.append(Cursor(value[idx], cur, name, idx))
+
+                elif isinstance(value, AST):
+                    stack.append(Cursor(value, cur, name))
+
+    def replace(self, new: AST) -> "Cursor":
+        """Return a cursor at the same position of a tree where this node is
+        replaced by *new*. Only the ancestors of the node are rebuilt."""
+
+        chain = [self]
+        chain.extend(self.ancestors())
+
+        nodes = [new]
+        for cur in chain[:-1]:
+            parent = cur.parent.node
+            value = nodes[-1]
+
+            if cur.index is not None:
+                values = list(getattr(parent, cur.field))
+                values[cur.index] = value
+                value = values
+
+            nodes.append(parent.evolve(**{cur.field: value}))
+
+        result = None
+        for cur, node in zip(reversed(chain), reversed(nodes)):
+            result = Cursor(node, result, cur.field, cur.index)
+
+        return result
+
+    @classmethod
+    def at(cls, root: AST, path: Path) -> "Cursor":
+        """Return the cursor for *path* in *root*, see :attr:`path`."""
+
+        cur = cls(root)
+        pos = 0
+
+        while pos < len(path):
+            field, index = path[pos], None
+            pos += 1
+
+            if pos < len(path) and isinstance(path[pos], int):
+                index = path[pos]
+                pos += 1
+
+            cur = cur.child(field, index)
+
+        return cur
+
+    @classmethod
+    def locate(cls, root: AST, node: AST) -> Optional["Cursor"]:
+        """Return the cursor of *node* (by identity) in *root*, if present."""
+
+        for cur in cls(root).find(type(node)):
+            if cur.node is node:
+                return cur
+
+        return None
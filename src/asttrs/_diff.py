@@ -0,0 +1,430 @@
+"""
+Structural diff of two asttrs trees.
+
+Every subtree gets a structural hash, computed bottom-up once per tree (and
+only once for subtrees both trees share) by a hashing function generated per
+node class. Different hashes mean different subtrees; equal ones are confirmed
+by comparing the subtrees, which stops at the first object both trees share,
+so unchanged regions are skipped cheaply and the diff costs roughly the size
+of the changed region plus one hashing pass.
+"""
+
+import difflib
+from typing import Any, Callable
+from typing import Dict as DICT
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+
+from ._base import AST, immutable
+from ._cursor import Path
+from ._walk import child_fields, field_names
+
+INSERT = "insert"
+DELETE = "delete"
+UPDATE = "update"
+MOVE = "move"
+
+_SPECS: DICT[type, TUPLE[TUPLE[str, ...], TUPLE[TUPLE[str, bool], ...]]] = {}
+_HASHERS: DICT[type, Callable[[Any, Any], int]] = {}
+_SAFE_HASHERS: DICT[type, Callable[[Any, Any], int]] = {}
+_EQUALS: DICT[type, Callable[[Any, Any], bool]] = {}
+
+
+@immutable
+class DiffOp:
+    """One edit turning the old tree into the new one.
+
+    * ``insert``: *new* appears at *new_path*; *old_path* is the position of
+      the old list it is inserted before.
+    * ``delete``: *old* at *old_path* is gone.
+    * ``update``: the node at *old_path* becomes *new* at *new_path*; *fields*
+      lists the changed scalar fields, or is empty when the node was replaced
+      by one of another class.
+    * ``move``: *old* at *old_path* reappears unchanged at *new_path*;
+      *anchor* is the old position it is inserted before.
+    """
+
+    kind: str
+    old_path: Optional[Path] = None
+    new_path: Optional[Path] = None
+    old: Any = None
+    new: Any = None
+    fields: TUPLE[str, ...] = ()
+    anchor: Optional[Path] = None
+
+
+def _spec(cls: type) -> TUPLE[TUPLE[str, ...], TUPLE[TUPLE[str, bool], ...]]:
+    try:
+        return _SPECS[cls]
+    except KeyError:
+        children = child_fields(cls)
+        child_names = {name for name, _ in children}
+        scalars = tuple(n for n in field_names(cls) if n not in child_names)
+        spec = _SPECS[cls] = (scalars, children)
+        return spec
+
+
+def _scalar_key(value: Any) -> Any:
+    if isinstance(value, list):
+        return (list, tuple(_scalar_key(v) for v in value))
+
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+
+    return (type(value), value)
+
+
+def _same_scalar(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+
+    cls = a.__class__
+    if cls is not b.__class__:
+        return False
+
+    if cls is float or cls is complex:
+        return repr(a) == repr(b)
+
+    return _scalar_key(a) == _scalar_key(b)
+
+
+def _comparer(cls: type) -> Callable[[Any, Any], bool]:
+    """Generate the function comparing two nodes of *cls* field by field,
+    like ``_hasher``."""
+
+    try:
+        return _EQUALS[cls]
+    except KeyError:
+        pass
+
+    scalars, children = _spec(cls)
+
+    parts = [f"_scalar(a.{name}, b.{name})" for name in scalars]
+    parts.extend(f"_equal(a.{name}, b.{name})" for name, _ in children)
+
+    source = "def _eq(a, b):\n    return %s" % (" and ".join(parts) or "True")
+    namespace = {"_scalar": _same_scalar, "_equal": _equal}
+    exec(compile(source, f"<structural equality of {cls.__name__}>", "exec"), namespace)
+
+    func = _EQUALS[cls] = namespace["_eq"]
+
+    return func
+
+
+def _equal(a: Any, b: Any) -> bool:
+    """Whether *a* and *b* are the same subtree, scalars of the same class
+    included: unlike ``==``, ``Constant(1)`` is not ``Constant(True)`` nor
+    ``Constant(0.0)`` ``Constant(-0.0)``."""
+
+    if a is b:
+        return True
+
+    cls = a.__class__
+    if cls is not b.__class__:
+        return False
+
+    if cls is list:
+        return len(a) == len(b) and all(map(_equal, a, b))
+
+    if not isinstance(a, AST):
+        return _same_scalar(a, b)
+
+    func = _EQUALS.get(cls) or _comparer(cls)
+
+    return func(a, b)
+
+
+def _hasher(cls: type, safe: bool = False) -> Callable[[Any, Any], int]:
+    """Generate the function hashing one node of *cls* from its fields, given
+    a callable returning the hash of a child.
+
+    Scalars are hashed as they are; the *safe* variant, used when that raises
+    ``TypeError``, goes through ``_scalar_key`` for unhashable values.
+    """
+
+    cache = _SAFE_HASHERS if safe else _HASHERS
+
+    try:
+        return cache[cls]
+    except KeyError:
+        pass
+
+    scalars, children = _spec(cls)
+
+    parts = ["_cls"]
+    for name in scalars:
+        if safe:
+            parts.append(f"_key(node.{name})")
+        else:
+            parts.append(f"node.{name}.__class__, node.{name}")
+
+    for name, is_seq in children:
+        if is_seq:
+            parts.append(f"tuple([rec(v) for v in node.{name}])")
+        else:
+            parts.append(f"rec(node.{name})")
+
+    source = "def _hash(node, rec):\n    return hash((%s,))" % ", ".join(parts)
+    namespace = {"_cls": cls, "_key": _scalar_key}
+    exec(compile(source, f"<structural hash of {cls.__name__}>", "exec"), namespace)
+
+    func = cache[cls] = namespace["_hash"]
+
+    return func
+
+
+def structural_hashes(
+    tree: AST, memo: Optional[DICT[int, int]] = None
+) -> DICT[int, int]:
+    """Return ``{id(node): hash}`` for every node of *tree*.
+
+    Subtrees whose id is already in *memo* are not visited again, which makes
+    hashing a second tree sharing structure with the first one cheap. The
+    ids are only meaningful while the trees are alive.
+    """
+
+    memo = {} if memo is None else memo
+    get = memo.get
+    hashers = _HASHERS
+
+    def rec(value: Any) -> Any:
+        key = id(value)
+
+        found = get(key)
+        if found is not None:
+            return found
+
+        try:
+            hasher = hashers[value.__class__]
+        except KeyError:
+            if not isinstance(value, AST):
+                return _scalar_key(value)
+            hasher = _hasher(value.__class__)
+
+        try:
+            found = hasher(value, rec)
+        except TypeError:
+            found = _hasher(value.__class__, safe=True)(value, rec)
+
+        memo[key] = found
+
+        return found
+
+    rec(tree)
+
+    return memo
+
+
+class _Differ:
+    def __init__(self, old: AST, new: AST):
+        self.hashes = structural_hashes(old)
+        structural_hashes(new, self.hashes)
+        # keep both trees alive while their ids are in use
+        self.trees = (old, new)
+        self.ops: LIST[DiffOp] = []
+
+    def key(self, value: Any) -> Any:
+        if isinstance(value, AST):
+            return self.hashes[id(value)]
+        return _scalar_key(value)
+
+    def same(self, old: Any, new: Any) -> bool:
+        # hashes collide, ``hash(-1) == hash(-2)``: equal ones are confirmed
+        return self.key(old) == self.key(new) and _equal(old, new)
+
+    def node(self, old: AST, new: AST, opath: Path, npath: Path) -> None:
+        if self.same(old, new):
+            return
+
+        cls = type(old)
+        if cls is not type(new):
+            self.ops.append(
+                DiffOp(kind=UPDATE, old_path=opath, new_path=npath, old=old, new=new)
+            )
+            return
+
+        scalars, children = _spec(cls)
+
+        changed = tuple(
+            name
+            for name in scalars
+            if not _same_scalar(getattr(old, name), getattr(new, name))
+        )
+        if changed:
+            self.ops.append(
+                DiffOp(
+                    kind=UPDATE,
+                    old_path=opath,
+                    new_path=npath,
+                    old=old,
+                    new=new,
+                    fields=changed,
+                )
+            )
+
+        for name, _ in children:
+            a, b = getattr(old, name), getattr(new, name)
+
+            if isinstance(a, list) and isinstance(b, list):
+                self.sequence(a, b, opath + (name,), npath + (name,))
+
+            elif isinstance(a, AST) and isinstance(b, AST):
+                self.node(a, b, opath + (name,), npath + (name,))
+
+            elif not self.same(a, b):
+                self.ops.append(
+                    DiffOp(
+                        kind=UPDATE,
+                        old_path=opath + (name,),
+                        new_path=npath + (name,),
+                        old=a,
+                        new=b,
+                    )
+                )
+
+    def sequence(self, a: LIST[Any], b: LIST[Any], opath: Path, npath: Path) -> None:
+        ka = [self.key(v) for v in a]
+        kb = [self.key(v) for v in b]
+
+        # Common prefix and suffix first, the matcher only sees the middle.
+        lo = 0
+        while lo < len(ka) and lo < len(kb) and ka[lo] == kb[lo]:
+            if not _equal(a[lo], b[lo]):
+                break
+            lo += 1
+
+        if lo == len(ka) == len(kb):
+            return
+
+        hi_a, hi_b = len(ka), len(kb)
+        while hi_a > lo and hi_b > lo and ka[hi_a - 1] == kb[hi_b - 1]:
+            if not _equal(a[hi_a - 1], b[hi_b - 1]):
+                break
+            hi_a -= 1
+            hi_b -= 1
+
+        matcher = difflib.SequenceMatcher(
+            None, ka[lo:hi_a], kb[lo:hi_b], autojunk=False
+        )
+
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            i1, i2, j1, j2 = i1 + lo, i2 + lo, j1 + lo, j2 + lo
+
+            if tag == "equal":
+                # equal hashes, which the elements are unless they collide
+                for i, j in zip(range(i1, i2), range(j1, j2)):
+                    self.pair(a[i], b[j], opath + (i,), npath + (j,))
+                continue
+
+            # Pair old and new elements of the same class, in order; the
+            # pairs are diffed recursively, the rest is deleted / inserted.
+            pairs: LIST[TUPLE[int, int]] = []
+            if tag == "replace":
+                k = j1
+                for i in range(i1, i2):
+                    j = k
+                    while j < j2 and type(b[j]) is not type(a[i]):
+                        j += 1
+                    if j < j2:
+                        pairs.append((i, j))
+                        k = j + 1
+
+            i, j = i1, j1
+            for pi, pj in pairs + [(i2, j2)]:
+                # Within a replaced stretch, leftovers side by side are
+                # reported as nodes replaced by nodes of another class.
+                while tag == "replace" and i < pi and j < pj:
+                    self.pair(a[i], b[j], opath + (i,), npath + (j,))
+                    i, j = i + 1, j + 1
+
+                for i in range(i, pi):
+                    self.delete(a, i, opath)
+                for j in range(j, pj):
+                    self.insert(b, j, opath + (pi,), npath)
+
+                if pi < i2:
+                    self.pair(a[pi], b[pj], opath + (pi,), npath + (pj,))
+
+                i, j = pi + 1, pj + 1
+
+    def delete(self, a: LIST[Any], i: int, opath: Path) -> None:
+        self.ops.append(DiffOp(kind=DELETE, old_path=opath + (i,), old=a[i]))
+
+    def insert(self, b: LIST[Any], j: int, anchor: Path, npath: Path) -> None:
+        self.ops.append(
+            DiffOp(kind=INSERT, old_path=anchor, new_path=npath + (j,), new=b[j])
+        )
+
+    def pair(self, old: Any, new: Any, opath: Path, npath: Path) -> None:
+        if isinstance(old, AST) and isinstance(new, AST):
+            self.node(old, new, opath, npath)
+
+        elif not self.same(old, new):
+            self.ops.append(
+                DiffOp(kind=UPDATE, old_path=opath, new_path=npath, old=old, new=new)
+            )
+
+    def moves(self) -> LIST[DiffOp]:
+        deleted: DICT[Any, LIST[int]] = {}
+        for idx, op in enumerate(self.ops):
+            if op.kind == DELETE and isinstance(op.old, AST):
+                deleted.setdefault(self.key(op.old), []).append(idx)
+
+        if not deleted:
+            return self.ops
+
+        drop = set()
+        ops = list(self.ops)
+
+        for idx, op in enumerate(self.ops):
+            if op.kind != INSERT or not isinstance(op.new, AST):
+                continue
+
+            candidates = deleted.get(self.key(op.new), [])
+            found = next(
+                (
+                    k
+                    for k, c in enumerate(candidates)
+                    if _equal(self.ops[c].old, op.new)
+                ),
+                None,
+            )
+            if found is None:
+                continue
+
+            source = self.ops[candidates.pop(found)]
+            drop.add(id(source))
+            ops[idx] = DiffOp(
+                kind=MOVE,
+                old_path=source.old_path,
+                new_path=op.new_path,
+                old=source.old,
+                new=op.new,
+                anchor=op.old_path,
+            )
+
+        return [op for op in ops if id(op) not in drop]
+
+
+def diff(old: AST, new: AST, detect_moves: bool = True) -> LIST[DiffOp]:
+    """Return the :class:`DiffOp` edits turning *old* into *new*.
+
+    Paths are those of :attr:`Cursor.path`; ``old_path`` refers to *old* and
+    ``new_path`` to *new*.
+
+    >>> from asttrs import Module
+    >>> old = Module.from_source("a = 1\\nb = 2\\nc = 3")
+    >>> new = Module.from_source("c = 3\\na = 1\\nb = 20")
+    >>> for op in diff(old, new):
+    ...     print(op.kind, op.old_path, op.new_path, op.fields)
+    move ('body', 2) ('body', 0) ()
+    update ('body', 1, 'value') ('body', 2, 'value') ('value',)
+    """
+
+    differ = _Differ(old, new)
+    differ.node(old, new, (), ())
+
+    return differ.moves() if detect_moves else differ.ops
@@ -0,0 +1,245 @@
+"""
+Batched edits of immutable trees.
+
+:func:`apply_edits` takes many ``(target, replacement)`` pairs at once and
+applies them in a single bottom-up pass, rebuilding every affected ancestor
+exactly once, where a loop of :meth:`Serializable.evolve` (or
+:meth:`Cursor.replace`) calls would rebuild the path to the root per edit.
+"""
+
+from typing import Any
+from typing import Dict as DICT
+from typing import Iterable
+from typing import List as LIST
+from typing import Mapping, Optional
+from typing import Tuple as TUPLE
+from typing import Union
+
+from ._base import AST
+from ._cursor import Cursor, Path
+
+_KEEP = object()
+
+
+class Insert:
+    """Replacement inserting *nodes* before the list element a path points at.
+
+    The index may be the length of the list, to append.
+    """
+
+    __slots__ = ("nodes",)
+
+    def __init__(self, nodes: Union[AST, LIST[Any]]):
+        self.nodes = list(nodes) if isinstance(nodes, list) else [nodes]
+
+    def __repr__(self):
+        return f"Insert({self.nodes!r})"
+
+
+class _EditNode:
+    __slots__ = ("replacement", "children", "inserts")
+
+    def __init__(self):
+        self.replacement: Any = _KEEP
+        self.children: DICT[str, DICT[Optional[int], "_EditNode"]] = {}
+        self.inserts: DICT[str, DICT[int, LIST[Any]]] = {}
+
+
+def _split(path: Path) -> LIST[TUPLE[str, Optional[int]]]:
+    steps: LIST[TUPLE[str, Optional[int]]] = []
+
+    for step in path:
+        if type(step) is str:
+            steps.append((step, None))
+
+        elif type(step) is int and steps and steps[-1][1] is None:
+            steps[-1] = (steps[-1][0], step)
+
+        else:
+            raise ValueError(f"invalid path step {step!r} in {path!r}")
+
+    return steps
+
+
+def _child(node: _EditNode, field: str, index: Optional[int]) -> _EditNode:
+    try:
+        entries = node.children[field]
+    except KeyError:
+        entries = node.children[field] = {}
+
+    try:
+        return entries[index]
+    except KeyError:
+        sub = entries[index] = _EditNode()
+        return sub
+
+
+def _add(trie: _EditNode, path: Path, replacement: Any) -> None:
+    steps = _split(path)
+    if not steps:
+        raise ValueError(
+            "cannot edit the root through apply_edits, just use the new root"
+        )
+
+    node = trie
+    for field, index in steps[:-1]:
+        node = _child(node, field, index)
+
+    field, index = steps[-1]
+
+    if isinstance(replacement, Insert):
+        if index is None:
+            raise ValueError(f"Insert needs a list index in the path: {path!r}")
+
+        node.inserts.setdefault(field, {}).setdefault(index, []).extend(
+            replacement.nodes
+        )
+        return
+
+    leaf = _child(node, field, index)
+    if leaf.replacement is not _KEEP:
+        raise ValueError(f"conflicting edits at {path!r}")
+
+    leaf.replacement = replacement
+
+
+def _rebuild(node: AST, trie: _EditNode, path: Path) -> AST:
+    changes = {}
+
+    for field in set(trie.children) | set(trie.inserts):
+        entries = trie.children.get(field, {})
+        inserts = trie.inserts.get(field, {})
+        value = getattr(node, field)
+
+        if None in entries:
+            sub = entries[None]
+
+            if sub.replacement is not _KEEP:
+                if len(entries) > 1 or inserts or sub.children or sub.inserts:
+                    raise ValueError(f"conflicting edits below {path + (field,)!r}")
+
+                changes[field] = sub.replacement
+
+            else:
+                changes[field] = _rebuild(value, sub, path + (field,))
+
+            continue
+
+        if not isinstance(value, list):
+            raise TypeError(f"{path + (field,)!r} is not a list field")
+
+        for index in list(entries) + list(inserts):
+            if not 0 <= index <= len(value) or (
+                index == len(value) and index in entries
+            ):
+                raise IndexError(f"{path + (field, index)!r} is out of range")
+
+        values: LIST[Any] = []
+        for idx, el in enumerate(value):
+            if idx in inserts:
+                values.extend(inserts[idx])
+
+            sub = entries.get(idx)
+            if sub is None:
+                values.append(el)
+
+            elif sub.replacement is _KEEP:
+                values.append(_rebuild(el, sub, path + (field, idx)))
+
+            elif sub.children or sub.inserts:
+                raise ValueError(f"conflicting edits below {path + (field, idx)!r}")
+
+            elif sub.replacement is None:
+                continue
+
+            elif isinstance(sub.replacement, list):
+                values.extend(sub.replacement)
+
+            else:
+                values.append(sub.replacement)
+
+        values.extend(inserts.get(len(value), ()))
+
+        changes[field] = values
+
+    return node.evolve(**changes)
+
+
+def _resolve_identities(root: AST, targets: DICT[int, Any]) -> LIST[TUPLE[Path, Any]]:
+    resolved = []
+    pending = dict(targets)
+
+    for cur in Cursor(root).find():
+        if id(cur.node) in pending:
+            resolved.append((cur.path, pending.pop(id(cur.node))))
+            if not pending:
+                break
+
+    if pending:
+        raise LookupError(f"{len(pending)} edit target(s) are not part of the tree")
+
+    return resolved
+
+
+def apply_edits(
+    root: AST,
+    edits: Union[Mapping[Any, Any], Iterable[TUPLE[Any, Any]]],
+) -> AST:
+    """Apply many edits to *root* in one pass and return the new root.
+
+    *edits* holds ``(target, replacement)`` pairs, or is a mapping of them.
+    A target is either a path as given by :attr:`Cursor.path`, a node of the
+    tree (by identity), or the ``id()`` of such a node. A replacement is:
+
+    * a node or any value, which replaces the target,
+    * ``None``, which removes a list element (or clears a field),
+    * a list, which is spliced in place of a list element,
+    * an :class:`Insert`, which inserts before a list element.
+
+    Nodes that are not on the path to an edit are shared with *root*.
+
+    >>> from asttrs import Constant, Module
+    >>> tree = Module.from_source("a = 1\\nb = 2\\nc = 3")
+    >>> new = apply_edits(tree, [
+    ...     (("body", 0, "value"), Constant(value=10)),
+    ...     (tree.body[1], None),
+    ...     (("body", 3), Insert(Module.from_source("d = 4").body)),
+    ... ])
+    >>> new.show()
+    a = 10
+    c = 3
+    d = 4
+    >>> new.body[1] is tree.body[2]
+    True
+    """
+
+    pairs = edits.items() if isinstance(edits, Mapping) else edits
+
+    trie = _EditNode()
+    by_identity: DICT[int, Any] = {}
+
+    for target, replacement in pairs:
+        if isinstance(target, AST):
+            target = id(target)
+
+        if isinstance(target, int):
+            if target in by_identity:
+                raise ValueError("conflicting edits of the same node")
+            by_identity[target] = replacement
+
+        else:
+            _add(trie, tuple(target), replacement)
+
+    if by_identity:
+        if id(root) in by_identity:
+            raise ValueError(
+                "cannot edit the root through apply_edits, just use the new root"
+            )
+
+        for path, replacement in _resolve_identities(root, by_identity):
+            _add(trie, path, replacement)
+
+    if not trie.children and not trie.inserts:
+        return root
+
+    return _rebuild(root, trie, ())
@@ -0,0 +1,294 @@
+"""
+Incremental reparsing of edited module sources.
+
+:func:`reparse` parses only the top-level statements a text edit touches, and
+reuses every other statement node of the previous :class:`Module` by identity.
+The line span of each top-level statement is remembered per module, so a
+chain of edits never needs a full parse again.
+"""
+
+import ast as _ast
+from typing import Any
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+from typing import Union
+
+from ._base import AST, immutable
+from ._cache import IdentityCache
+
+# A statement's lines, 1-based and inclusive, relative to a base line, and for
+# class and function definitions the block of their body statements: whether
+# its first statement starts a line, and the statements' entries relative to
+# the first line of the definition.
+Entry = TUPLE[int, int, Optional[TUPLE[bool, LIST[Any]]]]
+
+_BLOCKS = (_ast.ClassDef, _ast.FunctionDef, _ast.AsyncFunctionDef)
+
+# module -> (its source, entries of its statements)
+_SPANS: IdentityCache[TUPLE[str, LIST[Entry]]] = IdentityCache()
+
+
+@immutable
+class TextEdit:
+    """Replace ``source[start:end]`` with *text*."""
+
+    start: int
+    end: int
+    text: str
+
+    def apply(self, source: str) -> str:
+        return source[: self.start] + self.text + source[self.end :]  # noqa: E203
+
+
+def _first_line(stmt: _ast.stmt) -> int:
+    return min([stmt.lineno] + [d.lineno for d in getattr(stmt, "decorator_list", ())])
+
+
+def _starts_line(stmt: _ast.stmt, lines: LIST[str]) -> bool:
+    decorators = getattr(stmt, "decorator_list", None)
+    first = decorators[0] if decorators else stmt
+    prefix = lines[first.lineno - 1][: first.col_offset].strip()
+
+    return prefix == ("@" if decorators else "")
+
+
+def _entries(
+    body: LIST[_ast.stmt], lines: LIST[str], offset: int, last_line: int
+) -> LIST[Entry]:
+    firsts = [_first_line(stmt) for stmt in body]
+
+    entries: LIST[Entry] = []
+    for idx, stmt in enumerate(body):
+        first, last = firsts[idx], getattr(stmt, "end_lineno", None)
+        if last is None:
+            # Python 3.7: up to the next statement
+            last = max(firsts[idx + 1] - 1 if idx + 1 < len(body) else last_line, first)
+
+        block = None
+        if isinstance(stmt, _BLOCKS):
+            block = (
+                _starts_line(stmt.body[0], lines),
+                _entries(stmt.body, lines, -first, last),
+            )
+
+        entries.append((first + offset, last + offset, block))
+
+    return entries
+
+
+def _full_parse(cls: Any, source: str) -> AST:
+    tree = _ast.parse(source)
+    module = cls.from_ast(tree)
+
+    lines = source.split("\n")
+    _SPANS.set(module, (source, _entries(tree.body, lines, 0, len(lines))))
+
+    return module
+
+
+def _known_entries(module: AST, source: str) -> Optional[LIST[Entry]]:
+    cached = _SPANS.get(module)
+    if cached is not None and (cached[0] is source or cached[0] == source):
+        return cached[1]
+
+    tree = _ast.parse(source)
+    if len(tree.body) != len(module.body):
+        return None
+
+    lines = source.split("\n")
+    entries = _entries(tree.body, lines, 0, len(lines))
+    _SPANS.set(module, (source, entries))
+
+    return entries
+
+
+def _line_offset(source: str, line: int, pos: int, pos_line: int) -> int:
+    """Return the offset where 1-based *line* starts (or ``len(source)``),
+    counting from offset *pos* which lies on line *pos_line*."""
+
+    pos = source.rfind("\n", 0, pos) + 1
+    for _ in range(pos_line - line):
+        pos = source.rfind("\n", 0, pos - 1) + 1
+
+    for _ in range(line - pos_line):
+        pos = source.find("\n", pos)
+        if pos < 0:
+            return len(source)
+        pos += 1
+
+    return pos
+
+
+def _indent(text: str) -> str:
+    return text[: len(text) - len(text.lstrip(" \t\f"))]
+
+
+class _Reparser:
+    def __init__(self, cls: Any, source: str, edit: TextEdit):
+        self.cls = cls
+        self.source = source
+        self.edit = edit
+        self.start_line = source.count("\n", 0, edit.start) + 1
+        self.end_line = self.start_line + source.count("\n", edit.start, edit.end)
+        self.delta = edit.text.count("\n") - (self.end_line - self.start_line)
+
+    def shift(self, entries: LIST[Entry]) -> LIST[Entry]:
+        delta = self.delta
+        return [(a + delta, b + delta, block) for a, b, block in entries]
+
+    def splice(
+        self,
+        nodes: LIST[AST],
+        entries: LIST[Entry],
+        base: int,
+        end: Optional[int],
+        clean: bool = True,
+    ) -> Optional[TUPLE[LIST[AST], LIST[Entry]]]:
+        """Reparse the statements *nodes* the edit touches.
+
+        *entries* are relative to line *base*, *end* is the last line of the
+        enclosing definition (``None`` at module level), and *clean* tells
+        whether the first statement starts its line. Returns ``None`` when
+        the edit cannot be handled at this level.
+        """
+
+        start_line, end_line = self.start_line, self.end_line
+
+        lo = 0
+        while lo < len(entries) and base + entries[lo][1] < start_line:
+            lo += 1
+        hi = lo - 1
+        while hi + 1 < len(entries) and base + entries[hi + 1][0] <= end_line:
+            hi += 1
+
+        # An edit within the body of a single definition is handled there.
+        if lo == hi and entries[lo][2] is not None:
+            first, last, (inner_clean, inner) = entries[lo]
+            if base + first + inner[0][0] <= start_line and end_line <= base + last:
+                found = self.splice(
+                    nodes[lo].body, inner, base + first, base + last, inner_clean
+                )
+                if found is not None:
+                    node = nodes[lo].evolve(body=found[0])
+                    entry = (first, last + self.delta, (inner_clean, found[1]))
+                    return (
+                        nodes[:lo] + [node] + nodes[lo + 1 :],
+                        entries[:lo] + [entry] + self.shift(entries[lo + 1 :]),
+                    )
+
+        # Otherwise the touched statements are reparsed with one neighbour on
+        # each side, since an edit can join or split statements around it.
+        lo, hi = max(lo - 1, 0), min(hi + 1, len(entries) - 1)
+
+        # Never cut between statements sharing a line (``a = 1; b = 2``).
+        while lo > 0 and entries[lo - 1][1] >= entries[lo][0]:
+            lo -= 1
+        while hi + 1 < len(entries) and entries[hi + 1][0] <= entries[hi][1]:
+            hi += 1
+
+        if end is None:
+            first_line = min(base + entries[lo - 1][1] + 1 if lo > 0 else 1, start_line)
+        elif lo > 0:
+            first_line = base + entries[lo - 1][1] + 1
+        elif clean:
+            first_line = base + entries[0][0]
+        else:
+            return None
+
+        if hi + 1 < len(entries):
+            next_line: Optional[int] = base + entries[hi + 1][0]
+        else:
+            next_line = None if end is None else end + 1
+
+        if first_line > start_line or (next_line is not None and end_line >= next_line):
+            return None
+
+        source, edit = self.source, self.edit
+        region_start = _line_offset(source, first_line, edit.start, start_line)
+        region_end = (
+            _line_offset(source, next_line, edit.end, end_line)
+            if next_line is not None
+            else len(source)
+        )
+
+        old = source[region_start:region_end]
+        region = (
+            source[region_start : edit.start]
+            + edit.text
+            + source[edit.end : region_end]
+        )
+
+        if end is None:
+            text, shift = region, first_line - 1
+        elif _indent(region) != _indent(old):
+            # the edit changes the indentation the block is parsed against
+            return None
+        else:
+            text, shift = "if 1:\n" + region, first_line - 2
+
+        try:
+            tree = _ast.parse(text)
+        except SyntaxError:
+            return None
+
+        stmts = tree.body
+        if end is not None:
+            if len(stmts) != 1 or stmts[0].orelse:
+                # a dedent left the enclosing block
+                return None
+            stmts = stmts[0].body
+
+        lines = text.split("\n")
+        return (
+            nodes[:lo] + self.cls.from_ast(stmts) + nodes[hi + 1 :],
+            entries[:lo]
+            + _entries(stmts, lines, shift - base, len(lines))
+            + self.shift(entries[hi + 1 :]),
+        )
+
+
+def reparse(
+    prev: AST, prev_source: str, edit: Union[TextEdit, TUPLE[int, int, str]]
+) -> AST:
+    """Return the module for *prev_source* with *edit* applied.
+
+    *prev* must be the module parsed from *prev_source*. Only the statements
+    around the edited lines are parsed again: the top-level statements the
+    edit touches, or the statements of the innermost class or function body
+    containing it. All other statements are the very same objects as in
+    *prev*. When the edited region does not parse on its own (an unclosed
+    bracket or string spilling over, for instance) the whole source is parsed
+    instead, which raises ``SyntaxError`` as ``from_source`` would.
+
+    >>> from asttrs import Module
+    >>> src = "a = 1\\n\\ndef f():\\n    return a\\n\\nb = 2\\n"
+    >>> mod = Module.from_source(src)
+    >>> new = reparse(mod, src, TextEdit(start=4, end=5, text="10"))
+    >>> new.body[0].value.value, new.body[1] is mod.body[1]
+    (10, False)
+    >>> new.body[2] is mod.body[2]
+    True
+    """
+
+    if not isinstance(edit, TextEdit):
+        edit = TextEdit(start=edit[0], end=edit[1], text=edit[2])
+
+    if not 0 <= edit.start <= edit.end <= len(prev_source):
+        raise ValueError(f"edit out of range: {edit!r}")
+
+    cls = type(prev)
+    source = edit.apply(prev_source)
+
+    entries = _known_entries(prev, prev_source)
+    if not entries:
+        return _full_parse(cls, source)
+
+    found = _Reparser(cls, prev_source, edit).splice(list(prev.body), entries, 0, None)
+    if found is None:
+        return _full_parse(cls, source)
+
+    module = prev.evolve(body=found[0])
+    _SPANS.set(module, (source, found[1]))
+
+    return module
@@ -0,0 +1,131 @@
+"""
+Per-tree index of nodes by class.
+
+asttrs trees are immutable, so an index built once for a tree stays valid for
+its whole lifetime. It is built lazily on the first query, with one walk over
+the tree; after that a query costs proportional to the size of its result.
+"""
+
+import heapq
+import weakref
+from typing import Dict as DICT
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+from typing import Type, Union
+
+from ._base import AST
+from ._cache import IdentityCache
+from ._walk import walk
+
+_INDEXES: IdentityCache["NodeIndex"] = IdentityCache()
+
+
+class NodeIndex:
+    """Nodes of one tree grouped by their exact class, in document order.
+
+    Queries by a base class such as ``stmt`` or ``expr`` merge the lists of
+    all matching concrete classes once, and are then cached as well.
+
+    >>> from asttrs import Module, Name, expr
+    >>> idx = NodeIndex(Module.from_source("x = f(y)"))
+    >>> [n.id for n in idx.of(Name)]
+    ['x', 'f', 'y']
+    >>> [type(n).__name__ for n in idx.of(expr)]
+    ['Name', 'Call', 'Name', 'Name']
+    """
+
+    def __init__(self, tree: AST, weak: bool = False):
+        # ``node_index`` keeps only a weak reference to the root, so that the
+        # cache entry does not keep its own key alive.
+        self._tree = weakref.ref(tree) if weak else (lambda: tree)
+        self._root_cls = type(tree)
+        self._nodes: Optional[DICT[type, LIST[AST]]] = None
+        self._orders: DICT[type, LIST[int]] = {}
+        self._queries: DICT[TUPLE[type, ...], TUPLE[AST, ...]] = {}
+
+    @property
+    def tree(self) -> Optional[AST]:
+        return self._tree()
+
+    def _build(self) -> DICT[type, LIST[AST]]:
+        nodes: DICT[type, LIST[AST]] = {}
+        orders = self._orders
+
+        tree = self._tree()
+        if tree is None:
+            raise ReferenceError("the indexed tree is gone")
+
+        for pos, node in enumerate(walk(tree)):
+            if pos == 0:
+                orders[type(node)] = [0]
+                nodes[type(node)] = []
+                continue
+
+            cls = type(node)
+            try:
+                nodes[cls].append(node)
+                orders[cls].append(pos)
+            except KeyError:
+                nodes[cls] = [node]
+                orders[cls] = [pos]
+
+        self._nodes = nodes
+
+        return nodes
+
+    def _nodes_of(self, cls: type) -> LIST[AST]:
+        nodes = self._nodes[cls]
+        if cls is self._root_cls:
+            return [self._tree()] + nodes
+
+        return nodes
+
+    def classes(self) -> TUPLE[type, ...]:
+        """Return the node classes present in the tree."""
+
+        nodes = self._build() if self._nodes is None else self._nodes
+
+        return tuple(nodes)
+
+    def of(self, *types: Type[AST]) -> TUPLE[AST, ...]:
+        """Return every node that is an instance of *types*, in document order."""
+
+        try:
+            return self._queries[types]
+        except KeyError:
+            pass
+
+        nodes = self._build() if self._nodes is None else self._nodes
+
+        matched = [cls for cls in nodes if issubclass(cls, types)]
+
+        if not matched:
+            result: TUPLE[AST, ...] = ()
+
+        elif len(matched) == 1:
+            result = tuple(self._nodes_of(matched[0]))
+
+        else:
+            merged = heapq.merge(
+                *[zip(self._orders[cls], self._nodes_of(cls)) for cls in matched],
+                key=lambda item: item[0],
+            )
+            result = tuple(node for _, node in merged)
+
+        if self._root_cls not in matched:
+            self._queries[types] = result
+
+        return result
+
+    def count(self, *types: Type[AST]) -> int:
+        return len(self.of(*types))
+
+    def __contains__(self, cls: Union[Type[AST], TUPLE[Type[AST], ...]]) -> bool:
+        return bool(self.of(*(cls if isinstance(cls, tuple) else (cls,))))
+
+
+def node_index(tree: AST) -> NodeIndex:
+    """Return the cached :class:`NodeIndex` of *tree*, creating it on first use."""
+
+    return _INDEXES.get_or_create(tree, lambda t: NodeIndex(t, weak=True))
@@ -0,0 +1,376 @@
+"""
+Minified source output.
+
+:func:`minify` renders a tree with as few characters as the grammar allows:
+one space of indentation, whitespace only where two tokens would otherwise
+merge, simple statements of a block joined with ``;``, and no comments. It
+can drop docstrings, and rename local variables to short names where the
+scope analysis proves nothing else can see them.
+"""
+
+import io
+import itertools
+import keyword
+import string
+import tokenize
+from typing import Any
+from typing import Counter as COUNTER
+from typing import Dict as DICT
+from typing import Iterator
+from typing import List as LIST
+from typing import Optional, Set
+from typing import Tuple as TUPLE
+
+from ._base import AST
+from ._optimize import _DOCSTRING_OWNERS, _STATEMENT_FIELDS, _filled
+from ._scope import (
+    DEF_GLOBAL,
+    DEF_LOCAL,
+    DEF_NONLOCAL,
+    DEF_PARAM,
+    LOCAL,
+    Scope,
+    analyze_scopes,
+)
+from ._visitor import NodeTransformer
+from ._walk import walk
+
+# through these, a function may read its local variables by name
+_INTROSPECTION = frozenset({"locals", "vars", "dir", "eval", "exec"})
+
+_FSTRING_START = getattr(tokenize, "FSTRING_START", None)
+_FSTRING_END = getattr(tokenize, "FSTRING_END", None)
+_SIMPLE, _HEADER, _DECORATOR = "simple", "header", "decorator"
+_SKIPPED = frozenset(
+    {tokenize.COMMENT, tokenize.NL, tokenize.ENCODING, tokenize.ENDMARKER}
+)
+
+
+class _Strip(NodeTransformer):
+    """Remove ``Comment`` nodes and, optionally, docstrings."""
+
+    def __init__(self, docstrings: bool):
+        self.docstrings = docstrings
+
+    def visit_Comment(self, node: AST) -> None:
+        return None
+
+    def generic_visit(self, node: AST) -> AST:
+        # statements are only found in these fields, never within expressions
+        changes = {}
+        for name in _STATEMENT_FIELDS:
+            old = getattr(node, name, None)
+            if type(old) is not list:
+                continue
+
+            block = self._visit_list(old)
+            if (
+                name == "body"
+                and not self.docstrings
+                and type(node).__name__ in _DOCSTRING_OWNERS
+                and block
+                and _is_docstring(block[0])
+            ):
+                block = block[1:]
+
+            if block is not old:
+                changes[name] = block
+
+        return _filled(node.evolve(**changes)) if changes else node
+
+
+def _is_docstring(stmt: AST) -> bool:
+    value = getattr(stmt, "value", None)
+    return (
+        type(stmt).__name__ == "Expr"
+        and type(value).__name__ in ("Constant", "Str")
+        and isinstance(getattr(value, "value", getattr(value, "s", None)), str)
+    )
+
+
+def _short_names() -> Iterator[str]:
+    letters = string.ascii_letters + "_"
+    for size in itertools.count(1):
+        for chars in itertools.product(letters, repeat=size):
+            name = "".join(chars)
+            if not keyword.iskeyword(name):
+                yield name
+
+
+def _outer_parts(node: AST) -> LIST[AST]:
+    """The parts of a scope node evaluated in the enclosing scope."""
+
+    name = type(node).__name__
+    if name in ("FunctionDef", "AsyncFunctionDef", "Lambda"):
+        args = node.args
+        parts = list(args.defaults) + [d for d in args.kw_defaults if d is not None]
+        if name != "Lambda":
+            parts += node.decorator_list
+            parts += [
+                arg.annotation
+                for arg in walk(args)
+                if type(arg).__name__ == "arg" and arg.annotation is not None
+            ]
+            if node.returns is not None:
+                parts.append(node.returns)
+        return parts
+
+    if name in ("ListComp", "SetComp", "DictComp", "GeneratorExp"):
+        return [node.generators[0].iter]
+
+    return []
+
+
+def _renames(scope: Scope) -> DICT[str, str]:
+    """Short names for the locals of a function-like *scope* that only plain
+    assignments in the scope itself bind and read."""
+
+    node = scope.node
+    if node is None or scope.kind not in ("function", "lambda", "comprehension"):
+        return {}
+
+    nested: Set[str] = set()
+    for sub in scope.walk():
+        if sub is not scope:
+            nested.update(sub.symbols)
+
+    if (_INTROSPECTION & set(scope.symbols)) or (_INTROSPECTION & nested):
+        return {}
+
+    outer = {
+        n.id
+        for part in _outer_parts(node)
+        for n in walk(part)
+        if type(n).__name__ == "Name"
+    }
+
+    # names bound otherwise than by a ``Name``: definitions, imports,
+    # ``except ... as``, match captures
+    bound_otherwise = set()
+    for sub in walk(node):
+        cls = type(sub).__name__
+        if cls in ("FunctionDef", "AsyncFunctionDef", "ClassDef") and sub is not node:
+            bound_otherwise.add(sub.name)
+        elif cls in ("Import", "ImportFrom"):
+            bound_otherwise.update(al.asname or al.name for al in sub.names)
+        elif cls in ("ExceptHandler", "MatchAs", "MatchStar") and sub.name:
+            bound_otherwise.add(sub.name)
+        elif cls == "MatchMapping" and sub.rest:
+            bound_otherwise.add(sub.rest)
+
+    renamable = [
+        name
+        for name, sym in scope.symbols.items()
+        if sym.kind == LOCAL
+        and sym.flags & DEF_LOCAL
+        and not sym.flags & (DEF_PARAM | DEF_GLOBAL | DEF_NONLOCAL)
+        and name not in nested
+        and name not in outer
+        and name not in bound_otherwise
+    ]
+    if not renamable:
+        return {}
+
+    taken = set(scope.symbols) | nested | outer
+    candidates = (name for name in _short_names() if name not in taken)
+
+    uses = COUNTER(n.id for n in walk(node) if type(n).__name__ == "Name")
+
+    renames = {}
+    # the most used first, to give them the shortest names
+    for name in sorted(renamable, key=lambda name: (-uses[name], name)):
+        short = next(candidates)
+        if len(short) >= len(name):
+            continue
+        renames[name] = short
+
+    return renames
+
+
+class _Rename(NodeTransformer):
+    def __init__(self, renames: DICT[int, DICT[str, str]]):
+        self.renames = renames
+        self.current: DICT[str, str] = {}
+
+    def visit(self, node: AST) -> Any:
+        renames = self.renames.get(id(node))
+        if not renames:
+            return super().visit(node)
+
+        saved = self.current
+        self.current = {**saved, **renames}
+        try:
+            return super().visit(node)
+        finally:
+            self.current = saved
+
+    def visit_Name(self, node: AST) -> AST:
+        short = self.current.get(node.id)
+        return node if short is None else node.evolve(id=short)
+
+
+def _rename_locals(tree: AST) -> AST:
+    renames = {}
+    for scope in analyze_scopes(tree).walk():
+        found = _renames(scope)
+        if found:
+            renames[id(scope.node)] = found
+
+    return _Rename(renames).visit(tree) if renames else tree
+
+
+def _needs_space(prev: str, prev_type: int, text: str) -> bool:
+    last, first = prev[-1], text[0]
+
+    if prev_type == tokenize.NUMBER and (first.isalnum() or first in "._"):
+        return True
+
+    return (last.isalnum() or last == "_") and (first.isalnum() or first == "_")
+
+
+def _lines(source: str) -> Iterator[TUPLE[int, str, str]]:
+    """Yield ``(indent, text, kind)`` for every logical line of *source*, with
+    the least whitespace between its tokens."""
+
+    source_lines = source.splitlines(keepends=True)
+    offsets = [0] + list(itertools.accumulate(map(len, source_lines)))
+
+    def offset(pos: TUPLE[int, int]) -> int:
+        return offsets[pos[0] - 1] + pos[1]
+
+    depth = 0
+    parts: LIST[str] = []
+    first: Optional[str] = None
+    prev, prev_type = "", tokenize.OP
+    fstring: LIST[Any] = []  # start position and nesting of an f-string
+
+    for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+        kind = tok.type
+
+        # f-strings are tokenized piecewise since 3.12: copied as written
+        if _FSTRING_START is not None and (fstring or kind == _FSTRING_START):
+            if kind == _FSTRING_START:
+                if not fstring:
+                    fstring = [tok.start, 0]
+                fstring[1] += 1
+                continue
+            elif kind == _FSTRING_END:
+                fstring[1] -= 1
+                if not fstring[1]:
+                    kind, text = (
+                        tokenize.STRING,
+                        source[offset(fstring[0]) : offset(tok.end)],
+                    )
+                    fstring = []
+                    tok = tok._replace(string=text)
+                else:
+                    continue
+            else:
+                continue
+
+        if kind in _SKIPPED:
+            continue
+
+        if kind == tokenize.INDENT:
+            depth += 1
+            continue
+
+        if kind == tokenize.DEDENT:
+            depth -= 1
+            continue
+
+        if kind == tokenize.NEWLINE:
+            if parts:
+                if first == "@":
+                    line_kind = _DECORATOR
+                elif prev == ":":
+                    line_kind = _HEADER
+                    if first == "class" and parts[-3:] == ["(", ")", ":"]:
+                        del parts[-3:-1]
+                else:
+                    line_kind = _SIMPLE
+                yield depth, "".join(parts), line_kind
+            parts, first, prev, prev_type = [], None, "", tokenize.OP
+            continue
+
+        text = tok.string
+        if parts and _needs_space(prev, prev_type, text):
+            parts.append(" ")
+        parts.append(text)
+
+        if first is None:
+            first = text
+        prev, prev_type = text, kind
+
+
+def _compact(source: str) -> str:
+    lines: LIST[LIST[Any]] = []  # [indent, text, kind]
+    for depth, text, kind in _lines(source):
+        last = lines[-1] if lines else None
+        if last is not None and kind == last[2] == _SIMPLE and depth == last[0]:
+            last[1] += ";" + text
+        else:
+            lines.append([depth, text, kind])
+
+    out: LIST[str] = []
+    for idx, (depth, text, kind) in enumerate(lines):
+        # a block of simple statements only goes on its header line
+        prev = lines[idx - 1] if idx else None
+        after = lines[idx + 1] if idx + 1 < len(lines) else None
+        if (
+            kind == _SIMPLE
+            and prev is not None
+            and prev[2] == _HEADER
+            and prev[0] == depth - 1
+            and (after is None or after[0] < depth)
+        ):
+            out[-1] += text
+        else:
+            out.append(" " * depth + text)
+
+    return "\n".join(out) + "\n" if out else ""
+
+
+def minify(tree: AST, docstrings: bool = True, rename_locals: bool = False) -> str:
+    """Return the source of *tree* with as few characters as possible.
+
+    ``Comment`` nodes render as nothing, and docstrings too unless
+    *docstrings*. With *rename_locals*, the local variables of functions,
+    lambdas and comprehensions get the shortest names free in their scope,
+    unless a nested scope refers to them, they are bound by a definition, an
+    import or an ``except`` clause, or the function calls ``locals()``,
+    ``eval()`` ... Parameters keep their names.
+
+    >>> from asttrs import Module, Comment
+    >>> tree = Module.from_source(
+    ...     "def total(items, start=0):\\n"
+    ...     "    '''Sum the items.'''\\n"
+    ...     "    result = start\\n"
+    ...     "    for item in items:\\n"
+    ...     "        if item is not None:\\n"
+    ...     "            result = result + item\\n"
+    ...     "    return result\\n"
+    ... )
+    >>> print(minify(tree), end="")
+    def total(items,start=0):
+     \"\"\"Sum the items.\"\"\";result=start
+     for item in items:
+      if item is not None:result=result+item
+     return result
+    >>> print(minify(tree, docstrings=False, rename_locals=True), end="")
+    def total(items,start=0):
+     a=start
+     for b in items:
+      if b is not None:a=a+b
+     return a
+    """
+
+    import ast_decompiler
+
+    tree = _Strip(docstrings).visit(tree)
+    if rename_locals:
+        tree = _rename_locals(tree)
+
+    source = ast_decompiler.decompile(tree.to_ast(), indentation=1, line_length=1 << 30)
+
+    return _compact(source)
@@ -0,0 +1,800 @@
+"""
+Semantics-preserving simplification of asttrs trees.
+
+:func:`optimize` folds operations on constants, drops the branches of ``if``
+statements and expressions that a constant test rules out, and joins
+f-strings of constants. :func:`remove_dead_code` drops unreachable
+statements and, from a module, the imports and private definitions nobody
+reads. Both are :class:`NodeTransformer` passes, so every subtree left as is
+is shared with the original tree.
+"""
+
+import ast as _ast
+import collections
+import operator
+import warnings
+from typing import Any, Callable
+from typing import Counter as COUNTER
+from typing import Dict as DICT
+from typing import FrozenSet, Iterable
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+
+from ._base import AST
+from ._cache import IdentityCache
+from ._scope import DEF_GLOBAL, DEF_IMPORT, DEF_LOCAL, _arguments, _Collector, _resolve
+from ._template import _node_class
+from ._translate import _LEGACY_CONSTANTS
+from ._versions import CURRENT
+from ._visitor import NodeTransformer
+from ._walk import iter_child_nodes, walk
+
+# as in CPython's own AST optimizer, results past these sizes are left for
+# the runtime to compute, so that ``"x" * 10 ** 9`` does not bloat the code
+_MAX_INT_BITS = 128
+_MAX_STR_SIZE = 4096
+_MAX_COLLECTION_SIZE = 256
+
+_CONSTANT_TYPES = (int, float, complex, str, bytes, bool, type(None), type(Ellipsis))
+
+_UNARY: DICT[str, Callable[[Any], Any]] = {
+    "UAdd": operator.pos,
+    "USub": operator.neg,
+    "Invert": operator.invert,
+    "Not": operator.not_,
+}
+
+_BINARY: DICT[str, Callable[[Any, Any], Any]] = {
+    "Add": operator.add,
+    "Sub": operator.sub,
+    "Mult": operator.mul,
+    "Div": operator.truediv,
+    "FloorDiv": operator.floordiv,
+    "Mod": operator.mod,
+    "Pow": operator.pow,
+    "LShift": operator.lshift,
+    "RShift": operator.rshift,
+    "BitOr": operator.or_,
+    "BitXor": operator.xor,
+    "BitAnd": operator.and_,
+}
+
+# ``is`` between literals depends on the interpreter, and warns
+_COMPARE: DICT[str, Callable[[Any, Any], Any]] = {
+    "Eq": operator.eq,
+    "NotEq": operator.ne,
+    "Lt": operator.lt,
+    "LtE": operator.le,
+    "Gt": operator.gt,
+    "GtE": operator.ge,
+    "In": lambda a, b: a in b,
+    "NotIn": lambda a, b: a not in b,
+}
+
+# nodes that change the function they are in wherever they are: a dead
+# ``yield`` still makes a generator
+_SCOPE_NODES = frozenset({"Yield", "YieldFrom", "Global", "Nonlocal"})
+
+# ``FormattedValue.conversion``: none, ``!s``, ``!r``, ``!a``
+_CONVERSIONS: DICT[int, Any] = {-1: None, 115: str, 114: repr, 97: ascii}
+
+_NESTED_SCOPES = frozenset({"FunctionDef", "AsyncFunctionDef", "ClassDef", "Lambda"})
+
+# the nodes whose body may start with a docstring
+_DOCSTRING_OWNERS = frozenset({"Module", "FunctionDef", "AsyncFunctionDef", "ClassDef"})
+
+_NO_VALUE = object()
+
+
+def _imported(alias: AST) -> str:
+    """The name an import alias binds: ``import a.b`` binds ``a``."""
+
+    return alias.asname or alias.name.partition(".")[0]
+
+
+def _is_literal(value: Any) -> bool:
+    if isinstance(value, tuple):
+        return all(_is_literal(el) for el in value)
+
+    return isinstance(value, _CONSTANT_TYPES)
+
+
+def _too_large(op: str, left: Any, right: Any) -> bool:
+    ints = type(left) is int and type(right) is int
+
+    if op == "Pow" and ints and right > 0:
+        return left.bit_length() * right > _MAX_INT_BITS
+
+    if op == "LShift" and ints:
+        return right > _MAX_INT_BITS or left.bit_length() + right > _MAX_INT_BITS
+
+    if op == "Mult":
+        for seq, count in ((left, right), (right, left)):
+            if isinstance(seq, (str, bytes, tuple)) and type(count) is int:
+                limit = _MAX_COLLECTION_SIZE if type(seq) is tuple else _MAX_STR_SIZE
+                return len(seq) * count > limit
+
+    return False
+
+
+def _fits(value: Any) -> bool:
+    if type(value) is int:
+        return value.bit_length() <= _MAX_INT_BITS
+
+    if isinstance(value, (str, bytes)):
+        return len(value) <= _MAX_STR_SIZE
+
+    if isinstance(value, tuple):
+        return len(value) <= _MAX_COLLECTION_SIZE and all(_fits(el) for el in value)
+
+    return True
+
+
+def _written_exactly(value: Any) -> bool:
+    """Whether the source written for *value* reads back as the same value:
+    not so for nan, nor for a complex number losing the sign of a zero part,
+    ``(-0-1j)`` being ``0 - 1j``."""
+
+    if isinstance(value, tuple):
+        return all(_written_exactly(el) for el in value)
+
+    if type(value) is float:
+        return value == value
+
+    if type(value) is complex:
+        try:
+            return repr(_ast.literal_eval(repr(value))) == repr(value)
+        except ValueError:  # nan or inf parts, written as names
+            return False
+
+    return True
+
+
+def _compute(func: Callable[..., Any], *args: Any) -> Any:
+    """Return ``func(*args)``, or ``_NO_VALUE`` if it raises or warns: the
+    error is then left for the runtime to raise."""
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            value = func(*args)
+    except Exception:
+        return _NO_VALUE
+
+    if _is_literal(value) and _fits(value) and _written_exactly(value):
+        return value
+
+    return _NO_VALUE
+
+
+def _bindings(nodes: LIST[AST]) -> TUPLE[COUNTER[str], bool]:
+    """Count the names bound within *nodes* in their own scope, and tell
+    whether they hold a ``yield``, ``global`` or ``nonlocal``.
+
+    Nested functions and classes count as the name they define only.
+    """
+
+    names: COUNTER[str] = collections.Counter()
+    scoped = False
+
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        name = type(node).__name__
+        if name in _SCOPE_NODES:
+            scoped = True
+
+        elif name in _NESTED_SCOPES:
+            if name != "Lambda":
+                names[node.name] += 1
+            continue
+
+        elif name == "Name" and type(node.ctx).__name__ != "Load":
+            names[node.id] += 1
+
+        elif name in ("Import", "ImportFrom"):
+            names.update(_imported(al) for al in node.names)
+
+        elif name in ("ExceptHandler", "MatchAs", "MatchStar") and node.name:
+            names[node.name] += 1
+
+        elif name == "MatchMapping" and node.rest:
+            names[node.rest] += 1
+
+        stack.extend(iter_child_nodes(node))
+
+    return names, scoped
+
+
+def _removable(dead: LIST[AST], live: LIST[AST]) -> bool:
+    """Whether *dead* can be removed from a function, where a name it binds
+    is a local variable even if never assigned: only if *live* binds it too."""
+
+    dead_names, scoped = _bindings(dead)
+    if scoped:
+        return False
+
+    live_names, _ = _bindings(live)
+    return all(name in live_names for name in dead_names)
+
+
+def _constant_classes() -> DICT[type, Optional[str]]:
+    """The classes of the constant nodes the parser makes, and the field of
+    their value: ``Constant``, or ``Num``, ``Str`` ... in 3.7."""
+
+    if CURRENT != "3.7":
+        return {_node_class("Constant"): "value"}
+
+    classes: DICT[type, Optional[str]] = {_node_class("Ellipsis"): None}
+    for name, field in _LEGACY_CONSTANTS.values():
+        classes[_node_class(name)] = field
+
+    return classes
+
+
+def _constant_value(node: Any, classes: DICT[type, Optional[str]]) -> Any:
+    cls = type(node)
+    if cls not in classes:
+        return _NO_VALUE
+
+    field = classes[cls]
+    return ... if field is None else getattr(node, field)
+
+
+def _filled(node: AST) -> AST:
+    """*node*, with a ``pass`` in the blocks a removal left empty: a body, but
+    a module's, and the ``finally`` of a ``try`` left without handlers."""
+
+    name = type(node).__name__
+    if getattr(node, "body", None) == [] and name not in ("Module", "Interactive"):
+        node = node.evolve(body=[_node_class("Pass")()])
+
+    if name in ("Try", "TryStar") and not node.handlers and not node.finalbody:
+        node = node.evolve(finalbody=[_node_class("Pass")()])
+
+    return node
+
+
+class _Optimizer(NodeTransformer):
+    def __init__(self):
+        self.constant = _node_class("Constant")
+        self.constants = _constant_classes()
+        self.unary = _node_class("UnaryOp")
+        self.usub = _node_class("USub")
+        self.pass_ = _node_class("Pass")
+        self.functions = 0
+
+        self.legacy: DICT[type, TUPLE[type, Optional[str]]] = {}
+        if CURRENT == "3.7":
+            self.legacy = {
+                kind: (_node_class(name), field)
+                for kind, (name, field) in _LEGACY_CONSTANTS.items()
+            }
+            self.legacy[type(...)] = (_node_class("Ellipsis"), None)
+
+    def value(self, node: Any) -> Any:
+        """The value of a literal node, ``-1`` included, or ``_NO_VALUE``."""
+
+        value = _constant_value(node, self.constants)
+        if value is not _NO_VALUE or type(node) is not self.unary:
+            return value
+
+        operand = _constant_value(node.operand, self.constants)
+        if type(node.op) is self.usub and type(operand) in (int, float, complex):
+            return -operand
+
+        return _NO_VALUE
+
+    def text(self, node: Any) -> Optional[str]:
+        """The value of a string literal node, else ``None``."""
+
+        value = _constant_value(node, self.constants)
+        return value if type(value) is str else None
+
+    def make(self, value: Any) -> AST:
+        """The node of a constant, as the parser makes it."""
+
+        found = self.legacy.get(type(value))
+        if found is None:
+            return self.constant(value=value)
+
+        cls, field = found
+        return cls() if field is None else cls(**{field: value})
+
+    def literal(self, value: Any) -> AST:
+        # ``ast.unparse`` writes ``(-1) ** 2`` as ``-1 ** 2``: negative
+        # numbers are kept as the parser makes them
+        if type(value) in (int, float) and (
+            value < 0 or (value == 0 and str(value).startswith("-"))
+        ):
+            return self.unary(op=self.usub(), operand=self.make(-value))
+
+        return self.make(value)
+
+    def generic_visit(self, node: AST) -> AST:
+        new = super().generic_visit(node)
+        if new is node:
+            return node
+
+        # a branch removed may leave a block empty
+        new = _filled(new)
+
+        # or splice, or leave first, a string that would turn into a docstring
+        body = getattr(new, "body", None)
+        if (
+            type(new).__name__ in _DOCSTRING_OWNERS
+            and body
+            and body[0] is not node.body[0]
+            and type(body[0]).__name__ == "Expr"
+            and self.text(body[0].value) is not None
+        ):
+            new = new.evolve(body=[self.pass_()] + body)
+
+        return new
+
+    def _visit_function(self, node: AST) -> AST:
+        self.functions += 1
+        try:
+            return self.generic_visit(node)
+        finally:
+            self.functions -= 1
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_Lambda = _visit_function
+
+    def visit_UnaryOp(self, node: AST) -> AST:
+        new = self.generic_visit(node)
+        if self.value(new) is not _NO_VALUE:
+            return new  # a negative number
+
+        operand = self.value(new.operand)
+        func = _UNARY.get(type(new.op).__name__)
+        if operand is _NO_VALUE or func is None:
+            return new
+
+        value = _compute(func, operand)
+        return new if value is _NO_VALUE else self.literal(value)
+
+    def visit_BinOp(self, node: AST) -> AST:
+        new = self.generic_visit(node)
+
+        left, right = self.value(new.left), self.value(new.right)
+        op = type(new.op).__name__
+        func = _BINARY.get(op)
+        if (
+            left is _NO_VALUE
+            or right is _NO_VALUE
+            or func is None
+            or _too_large(op, left, right)
+        ):
+            return new
+
+        value = _compute(func, left, right)
+        return new if value is _NO_VALUE else self.literal(value)
+
+    def visit_BoolOp(self, node: AST) -> AST:
+        new = self.generic_visit(node)
+        is_and = type(new.op).__name__ == "And"
+
+        # leading constants decide the result, or drop out of it
+        values = new.values
+        start = 0
+        while start < len(values):
+            value = self.value(values[start])
+            if value is _NO_VALUE:
+                break
+
+            if start == len(values) - 1 or bool(value) != is_and:
+                return values[start]
+
+            start += 1
+
+        if start == 0:
+            return new
+
+        rest = values[start:]
+        return rest[0] if len(rest) == 1 else new.evolve(values=rest)
+
+    def visit_Compare(self, node: AST) -> AST:
+        new = self.generic_visit(node)
+
+        operands = [self.value(el) for el in [new.left] + new.comparators]
+        funcs = [_COMPARE.get(type(op).__name__) for op in new.ops]
+        if _NO_VALUE in operands or None in funcs:
+            return new
+
+        result = True
+        for func, left, right in zip(funcs, operands, operands[1:]):
+            result = _compute(func, left, right)
+            if result is _NO_VALUE:
+                return new
+            if not result:
+                break
+
+        return self.make(bool(result))
+
+    def visit_IfExp(self, node: AST) -> AST:
+        new = self.generic_visit(node)
+
+        test = self.value(new.test)
+        if test is _NO_VALUE:
+            return new
+
+        live, dead = (new.body, new.orelse) if test else (new.orelse, new.body)
+        if self.functions and not _removable([dead], [live]):
+            return new
+
+        return live
+
+    def visit_If(self, node: AST) -> Any:
+        new = self.generic_visit(node)
+
+        test = self.value(new.test)
+        if test is _NO_VALUE:
+            return new
+
+        live, dead = (new.body, new.orelse) if test else (new.orelse, new.body)
+        if self.functions and not _removable(dead, live):
+            return new
+
+        # spliced into the enclosing block
+        return list(live)
+
+    def visit_Expr(self, node: AST) -> AST:
+        new = self.generic_visit(node)
+
+        # a string left first in a body would turn into a docstring
+        if type(new.value) in self.constants and type(node.value) not in self.constants:
+            return node
+
+        return new
+
+    def _join(self, node: AST) -> AST:
+        """Visit the parts of a ``JoinedStr``, and join adjacent constants."""
+
+        new = self.generic_visit(node)
+
+        parts: LIST[AST] = []
+        joined = False
+        for part in new.values:
+            text = self.text(part)
+            if parts and text is not None and self.text(parts[-1]) is not None:
+                parts[-1] = self.make(self.text(parts[-1]) + text)
+                joined = True
+            else:
+                parts.append(part)
+
+        return new.evolve(values=parts) if joined else new
+
+    def visit_JoinedStr(self, node: AST) -> AST:
+        new = self._join(node)
+
+        if not new.values:
+            return self.make("")
+
+        if len(new.values) == 1 and self.text(new.values[0]) is not None:
+            return new.values[0]
+
+        return new
+
+    def visit_FormattedValue(self, node: AST) -> AST:
+        value = self.visit(node.value)
+        # a format spec stays a ``JoinedStr``
+        spec = node.format_spec and self._join(node.format_spec)
+
+        if value is not node.value or spec is not node.format_spec:
+            node = node.evolve(value=value, format_spec=spec)
+
+        literal = self.value(value)
+        if literal is _NO_VALUE:
+            return node
+
+        text = ""
+        if spec is not None:
+            texts = [self.text(part) for part in spec.values]
+            if None in texts:
+                return node
+            text = "".join(texts)
+
+        if node.conversion not in _CONVERSIONS:
+            return node
+
+        convert = _CONVERSIONS[node.conversion]
+
+        result = _compute(
+            lambda: format(convert(literal) if convert else literal, text)
+        )
+        return node if result is _NO_VALUE else self.make(result)
+
+
+def optimize(tree: AST) -> AST:
+    """Return *tree* simplified, without changing what it does:
+
+    * operations on constants are folded, e.g. ``60 * 60`` into ``3600``,
+      ``not 0`` into ``True``, ``True and x`` into ``x``, ``1 < 2`` into
+      ``True``; those which raise, warn, or would give a large value are kept,
+    * an ``if`` statement or expression with a constant test is replaced by the
+      branch taken, unless the other one, in a function, holds a ``yield``, a
+      ``global`` or ``nonlocal``, or assigns a name the branch taken does not,
+    * f-strings of constants are joined into strings.
+
+    Unchanged subtrees are shared with *tree*.
+
+    >>> from asttrs import Module
+    >>> tree = Module.from_source(
+    ...     "DAY = 24 * 60 * 60\\n"
+    ...     "if not None and DAY > 0:\\n"
+    ...     "    unit = f'{DAY} {\\"s\\" + \\"ec\\":>5}' if 2 ** 3 < 9 else 0\\n"
+    ...     "else:\\n"
+    ...     "    unit = 1 / 0\\n"
+    ...     "if 0:\\n"
+    ...     "    import debug"
+    ... )
+    >>> optimize(tree).show()
+    DAY = 86400
+    if DAY > 0:
+        unit = f'{DAY}   sec'
+    else:
+        unit = 1 / 0
+    """
+
+    return _Optimizer().visit(tree)
+
+
+_TERMINATORS = frozenset({"Return", "Raise", "Continue", "Break"})
+_BLOCKS = ("body", "orelse", "finalbody")
+_STATEMENT_FIELDS = _BLOCKS + ("handlers", "cases")
+
+# through these, a module may read any of its names
+_DYNAMIC = frozenset({"globals", "locals", "vars", "eval", "exec"})
+
+
+class _Unreachable(NodeTransformer):
+    """Drop the statements following a ``return``, ``raise``, ``continue`` or
+    ``break`` in the same block."""
+
+    def __init__(self):
+        # per enclosing function: the node, the names bound in it by the
+        # original code (computed on demand), and those removed since
+        self.functions: LIST[LIST[Any]] = []
+
+    def _visit_function(self, node: AST) -> AST:
+        self.functions.append([node, None, collections.Counter()])
+        try:
+            return self.generic_visit(node)
+        finally:
+            self.functions.pop()
+
+    visit_FunctionDef = visit_AsyncFunctionDef = _visit_function
+
+    def generic_visit(self, node: AST) -> AST:
+        # statements are only found in these fields, never within expressions
+        changes = {}
+        for name in _STATEMENT_FIELDS:
+            old = getattr(node, name, None)
+            if type(old) is not list:
+                continue
+
+            block = self._visit_list(old)
+            if name in _BLOCKS:
+                block = self._truncate(block)
+            if block is not old:
+                changes[name] = block
+
+        return node.evolve(**changes) if changes else node
+
+    def _truncate(self, block: LIST[AST]) -> LIST[AST]:
+        for idx, stmt in enumerate(block[:-1]):
+            if type(stmt).__name__ in _TERMINATORS:
+                break
+        else:
+            return block
+
+        dead = block[idx + 1 :]
+        if self.functions and not self._removable(dead):
+            return block
+
+        return block[: idx + 1]
+
+    def _removable(self, dead: LIST[AST]) -> bool:
+        # a name bound in unreachable code is still a local variable
+        dead_names, scoped = _bindings(dead)
+        if scoped:
+            return False
+
+        frame = self.functions[-1]
+        if frame[1] is None:
+            func = frame[0]
+            frame[1], _ = _bindings(func.body)
+            frame[1].update(arg.arg for arg in _arguments(func.args))
+
+        bound, removed = frame[1], frame[2]
+        if any(bound[n] - removed[n] - count <= 0 for n, count in dead_names.items()):
+            return False
+
+        removed.update(dead_names)
+        return True
+
+
+# top-level statement -> (names it binds, names it reads from the module)
+_STATEMENTS: IdentityCache[TUPLE[FrozenSet[str], FrozenSet[str]]] = IdentityCache()
+
+
+def _statement_names(stmt: AST) -> TUPLE[FrozenSet[str], FrozenSet[str]]:
+    cached = _STATEMENTS.get(stmt)
+    if cached is not None:
+        return cached
+
+    # one statement analyzed as a module: nested scopes come from the cache
+    collector = _Collector("module")
+    collector.visit(stmt)
+    scope = _resolve(collector.summary("top", stmt), frozenset())[0]
+
+    defs = frozenset(
+        name
+        for name, sym in scope.symbols.items()
+        if sym.flags & (DEF_LOCAL | DEF_IMPORT)
+    )
+
+    uses = set()
+    for sub in scope.walk():
+        for name, sym in sub.symbols.items():
+            if sym.flags & DEF_GLOBAL or (
+                # a class body reads a global even when it binds the name
+                sym.is_referenced()
+                and (sub is scope or sub.kind == "class" or sym.is_global())
+            ):
+                uses.add(name)
+
+    if type(stmt).__name__ in ("AugAssign", "Delete"):
+        uses |= defs
+
+    if "__all__" in defs or "__all__" in uses:
+        classes = _constant_classes()
+        for node in walk(stmt):
+            value = _constant_value(node, classes)
+            if isinstance(value, str):
+                uses.add(value)
+
+    return _STATEMENTS.set(stmt, (defs, frozenset(uses)))
+
+
+def _is_private(name: str) -> bool:
+    return name.startswith("_") and not (name.startswith("__") and name.endswith("__"))
+
+
+def _candidate(stmt: AST) -> Optional[str]:
+    """How *stmt* may be removed: ``"import"`` alias by alias, ``"def"`` as a
+    whole, or ``None``."""
+
+    name = type(stmt).__name__
+    if name == "Import":
+        return "import"
+
+    if name == "ImportFrom":
+        if stmt.module == "__future__" or any(al.name == "*" for al in stmt.names):
+            return None
+        return "import"
+
+    if name in _NESTED_SCOPES and name != "Lambda":
+        # decorators and base classes may register the definition somewhere
+        if not _is_private(stmt.name) or stmt.decorator_list:
+            return None
+        if name == "ClassDef" and (stmt.bases or stmt.keywords):
+            return None
+        return "def"
+
+    return None
+
+
+def _unused(body: LIST[AST], keep: FrozenSet[str]) -> LIST[AST]:
+    # every removable unit: (statement, alias or None, name bound, names read)
+    units: LIST[TUPLE[int, Optional[int], str, FrozenSet[str]]] = []
+    roots = set(keep)
+
+    for idx, stmt in enumerate(body):
+        kind = _candidate(stmt)
+        defs, uses = _statement_names(stmt)
+
+        if kind == "import":
+            for pos, alias in enumerate(stmt.names):
+                name = _imported(alias)
+                # ``__all__``, ``__getattr__`` ... are read implicitly
+                if name.startswith("__") and name.endswith("__"):
+                    roots.add(name)
+                units.append((idx, pos, name, frozenset()))
+        elif kind == "def":
+            units.append((idx, None, stmt.name, uses))
+        else:
+            roots |= uses
+
+    by_name: DICT[str, LIST[int]] = collections.defaultdict(list)
+    for unit, (_, _, name, _) in enumerate(units):
+        by_name[name].append(unit)
+
+    live = set()
+    alive = [False] * len(units)
+    todo = list(roots)
+    while todo:
+        name = todo.pop()
+        if name in live:
+            continue
+
+        live.add(name)
+        for unit in by_name.get(name, ()):
+            if not alive[unit]:
+                alive[unit] = True
+                todo.extend(units[unit][3])
+
+    if live & _DYNAMIC:
+        return body
+
+    dead = collections.defaultdict(set)
+    for unit, (idx, pos, _, _) in enumerate(units):
+        if not alive[unit]:
+            dead[idx].add(pos)
+
+    if not dead:
+        return body
+
+    result = []
+    for idx, stmt in enumerate(body):
+        removed = dead.get(idx)
+        if not removed:
+            result.append(stmt)
+        elif None not in removed and len(removed) < len(stmt.names):
+            names = [al for pos, al in enumerate(stmt.names) if pos not in removed]
+            result.append(stmt.evolve(names=names))
+
+    return result
+
+
+def remove_dead_code(tree: AST, keep: Iterable[str] = ()) -> AST:
+    """Return *tree* without the code that never runs or is never used:
+
+    * statements following a ``return``, ``raise``, ``continue`` or ``break``,
+      unless, in a function, they hold a ``yield``, a ``global`` or
+      ``nonlocal``, or assign a name assigned nowhere else,
+
+    and, if *tree* is a ``Module``, at its top level:
+
+    * imported names never read, imports being taken as free of side effects,
+    * private functions and classes (``_name``) never read, unless decorated or,
+      for a class, with base classes.
+
+    A name is read if any code reads it from the module, except the private
+    definitions removed; names listed in ``__all__`` or in *keep* are read. A
+    module calling ``globals()``, ``vars()``, ``eval()`` ... keeps all its
+    names. Unchanged subtrees are shared with *tree*.
+
+    >>> from asttrs import Module
+    >>> tree = Module.from_source(
+    ...     "import os, sys\\n"
+    ...     "from typing import Any, List\\n"
+    ...     "def _helper(x: Any):\\n"
+    ...     "    return _helper(x)\\n"
+    ...     "def _used():\\n"
+    ...     "    return sys.argv\\n"
+    ...     "    print('unreachable')\\n"
+    ...     "def main() -> List[str]:\\n"
+    ...     "    return _used()\\n"
+    ... )
+    >>> remove_dead_code(tree).show()
+    import sys
+    from typing import List
+    <BLANKLINE>
+    def _used():
+        return sys.argv
+    <BLANKLINE>
+    def main() -> List[str]:
+        return _used()
+    """
+
+    new = _Unreachable().visit(tree)
+
+    if type(new).__name__ == "Module":
+        body = _unused(new.body, frozenset(keep))
+        if body is not new.body:
+            new = new.evolve(body=body)
+
+    return new
@@ -0,0 +1,215 @@
+"""
+Compact, JSON-serializable patches between two asttrs trees.
+
+A patch is a list of operations built from :func:`diff`, with every path
+relative to the old tree::
+
+    ["d", path]              delete the node at path
+    ["i", path, node]        insert node before the list element at path
+    ["r", path, value]       replace the value at path
+    ["m", path, anchor]      move the node at path before the element at anchor
+
+Nodes are encoded as ``{"_": "ClassName", field: value, ...}`` with fields at
+their default value left out. :func:`apply_patch` turns the operations into
+one :func:`apply_edits` call, so only the touched paths are rebuilt.
+"""
+
+import base64
+import sys
+from typing import Any
+from typing import Dict as DICT
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+
+import attr
+
+from ._base import AST
+from ._cursor import Cursor
+from ._diff import DELETE, INSERT, MOVE, UPDATE, diff
+from ._edit import Insert, apply_edits
+
+Patch = LIST[LIST[Any]]
+
+_DEFAULTS: DICT[type, TUPLE[TUPLE[str, Any], ...]] = {}
+
+
+def _defaults(cls: type) -> TUPLE[TUPLE[str, Any], ...]:
+    try:
+        return _DEFAULTS[cls]
+    except KeyError:
+        pass
+
+    result = []
+    for fd in attr.fields(cls):
+        default = fd.default
+        if isinstance(default, attr.Factory):
+            default = default.factory()
+        result.append((fd.name, default))
+
+    spec = _DEFAULTS[cls] = tuple(result)
+
+    return spec
+
+
+def encode(value: Any) -> Any:
+    """Encode a node or field value into JSON-compatible data."""
+
+    if isinstance(value, AST):
+        data: DICT[str, Any] = {"_": type(value).__name__}
+        for name, default in _defaults(type(value)):
+            field = getattr(value, name)
+            if field is default or (field == default and type(field) is type(default)):
+                continue
+            data[name] = encode(field)
+        return data
+
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+
+    if isinstance(value, complex):
+        return {"$complex": [value.real, value.imag]}
+
+    if value is Ellipsis:
+        return {"$ellipsis": None}
+
+    if isinstance(value, tuple):
+        return {"$tuple": [encode(v) for v in value]}
+
+    if isinstance(value, frozenset):
+        return {"$frozenset": [encode(v) for v in value]}
+
+    raise TypeError(f"cannot encode {value!r}")
+
+
+def _lookup(name: str, namespace: Optional[Any]) -> type:
+    import asttrs
+
+    for source in (namespace, asttrs):
+        cls = getattr(source, name, None)
+        if isinstance(cls, type) and issubclass(cls, AST):
+            return cls
+
+    raise TypeError(f"unknown node class: {name!r}")
+
+
+def decode(data: Any, namespace: Optional[Any] = None) -> Any:
+    """Decode data produced by :func:`encode`.
+
+    Node classes are looked up in *namespace* (a module) first, then in
+    ``asttrs``.
+    """
+
+    if isinstance(data, list):
+        return [decode(v, namespace) for v in data]
+
+    if not isinstance(data, dict):
+        return data
+
+    if "_" in data:
+        cls = _lookup(data["_"], namespace)
+        return cls(**{k: decode(v, namespace) for k, v in data.items() if k != "_"})
+
+    ((tag, value),) = data.items()
+
+    if tag == "$bytes":
+        return base64.b64decode(value)
+
+    if tag == "$complex":
+        return complex(*value)
+
+    if tag == "$ellipsis":
+        return Ellipsis
+
+    if tag == "$tuple":
+        return tuple(decode(v, namespace) for v in value)
+
+    if tag == "$frozenset":
+        return frozenset(decode(v, namespace) for v in value)
+
+    raise TypeError(f"cannot decode {data!r}")
+
+
+def make_patch(old: AST, new: AST) -> Patch:
+    """Return the patch turning *old* into *new*.
+
+    >>> import json
+    >>> from asttrs import Module
+    >>> old = Module.from_source("a = 1\\nb = 2")
+    >>> new = Module.from_source("a = 1\\nb = 3\\nc = b")
+    >>> patch = make_patch(old, new)
+    >>> patch[0]
+    ['r', ['body', 1, 'value', 'value'], 3]
+    >>> patch[1][:2], patch[1][2]["_"]
+    (['i', ['body', 2]], 'Assign')
+    >>> apply_patch(old, json.loads(json.dumps(patch))) == new
+    True
+    """
+
+    ops: Patch = []
+
+    for op in diff(old, new):
+        if op.kind == DELETE:
+            ops.append(["d", list(op.old_path)])
+
+        elif op.kind == INSERT:
+            ops.append(["i", list(op.old_path), encode(op.new)])
+
+        elif op.kind == MOVE:
+            ops.append(["m", list(op.old_path), list(op.anchor)])
+
+        elif op.kind == UPDATE and op.fields:
+            for name in op.fields:
+                ops.append(
+                    ["r", list(op.old_path) + [name], encode(getattr(op.new, name))]
+                )
+
+        elif op.kind == UPDATE:
+            ops.append(["r", list(op.old_path), encode(op.new)])
+
+        else:
+            raise ValueError(op)
+
+    return ops
+
+
+def apply_patch(tree: AST, patch: Patch) -> AST:
+    """Apply a patch made by :func:`make_patch` to *tree* and return the result.
+
+    Untouched subtrees of *tree* are shared with the result.
+    """
+
+    namespace = sys.modules.get(type(tree).__module__)
+    edits: LIST[TUPLE[TUPLE[Any, ...], Any]] = []
+
+    for op in patch:
+        code, path = op[0], tuple(op[1])
+
+        if code == "d":
+            edits.append((path, None))
+
+        elif code == "i":
+            edits.append((path, Insert(decode(op[2], namespace))))
+
+        elif code == "r":
+            value = decode(op[2], namespace)
+            if value is None and isinstance(path[-1], int):
+                # a None list element, not a deletion
+                value = [None]
+            edits.append((path, value))
+
+        elif code == "m":
+            node = Cursor.at(tree, path).node
+            edits.append((path, None))
+            edits.append((tuple(op[2]), Insert(node)))
+
+        else:
+            raise ValueError(f"unknown patch operation: {op!r}")
+
+    return apply_edits(tree, edits)
@@ -0,0 +1,2657 @@
+# NOTE: This module is auto-generated from 'asttrs._py3_7' by 'invoke aot':
+#       the same classes, with the methods attrs generates for them written out.
+#       Their docstrings are kept in the JSON file next to this module.
+
+from typing import Any
+from typing import List as LIST
+from typing import Optional
+
+import attr
+
+from asttrs import _aot
+from asttrs._base import AST, immutable
+
+string = identifier = str
+constant = Any
+singleton = Optional[bool]
+
+_NOTHING = _aot.NOTHING
+_setattr = object.__setattr__
+
+_DOCS = _aot.DocFile(__file__)
+
+
+class mod(AST):
+    _fields = ()
+
+
+class Module(mod):
+    __slots__ = ("body",)
+    _fields = ("body",)
+
+    body: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(body=_aot.FACTORY_LIST)
+
+    def __init__(self, *, body=_NOTHING):
+        _setattr(self, "body", list() if body is _NOTHING else body)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(body={self.body!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.body,) == (other.body,)
+
+    def __hash__(self):
+        return hash(("Module", self.body))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Interactive(mod):
+    __slots__ = ("body",)
+    _fields = ("body",)
+
+    body: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(body=_aot.FACTORY_LIST)
+
+    def __init__(self, *, body=_NOTHING):
+        _setattr(self, "body", list() if body is _NOTHING else body)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(body={self.body!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.body,) == (other.body,)
+
+    def __hash__(self):
+        return hash(("Interactive", self.body))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Expression(mod):
+    __slots__ = ("body",)
+    _fields = ("body",)
+
+    body: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(body=_aot.NOTHING)
+
+    def __init__(self, *, body):
+        _setattr(self, "body", body)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(body={self.body!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.body,) == (other.body,)
+
+    def __hash__(self):
+        return hash(("Expression", self.body))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Suite(mod):
+    __slots__ = ("body",)
+    _fields = ("body",)
+
+    body: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(body=_aot.FACTORY_LIST)
+
+    def __init__(self, *, body=_NOTHING):
+        _setattr(self, "body", list() if body is _NOTHING else body)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(body={self.body!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.body,) == (other.body,)
+
+    def __hash__(self):
+        return hash(("Suite", self.body))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class stmt(AST):
+    _fields = ()
+
+
+class FunctionDef(stmt):
+    __slots__ = ("name", "args", "body", "decorator_list", "returns")
+    _fields = ("name", "args", "body", "decorator_list", "returns")
+
+    name: "identifier"
+    args: "arguments"
+    body: LIST["stmt"]
+    decorator_list: LIST["expr"]
+    returns: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        name=_aot.NOTHING,
+        args=_aot.NOTHING,
+        body=_aot.FACTORY_LIST,
+        decorator_list=_aot.FACTORY_LIST,
+        returns=None,
+    )
+
+    def __init__(
+        self, *, name, args, body=_NOTHING, decorator_list=_NOTHING, returns=None
+    ):
+        _setattr(self, "name", name)
+        _setattr(self, "args", args)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+        _setattr(
+            self,
+            "decorator_list",
+            list() if decorator_list is _NOTHING else decorator_list,
+        )
+        _setattr(self, "returns", returns)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(name={self.name!r}, args={self.args!r}, body={self.body!r}, decorator_list={self.decorator_list!r}, returns={self.returns!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.name, self.args, self.body, self.decorator_list, self.returns) == (
+            other.name,
+            other.args,
+            other.body,
+            other.decorator_list,
+            other.returns,
+        )
+
+    def __hash__(self):
+        return hash(
+            (
+                "FunctionDef",
+                self.name,
+                self.args,
+                self.body,
+                self.decorator_list,
+                self.returns,
+            )
+        )
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class AsyncFunctionDef(stmt):
+    __slots__ = ("name", "args", "body", "decorator_list", "returns")
+    _fields = ("name", "args", "body", "decorator_list", "returns")
+
+    name: "identifier"
+    args: "arguments"
+    body: LIST["stmt"]
+    decorator_list: LIST["expr"]
+    returns: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        name=_aot.NOTHING,
+        args=_aot.NOTHING,
+        body=_aot.FACTORY_LIST,
+        decorator_list=_aot.FACTORY_LIST,
+        returns=None,
+    )
+
+    def __init__(
+        self, *, name, args, body=_NOTHING, decorator_list=_NOTHING, returns=None
+    ):
+        _setattr(self, "name", name)
+        _setattr(self, "args", args)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+        _setattr(
+            self,
+            "decorator_list",
+            list() if decorator_list is _NOTHING else decorator_list,
+        )
+        _setattr(self, "returns", returns)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(name={self.name!r}, args={self.args!r}, body={self.body!r}, decorator_list={self.decorator_list!r}, returns={self.returns!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.name, self.args, self.body, self.decorator_list, self.returns) == (
+            other.name,
+            other.args,
+            other.body,
+            other.decorator_list,
+            other.returns,
+        )
+
+    def __hash__(self):
+        return hash(
+            (
+                "AsyncFunctionDef",
+                self.name,
+                self.args,
+                self.body,
+                self.decorator_list,
+                self.returns,
+            )
+        )
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class ClassDef(stmt):
+    __slots__ = ("name", "bases", "keywords", "body", "decorator_list")
+    _fields = ("name", "bases", "keywords", "body", "decorator_list")
+
+    name: "identifier"
+    bases: LIST["expr"]
+    keywords: LIST["keyword"]
+    body: LIST["stmt"]
+    decorator_list: LIST["expr"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        name=_aot.NOTHING,
+        bases=_aot.FACTORY_LIST,
+        keywords=_aot.FACTORY_LIST,
+        body=_aot.FACTORY_LIST,
+        decorator_list=_aot.FACTORY_LIST,
+    )
+
+    def __init__(
+        self,
+        *,
+        name,
+        bases=_NOTHING,
+        keywords=_NOTHING,
+        body=_NOTHING,
+        decorator_list=_NOTHING,
+    ):
+        _setattr(self, "name", name)
+        _setattr(self, "bases", list() if bases is _NOTHING else bases)
+        _setattr(self, "keywords", list() if keywords is _NOTHING else keywords)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+        _setattr(
+            self,
+            "decorator_list",
+            list() if decorator_list is _NOTHING else decorator_list,
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(name={self.name!r}, bases={self.bases!r}, keywords={self.keywords!r}, body={self.body!r}, decorator_list={self.decorator_list!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.name,
+            self.bases,
+            self.keywords,
+            self.body,
+            self.decorator_list,
+        ) == (other.name, other.bases, other.keywords, other.body, other.decorator_list)
+
+    def __hash__(self):
+        return hash(
+            (
+                "ClassDef",
+                self.name,
+                self.bases,
+                self.keywords,
+                self.body,
+                self.decorator_list,
+            )
+        )
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Return(stmt):
+    __slots__ = ("value",)
+    _fields = ("value",)
+
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(value=None)
+
+    def __init__(self, *, value=None):
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __hash__(self):
+        return hash(("Return", self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Delete(stmt):
+    __slots__ = ("targets",)
+    _fields = ("targets",)
+
+    targets: LIST["expr"]
+
+    __attrs_attrs__ = _aot.LazyFields(targets=_aot.FACTORY_LIST)
+
+    def __init__(self, *, targets=_NOTHING):
+        _setattr(self, "targets", list() if targets is _NOTHING else targets)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(targets={self.targets!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.targets,) == (other.targets,)
+
+    def __hash__(self):
+        return hash(("Delete", self.targets))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Assign(stmt):
+    __slots__ = ("targets", "value")
+    _fields = ("targets", "value")
+
+    targets: LIST["expr"]
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(targets=_aot.FACTORY_LIST, value=_aot.NOTHING)
+
+    def __init__(self, *, targets=_NOTHING, value):
+        _setattr(self, "targets", list() if targets is _NOTHING else targets)
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(targets={self.targets!r}, value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.targets, self.value) == (other.targets, other.value)
+
+    def __hash__(self):
+        return hash(("Assign", self.targets, self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class AugAssign(stmt):
+    __slots__ = ("target", "op", "value")
+    _fields = ("target", "op", "value")
+
+    target: "expr"
+    op: "operator"
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        target=_aot.NOTHING, op=_aot.NOTHING, value=_aot.NOTHING
+    )
+
+    def __init__(self, *, target, op, value):
+        _setattr(self, "target", target)
+        _setattr(self, "op", op)
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(target={self.target!r}, op={self.op!r}, value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.target, self.op, self.value) == (
+            other.target,
+            other.op,
+            other.value,
+        )
+
+    def __hash__(self):
+        return hash(("AugAssign", self.target, self.op, self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class AnnAssign(stmt):
+    __slots__ = ("target", "annotation", "value", "simple")
+    _fields = ("target", "annotation", "value", "simple")
+
+    target: "expr"
+    annotation: "expr"
+    value: "expr"
+    simple: "int"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        target=_aot.NOTHING, annotation=_aot.NOTHING, value=None, simple=_aot.NOTHING
+    )
+
+    def __init__(self, *, target, annotation, value=None, simple):
+        _setattr(self, "target", target)
+        _setattr(self, "annotation", annotation)
+        _setattr(self, "value", value)
+        _setattr(self, "simple", simple)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(target={self.target!r}, annotation={self.annotation!r}, value={self.value!r}, simple={self.simple!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.target, self.annotation, self.value, self.simple) == (
+            other.target,
+            other.annotation,
+            other.value,
+            other.simple,
+        )
+
+    def __hash__(self):
+        return hash(
+            ("AnnAssign", self.target, self.annotation, self.value, self.simple)
+        )
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class For(stmt):
+    __slots__ = ("target", "iter", "body", "orelse")
+    _fields = ("target", "iter", "body", "orelse")
+
+    target: "expr"
+    iter: "expr"
+    body: LIST["stmt"]
+    orelse: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        target=_aot.NOTHING,
+        iter=_aot.NOTHING,
+        body=_aot.FACTORY_LIST,
+        orelse=_aot.FACTORY_LIST,
+    )
+
+    def __init__(self, *, target, iter, body=_NOTHING, orelse=_NOTHING):
+        _setattr(self, "target", target)
+        _setattr(self, "iter", iter)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+        _setattr(self, "orelse", list() if orelse is _NOTHING else orelse)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(target={self.target!r}, iter={self.iter!r}, body={self.body!r}, orelse={self.orelse!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.target, self.iter, self.body, self.orelse) == (
+            other.target,
+            other.iter,
+            other.body,
+            other.orelse,
+        )
+
+    def __hash__(self):
+        return hash(("For", self.target, self.iter, self.body, self.orelse))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class AsyncFor(stmt):
+    __slots__ = ("target", "iter", "body", "orelse")
+    _fields = ("target", "iter", "body", "orelse")
+
+    target: "expr"
+    iter: "expr"
+    body: LIST["stmt"]
+    orelse: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        target=_aot.NOTHING,
+        iter=_aot.NOTHING,
+        body=_aot.FACTORY_LIST,
+        orelse=_aot.FACTORY_LIST,
+    )
+
+    def __init__(self, *, target, iter, body=_NOTHING, orelse=_NOTHING):
+        _setattr(self, "target", target)
+        _setattr(self, "iter", iter)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+        _setattr(self, "orelse", list() if orelse is _NOTHING else orelse)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(target={self.target!r}, iter={self.iter!r}, body={self.body!r}, orelse={self.orelse!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.target, self.iter, self.body, self.orelse) == (
+            other.target,
+            other.iter,
+            other.body,
+            other.orelse,
+        )
+
+    def __hash__(self):
+        return hash(("AsyncFor", self.target, self.iter, self.body, self.orelse))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class While(stmt):
+    __slots__ = ("test", "body", "orelse")
+    _fields = ("test", "body", "orelse")
+
+    test: "expr"
+    body: LIST["stmt"]
+    orelse: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        test=_aot.NOTHING, body=_aot.FACTORY_LIST, orelse=_aot.FACTORY_LIST
+    )
+
+    def __init__(self, *, test, body=_NOTHING, orelse=_NOTHING):
+        _setattr(self, "test", test)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+        _setattr(self, "orelse", list() if orelse is _NOTHING else orelse)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(test={self.test!r}, body={self.body!r}, orelse={self.orelse!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.test, self.body, self.orelse) == (
+            other.test,
+            other.body,
+            other.orelse,
+        )
+
+    def __hash__(self):
+        return hash(("While", self.test, self.body, self.orelse))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class If(stmt):
+    __slots__ = ("test", "body", "orelse")
+    _fields = ("test", "body", "orelse")
+
+    test: "expr"
+    body: LIST["stmt"]
+    orelse: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        test=_aot.NOTHING, body=_aot.FACTORY_LIST, orelse=_aot.FACTORY_LIST
+    )
+
+    def __init__(self, *, test, body=_NOTHING, orelse=_NOTHING):
+        _setattr(self, "test", test)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+        _setattr(self, "orelse", list() if orelse is _NOTHING else orelse)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(test={self.test!r}, body={self.body!r}, orelse={self.orelse!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.test, self.body, self.orelse) == (
+            other.test,
+            other.body,
+            other.orelse,
+        )
+
+    def __hash__(self):
+        return hash(("If", self.test, self.body, self.orelse))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class With(stmt):
+    __slots__ = ("items", "body")
+    _fields = ("items", "body")
+
+    items: LIST["withitem"]
+    body: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(items=_aot.FACTORY_LIST, body=_aot.FACTORY_LIST)
+
+    def __init__(self, *, items=_NOTHING, body=_NOTHING):
+        _setattr(self, "items", list() if items is _NOTHING else items)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(items={self.items!r}, body={self.body!r})"
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.items, self.body) == (other.items, other.body)
+
+    def __hash__(self):
+        return hash(("With", self.items, self.body))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class AsyncWith(stmt):
+    __slots__ = ("items", "body")
+    _fields = ("items", "body")
+
+    items: LIST["withitem"]
+    body: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(items=_aot.FACTORY_LIST, body=_aot.FACTORY_LIST)
+
+    def __init__(self, *, items=_NOTHING, body=_NOTHING):
+        _setattr(self, "items", list() if items is _NOTHING else items)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(items={self.items!r}, body={self.body!r})"
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.items, self.body) == (other.items, other.body)
+
+    def __hash__(self):
+        return hash(("AsyncWith", self.items, self.body))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Raise(stmt):
+    __slots__ = ("exc", "cause")
+    _fields = ("exc", "cause")
+
+    exc: "expr"
+    cause: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(exc=None, cause=None)
+
+    def __init__(self, *, exc=None, cause=None):
+        _setattr(self, "exc", exc)
+        _setattr(self, "cause", cause)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(exc={self.exc!r}, cause={self.cause!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.exc, self.cause) == (other.exc, other.cause)
+
+    def __hash__(self):
+        return hash(("Raise", self.exc, self.cause))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Try(stmt):
+    __slots__ = ("body", "handlers", "orelse", "finalbody")
+    _fields = ("body", "handlers", "orelse", "finalbody")
+
+    body: LIST["stmt"]
+    handlers: LIST["excepthandler"]
+    orelse: LIST["stmt"]
+    finalbody: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        body=_aot.FACTORY_LIST,
+        handlers=_aot.FACTORY_LIST,
+        orelse=_aot.FACTORY_LIST,
+        finalbody=_aot.FACTORY_LIST,
+    )
+
+    def __init__(
+        self, *, body=_NOTHING, handlers=_NOTHING, orelse=_NOTHING, finalbody=_NOTHING
+    ):
+        _setattr(self, "body", list() if body is _NOTHING else body)
+        _setattr(self, "handlers", list() if handlers is _NOTHING else handlers)
+        _setattr(self, "orelse", list() if orelse is _NOTHING else orelse)
+        _setattr(self, "finalbody", list() if finalbody is _NOTHING else finalbody)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(body={self.body!r}, handlers={self.handlers!r}, orelse={self.orelse!r}, finalbody={self.finalbody!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.body, self.handlers, self.orelse, self.finalbody) == (
+            other.body,
+            other.handlers,
+            other.orelse,
+            other.finalbody,
+        )
+
+    def __hash__(self):
+        return hash(("Try", self.body, self.handlers, self.orelse, self.finalbody))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Assert(stmt):
+    __slots__ = ("test", "msg")
+    _fields = ("test", "msg")
+
+    test: "expr"
+    msg: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(test=_aot.NOTHING, msg=None)
+
+    def __init__(self, *, test, msg=None):
+        _setattr(self, "test", test)
+        _setattr(self, "msg", msg)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(test={self.test!r}, msg={self.msg!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.test, self.msg) == (other.test, other.msg)
+
+    def __hash__(self):
+        return hash(("Assert", self.test, self.msg))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Import(stmt):
+    __slots__ = ("names",)
+    _fields = ("names",)
+
+    names: LIST["alias"]
+
+    __attrs_attrs__ = _aot.LazyFields(names=_aot.FACTORY_LIST)
+
+    def __init__(self, *, names=_NOTHING):
+        _setattr(self, "names", list() if names is _NOTHING else names)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(names={self.names!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.names,) == (other.names,)
+
+    def __hash__(self):
+        return hash(("Import", self.names))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class ImportFrom(stmt):
+    __slots__ = ("module", "names", "level")
+    _fields = ("module", "names", "level")
+
+    module: "identifier"
+    names: LIST["alias"]
+    level: "int"
+
+    __attrs_attrs__ = _aot.LazyFields(module=None, names=_aot.FACTORY_LIST, level=0)
+
+    def __init__(self, *, module=None, names=_NOTHING, level=0):
+        _setattr(self, "module", module)
+        _setattr(self, "names", list() if names is _NOTHING else names)
+        _setattr(self, "level", level)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(module={self.module!r}, names={self.names!r}, level={self.level!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.module, self.names, self.level) == (
+            other.module,
+            other.names,
+            other.level,
+        )
+
+    def __hash__(self):
+        return hash(("ImportFrom", self.module, self.names, self.level))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Global(stmt):
+    __slots__ = ("names",)
+    _fields = ("names",)
+
+    names: LIST["identifier"]
+
+    __attrs_attrs__ = _aot.LazyFields(names=_aot.FACTORY_LIST)
+
+    def __init__(self, *, names=_NOTHING):
+        _setattr(self, "names", list() if names is _NOTHING else names)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(names={self.names!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.names,) == (other.names,)
+
+    def __hash__(self):
+        return hash(("Global", self.names))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Nonlocal(stmt):
+    __slots__ = ("names",)
+    _fields = ("names",)
+
+    names: LIST["identifier"]
+
+    __attrs_attrs__ = _aot.LazyFields(names=_aot.FACTORY_LIST)
+
+    def __init__(self, *, names=_NOTHING):
+        _setattr(self, "names", list() if names is _NOTHING else names)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(names={self.names!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.names,) == (other.names,)
+
+    def __hash__(self):
+        return hash(("Nonlocal", self.names))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Expr(stmt):
+    __slots__ = ("value",)
+    _fields = ("value",)
+
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(value=_aot.NOTHING)
+
+    def __init__(self, *, value):
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __hash__(self):
+        return hash(("Expr", self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Pass(stmt):
+    _fields = ()
+
+
+class Break(stmt):
+    _fields = ()
+
+
+class Continue(stmt):
+    _fields = ()
+
+
+class expr(AST):
+    _fields = ()
+
+
+class BoolOp(expr):
+    __slots__ = ("op", "values")
+    _fields = ("op", "values")
+
+    op: "boolop"
+    values: LIST["expr"]
+
+    __attrs_attrs__ = _aot.LazyFields(op=_aot.NOTHING, values=_aot.FACTORY_LIST)
+
+    def __init__(self, *, op, values=_NOTHING):
+        _setattr(self, "op", op)
+        _setattr(self, "values", list() if values is _NOTHING else values)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(op={self.op!r}, values={self.values!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.op, self.values) == (other.op, other.values)
+
+    def __hash__(self):
+        return hash(("BoolOp", self.op, self.values))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class BinOp(expr):
+    __slots__ = ("left", "op", "right")
+    _fields = ("left", "op", "right")
+
+    left: "expr"
+    op: "operator"
+    right: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        left=_aot.NOTHING, op=_aot.NOTHING, right=_aot.NOTHING
+    )
+
+    def __init__(self, *, left, op, right):
+        _setattr(self, "left", left)
+        _setattr(self, "op", op)
+        _setattr(self, "right", right)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(left={self.left!r}, op={self.op!r}, right={self.right!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.left, self.op, self.right) == (other.left, other.op, other.right)
+
+    def __hash__(self):
+        return hash(("BinOp", self.left, self.op, self.right))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class UnaryOp(expr):
+    __slots__ = ("op", "operand")
+    _fields = ("op", "operand")
+
+    op: "unaryop"
+    operand: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(op=_aot.NOTHING, operand=_aot.NOTHING)
+
+    def __init__(self, *, op, operand):
+        _setattr(self, "op", op)
+        _setattr(self, "operand", operand)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(op={self.op!r}, operand={self.operand!r})"
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.op, self.operand) == (other.op, other.operand)
+
+    def __hash__(self):
+        return hash(("UnaryOp", self.op, self.operand))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Lambda(expr):
+    __slots__ = ("args", "body")
+    _fields = ("args", "body")
+
+    args: "arguments"
+    body: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(args=_aot.NOTHING, body=_aot.NOTHING)
+
+    def __init__(self, *, args, body):
+        _setattr(self, "args", args)
+        _setattr(self, "body", body)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(args={self.args!r}, body={self.body!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.args, self.body) == (other.args, other.body)
+
+    def __hash__(self):
+        return hash(("Lambda", self.args, self.body))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class IfExp(expr):
+    __slots__ = ("test", "body", "orelse")
+    _fields = ("test", "body", "orelse")
+
+    test: "expr"
+    body: "expr"
+    orelse: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        test=_aot.NOTHING, body=_aot.NOTHING, orelse=_aot.NOTHING
+    )
+
+    def __init__(self, *, test, body, orelse):
+        _setattr(self, "test", test)
+        _setattr(self, "body", body)
+        _setattr(self, "orelse", orelse)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(test={self.test!r}, body={self.body!r}, orelse={self.orelse!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.test, self.body, self.orelse) == (
+            other.test,
+            other.body,
+            other.orelse,
+        )
+
+    def __hash__(self):
+        return hash(("IfExp", self.test, self.body, self.orelse))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Dict(expr):
+    __slots__ = ("keys", "values")
+    _fields = ("keys", "values")
+
+    keys: LIST["expr"]
+    values: LIST["expr"]
+
+    __attrs_attrs__ = _aot.LazyFields(keys=_aot.FACTORY_LIST, values=_aot.FACTORY_LIST)
+
+    def __init__(self, *, keys=_NOTHING, values=_NOTHING):
+        _setattr(self, "keys", list() if keys is _NOTHING else keys)
+        _setattr(self, "values", list() if values is _NOTHING else values)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(keys={self.keys!r}, values={self.values!r})"
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.keys, self.values) == (other.keys, other.values)
+
+    def __hash__(self):
+        return hash(("Dict", self.keys, self.values))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Set(expr):
+    __slots__ = ("elts",)
+    _fields = ("elts",)
+
+    elts: LIST["expr"]
+
+    __attrs_attrs__ = _aot.LazyFields(elts=_aot.FACTORY_LIST)
+
+    def __init__(self, *, elts=_NOTHING):
+        _setattr(self, "elts", list() if elts is _NOTHING else elts)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(elts={self.elts!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.elts,) == (other.elts,)
+
+    def __hash__(self):
+        return hash(("Set", self.elts))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class ListComp(expr):
+    __slots__ = ("elt", "generators")
+    _fields = ("elt", "generators")
+
+    elt: "expr"
+    generators: LIST["comprehension"]
+
+    __attrs_attrs__ = _aot.LazyFields(elt=_aot.NOTHING, generators=_aot.FACTORY_LIST)
+
+    def __init__(self, *, elt, generators=_NOTHING):
+        _setattr(self, "elt", elt)
+        _setattr(self, "generators", list() if generators is _NOTHING else generators)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(elt={self.elt!r}, generators={self.generators!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.elt, self.generators) == (other.elt, other.generators)
+
+    def __hash__(self):
+        return hash(("ListComp", self.elt, self.generators))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class SetComp(expr):
+    __slots__ = ("elt", "generators")
+    _fields = ("elt", "generators")
+
+    elt: "expr"
+    generators: LIST["comprehension"]
+
+    __attrs_attrs__ = _aot.LazyFields(elt=_aot.NOTHING, generators=_aot.FACTORY_LIST)
+
+    def __init__(self, *, elt, generators=_NOTHING):
+        _setattr(self, "elt", elt)
+        _setattr(self, "generators", list() if generators is _NOTHING else generators)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(elt={self.elt!r}, generators={self.generators!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.elt, self.generators) == (other.elt, other.generators)
+
+    def __hash__(self):
+        return hash(("SetComp", self.elt, self.generators))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class DictComp(expr):
+    __slots__ = ("key", "value", "generators")
+    _fields = ("key", "value", "generators")
+
+    key: "expr"
+    value: "expr"
+    generators: LIST["comprehension"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        key=_aot.NOTHING, value=_aot.NOTHING, generators=_aot.FACTORY_LIST
+    )
+
+    def __init__(self, *, key, value, generators=_NOTHING):
+        _setattr(self, "key", key)
+        _setattr(self, "value", value)
+        _setattr(self, "generators", list() if generators is _NOTHING else generators)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(key={self.key!r}, value={self.value!r}, generators={self.generators!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.key, self.value, self.generators) == (
+            other.key,
+            other.value,
+            other.generators,
+        )
+
+    def __hash__(self):
+        return hash(("DictComp", self.key, self.value, self.generators))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class GeneratorExp(expr):
+    __slots__ = ("elt", "generators")
+    _fields = ("elt", "generators")
+
+    elt: "expr"
+    generators: LIST["comprehension"]
+
+    __attrs_attrs__ = _aot.LazyFields(elt=_aot.NOTHING, generators=_aot.FACTORY_LIST)
+
+    def __init__(self, *, elt, generators=_NOTHING):
+        _setattr(self, "elt", elt)
+        _setattr(self, "generators", list() if generators is _NOTHING else generators)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(elt={self.elt!r}, generators={self.generators!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.elt, self.generators) == (other.elt, other.generators)
+
+    def __hash__(self):
+        return hash(("GeneratorExp", self.elt, self.generators))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Await(expr):
+    __slots__ = ("value",)
+    _fields = ("value",)
+
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(value=_aot.NOTHING)
+
+    def __init__(self, *, value):
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __hash__(self):
+        return hash(("Await", self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Yield(expr):
+    __slots__ = ("value",)
+    _fields = ("value",)
+
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(value=None)
+
+    def __init__(self, *, value=None):
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __hash__(self):
+        return hash(("Yield", self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class YieldFrom(expr):
+    __slots__ = ("value",)
+    _fields = ("value",)
+
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(value=_aot.NOTHING)
+
+    def __init__(self, *, value):
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __hash__(self):
+        return hash(("YieldFrom", self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Compare(expr):
+    __slots__ = ("left", "ops", "comparators")
+    _fields = ("left", "ops", "comparators")
+
+    left: "expr"
+    ops: LIST["cmpop"]
+    comparators: LIST["expr"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        left=_aot.NOTHING, ops=_aot.FACTORY_LIST, comparators=_aot.FACTORY_LIST
+    )
+
+    def __init__(self, *, left, ops=_NOTHING, comparators=_NOTHING):
+        _setattr(self, "left", left)
+        _setattr(self, "ops", list() if ops is _NOTHING else ops)
+        _setattr(
+            self, "comparators", list() if comparators is _NOTHING else comparators
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(left={self.left!r}, ops={self.ops!r}, comparators={self.comparators!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.left, self.ops, self.comparators) == (
+            other.left,
+            other.ops,
+            other.comparators,
+        )
+
+    def __hash__(self):
+        return hash(("Compare", self.left, self.ops, self.comparators))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Call(expr):
+    __slots__ = ("func", "args", "keywords")
+    _fields = ("func", "args", "keywords")
+
+    func: "expr"
+    args: LIST["expr"]
+    keywords: LIST["keyword"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        func=_aot.NOTHING, args=_aot.FACTORY_LIST, keywords=_aot.FACTORY_LIST
+    )
+
+    def __init__(self, *, func, args=_NOTHING, keywords=_NOTHING):
+        _setattr(self, "func", func)
+        _setattr(self, "args", list() if args is _NOTHING else args)
+        _setattr(self, "keywords", list() if keywords is _NOTHING else keywords)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(func={self.func!r}, args={self.args!r}, keywords={self.keywords!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.func, self.args, self.keywords) == (
+            other.func,
+            other.args,
+            other.keywords,
+        )
+
+    def __hash__(self):
+        return hash(("Call", self.func, self.args, self.keywords))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Num(expr):
+    __slots__ = ("n",)
+    _fields = ("n",)
+
+    n: "object"
+
+    __attrs_attrs__ = _aot.LazyFields(n=_aot.NOTHING)
+
+    def __init__(self, *, n):
+        _setattr(self, "n", n)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(n={self.n!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.n,) == (other.n,)
+
+    def __hash__(self):
+        return hash(("Num", self.n))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Str(expr):
+    __slots__ = ("s",)
+    _fields = ("s",)
+
+    s: "string"
+
+    __attrs_attrs__ = _aot.LazyFields(s=_aot.NOTHING)
+
+    def __init__(self, *, s):
+        _setattr(self, "s", s)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(s={self.s!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.s,) == (other.s,)
+
+    def __hash__(self):
+        return hash(("Str", self.s))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class FormattedValue(expr):
+    __slots__ = ("value", "conversion", "format_spec")
+    _fields = ("value", "conversion", "format_spec")
+
+    value: "expr"
+    conversion: "int"
+    format_spec: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        value=_aot.NOTHING, conversion=0, format_spec=None
+    )
+
+    def __init__(self, *, value, conversion=0, format_spec=None):
+        _setattr(self, "value", value)
+        _setattr(self, "conversion", conversion)
+        _setattr(self, "format_spec", format_spec)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r}, conversion={self.conversion!r}, format_spec={self.format_spec!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value, self.conversion, self.format_spec) == (
+            other.value,
+            other.conversion,
+            other.format_spec,
+        )
+
+    def __hash__(self):
+        return hash(("FormattedValue", self.value, self.conversion, self.format_spec))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class JoinedStr(expr):
+    __slots__ = ("values",)
+    _fields = ("values",)
+
+    values: LIST["expr"]
+
+    __attrs_attrs__ = _aot.LazyFields(values=_aot.FACTORY_LIST)
+
+    def __init__(self, *, values=_NOTHING):
+        _setattr(self, "values", list() if values is _NOTHING else values)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(values={self.values!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.values,) == (other.values,)
+
+    def __hash__(self):
+        return hash(("JoinedStr", self.values))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Bytes(expr):
+    __slots__ = ("s",)
+    _fields = ("s",)
+
+    s: "bytes"
+
+    __attrs_attrs__ = _aot.LazyFields(s=_aot.NOTHING)
+
+    def __init__(self, *, s):
+        _setattr(self, "s", s)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(s={self.s!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.s,) == (other.s,)
+
+    def __hash__(self):
+        return hash(("Bytes", self.s))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class NameConstant(expr):
+    __slots__ = ("value",)
+    _fields = ("value",)
+
+    value: "singleton"
+
+    __attrs_attrs__ = _aot.LazyFields(value=_aot.NOTHING)
+
+    def __init__(self, *, value):
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __hash__(self):
+        return hash(("NameConstant", self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Ellipsis(expr):
+    _fields = ()
+
+
+class Constant(expr):
+    __slots__ = ("value",)
+    _fields = ("value",)
+
+    value: "constant"
+
+    __attrs_attrs__ = _aot.LazyFields(value=_aot.NOTHING)
+
+    def __init__(self, *, value):
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __hash__(self):
+        return hash(("Constant", self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Attribute(expr):
+    __slots__ = ("value", "attr", "ctx")
+    _fields = ("value", "attr", "ctx")
+
+    value: "expr"
+    attr: "identifier"
+    ctx: "expr_context"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        value=_aot.NOTHING, attr=_aot.NOTHING, ctx=_aot.NOTHING
+    )
+
+    def __init__(self, *, value, attr, ctx):
+        _setattr(self, "value", value)
+        _setattr(self, "attr", attr)
+        _setattr(self, "ctx", ctx)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r}, attr={self.attr!r}, ctx={self.ctx!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value, self.attr, self.ctx) == (other.value, other.attr, other.ctx)
+
+    def __hash__(self):
+        return hash(("Attribute", self.value, self.attr, self.ctx))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Subscript(expr):
+    __slots__ = ("value", "slice", "ctx")
+    _fields = ("value", "slice", "ctx")
+
+    value: "expr"
+    slice: "slice"
+    ctx: "expr_context"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        value=_aot.NOTHING, slice=_aot.NOTHING, ctx=_aot.NOTHING
+    )
+
+    def __init__(self, *, value, slice, ctx):
+        _setattr(self, "value", value)
+        _setattr(self, "slice", slice)
+        _setattr(self, "ctx", ctx)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r}, slice={self.slice!r}, ctx={self.ctx!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value, self.slice, self.ctx) == (
+            other.value,
+            other.slice,
+            other.ctx,
+        )
+
+    def __hash__(self):
+        return hash(("Subscript", self.value, self.slice, self.ctx))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Starred(expr):
+    __slots__ = ("value", "ctx")
+    _fields = ("value", "ctx")
+
+    value: "expr"
+    ctx: "expr_context"
+
+    __attrs_attrs__ = _aot.LazyFields(value=_aot.NOTHING, ctx=_aot.NOTHING)
+
+    def __init__(self, *, value, ctx):
+        _setattr(self, "value", value)
+        _setattr(self, "ctx", ctx)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r}, ctx={self.ctx!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value, self.ctx) == (other.value, other.ctx)
+
+    def __hash__(self):
+        return hash(("Starred", self.value, self.ctx))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Name(expr):
+    __slots__ = ("id", "ctx")
+    _fields = ("id", "ctx")
+
+    id: "identifier"
+    ctx: "expr_context"
+
+    __attrs_attrs__ = _aot.LazyFields(id=_aot.NOTHING, ctx=_aot.NOTHING)
+
+    def __init__(self, *, id, ctx):
+        _setattr(self, "id", id)
+        _setattr(self, "ctx", ctx)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(id={self.id!r}, ctx={self.ctx!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.id, self.ctx) == (other.id, other.ctx)
+
+    def __hash__(self):
+        return hash(("Name", self.id, self.ctx))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class List(expr):
+    __slots__ = ("elts", "ctx")
+    _fields = ("elts", "ctx")
+
+    elts: LIST["expr"]
+    ctx: "expr_context"
+
+    __attrs_attrs__ = _aot.LazyFields(elts=_aot.FACTORY_LIST, ctx=_aot.NOTHING)
+
+    def __init__(self, *, elts=_NOTHING, ctx):
+        _setattr(self, "elts", list() if elts is _NOTHING else elts)
+        _setattr(self, "ctx", ctx)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(elts={self.elts!r}, ctx={self.ctx!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.elts, self.ctx) == (other.elts, other.ctx)
+
+    def __hash__(self):
+        return hash(("List", self.elts, self.ctx))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Tuple(expr):
+    __slots__ = ("elts", "ctx")
+    _fields = ("elts", "ctx")
+
+    elts: LIST["expr"]
+    ctx: "expr_context"
+
+    __attrs_attrs__ = _aot.LazyFields(elts=_aot.FACTORY_LIST, ctx=_aot.NOTHING)
+
+    def __init__(self, *, elts=_NOTHING, ctx):
+        _setattr(self, "elts", list() if elts is _NOTHING else elts)
+        _setattr(self, "ctx", ctx)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(elts={self.elts!r}, ctx={self.ctx!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.elts, self.ctx) == (other.elts, other.ctx)
+
+    def __hash__(self):
+        return hash(("Tuple", self.elts, self.ctx))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class expr_context(AST):
+    _fields = ()
+
+
+class Load(expr_context):
+    _fields = ()
+
+
+class Store(expr_context):
+    _fields = ()
+
+
+class Del(expr_context):
+    _fields = ()
+
+
+class AugLoad(expr_context):
+    _fields = ()
+
+
+class AugStore(expr_context):
+    _fields = ()
+
+
+class Param(expr_context):
+    _fields = ()
+
+
+class slice(AST):
+    _fields = ()
+
+
+class Slice(slice):
+    __slots__ = ("lower", "upper", "step")
+    _fields = ("lower", "upper", "step")
+
+    lower: "expr"
+    upper: "expr"
+    step: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(lower=None, upper=None, step=None)
+
+    def __init__(self, *, lower=None, upper=None, step=None):
+        _setattr(self, "lower", lower)
+        _setattr(self, "upper", upper)
+        _setattr(self, "step", step)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(lower={self.lower!r}, upper={self.upper!r}, step={self.step!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.lower, self.upper, self.step) == (
+            other.lower,
+            other.upper,
+            other.step,
+        )
+
+    def __hash__(self):
+        return hash(("Slice", self.lower, self.upper, self.step))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class ExtSlice(slice):
+    __slots__ = ("dims",)
+    _fields = ("dims",)
+
+    dims: LIST["slice"]
+
+    __attrs_attrs__ = _aot.LazyFields(dims=_aot.FACTORY_LIST)
+
+    def __init__(self, *, dims=_NOTHING):
+        _setattr(self, "dims", list() if dims is _NOTHING else dims)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(dims={self.dims!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.dims,) == (other.dims,)
+
+    def __hash__(self):
+        return hash(("ExtSlice", self.dims))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class Index(slice):
+    __slots__ = ("value",)
+    _fields = ("value",)
+
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(value=_aot.NOTHING)
+
+    def __init__(self, *, value):
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __hash__(self):
+        return hash(("Index", self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class boolop(AST):
+    _fields = ()
+
+
+class And(boolop):
+    _fields = ()
+
+
+class Or(boolop):
+    _fields = ()
+
+
+class operator(AST):
+    _fields = ()
+
+
+class Add(operator):
+    _fields = ()
+
+
+class Sub(operator):
+    _fields = ()
+
+
+class Mult(operator):
+    _fields = ()
+
+
+class MatMult(operator):
+    _fields = ()
+
+
+class Div(operator):
+    _fields = ()
+
+
+class Mod(operator):
+    _fields = ()
+
+
+class Pow(operator):
+    _fields = ()
+
+
+class LShift(operator):
+    _fields = ()
+
+
+class RShift(operator):
+    _fields = ()
+
+
+class BitOr(operator):
+    _fields = ()
+
+
+class BitXor(operator):
+    _fields = ()
+
+
+class BitAnd(operator):
+    _fields = ()
+
+
+class FloorDiv(operator):
+    _fields = ()
+
+
+class unaryop(AST):
+    _fields = ()
+
+
+class Invert(unaryop):
+    _fields = ()
+
+
+class Not(unaryop):
+    _fields = ()
+
+
+class UAdd(unaryop):
+    _fields = ()
+
+
+class USub(unaryop):
+    _fields = ()
+
+
+class cmpop(AST):
+    _fields = ()
+
+
+class Eq(cmpop):
+    _fields = ()
+
+
+class NotEq(cmpop):
+    _fields = ()
+
+
+class Lt(cmpop):
+    _fields = ()
+
+
+class LtE(cmpop):
+    _fields = ()
+
+
+class Gt(cmpop):
+    _fields = ()
+
+
+class GtE(cmpop):
+    _fields = ()
+
+
+class Is(cmpop):
+    _fields = ()
+
+
+class IsNot(cmpop):
+    _fields = ()
+
+
+class In(cmpop):
+    _fields = ()
+
+
+class NotIn(cmpop):
+    _fields = ()
+
+
+class comprehension(AST):
+    __slots__ = ("target", "iter", "ifs", "is_async")
+    _fields = ("target", "iter", "ifs", "is_async")
+
+    target: "expr"
+    iter: "expr"
+    ifs: LIST["expr"]
+    is_async: "int"
+
+    __attrs_attrs__ = _aot.LazyFields(
+        target=_aot.NOTHING,
+        iter=_aot.NOTHING,
+        ifs=_aot.FACTORY_LIST,
+        is_async=_aot.NOTHING,
+    )
+
+    def __init__(self, *, target, iter, ifs=_NOTHING, is_async):
+        _setattr(self, "target", target)
+        _setattr(self, "iter", iter)
+        _setattr(self, "ifs", list() if ifs is _NOTHING else ifs)
+        _setattr(self, "is_async", is_async)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(target={self.target!r}, iter={self.iter!r}, ifs={self.ifs!r}, is_async={self.is_async!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.target, self.iter, self.ifs, self.is_async) == (
+            other.target,
+            other.iter,
+            other.ifs,
+            other.is_async,
+        )
+
+    def __hash__(self):
+        return hash(("comprehension", self.target, self.iter, self.ifs, self.is_async))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class excepthandler(AST):
+    _fields = ()
+
+
+class ExceptHandler(excepthandler):
+    __slots__ = ("type", "name", "body")
+    _fields = ("type", "name", "body")
+
+    type: "expr"
+    name: "identifier"
+    body: LIST["stmt"]
+
+    __attrs_attrs__ = _aot.LazyFields(type=None, name=None, body=_aot.FACTORY_LIST)
+
+    def __init__(self, *, type=None, name=None, body=_NOTHING):
+        _setattr(self, "type", type)
+        _setattr(self, "name", name)
+        _setattr(self, "body", list() if body is _NOTHING else body)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(type={self.type!r}, name={self.name!r}, body={self.body!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.type, self.name, self.body) == (other.type, other.name, other.body)
+
+    def __hash__(self):
+        return hash(("ExceptHandler", self.type, self.name, self.body))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class arguments(AST):
+    __slots__ = ("args", "vararg", "kwonlyargs", "kw_defaults", "kwarg", "defaults")
+    _fields = ("args", "vararg", "kwonlyargs", "kw_defaults", "kwarg", "defaults")
+
+    args: LIST["arg"]
+    vararg: "arg"
+    kwonlyargs: LIST["arg"]
+    kw_defaults: LIST["expr"]
+    kwarg: "arg"
+    defaults: LIST["expr"]
+
+    __attrs_attrs__ = _aot.LazyFields(
+        args=_aot.FACTORY_LIST,
+        vararg=None,
+        kwonlyargs=_aot.FACTORY_LIST,
+        kw_defaults=_aot.FACTORY_LIST,
+        kwarg=None,
+        defaults=_aot.FACTORY_LIST,
+    )
+
+    def __init__(
+        self,
+        *,
+        args=_NOTHING,
+        vararg=None,
+        kwonlyargs=_NOTHING,
+        kw_defaults=_NOTHING,
+        kwarg=None,
+        defaults=_NOTHING,
+    ):
+        _setattr(self, "args", list() if args is _NOTHING else args)
+        _setattr(self, "vararg", vararg)
+        _setattr(self, "kwonlyargs", list() if kwonlyargs is _NOTHING else kwonlyargs)
+        _setattr(
+            self, "kw_defaults", list() if kw_defaults is _NOTHING else kw_defaults
+        )
+        _setattr(self, "kwarg", kwarg)
+        _setattr(self, "defaults", list() if defaults is _NOTHING else defaults)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(args={self.args!r}, vararg={self.vararg!r}, kwonlyargs={self.kwonlyargs!r}, kw_defaults={self.kw_defaults!r}, kwarg={self.kwarg!r}, defaults={self.defaults!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.args,
+            self.vararg,
+            self.kwonlyargs,
+            self.kw_defaults,
+            self.kwarg,
+            self.defaults,
+        ) == (
+            other.args,
+            other.vararg,
+            other.kwonlyargs,
+            other.kw_defaults,
+            other.kwarg,
+            other.defaults,
+        )
+
+    def __hash__(self):
+        return hash(
+            (
+                "arguments",
+                self.args,
+                self.vararg,
+                self.kwonlyargs,
+                self.kw_defaults,
+                self.kwarg,
+                self.defaults,
+            )
+        )
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class arg(AST):
+    __slots__ = ("arg", "annotation")
+    _fields = ("arg", "annotation")
+
+    arg: "identifier"
+    annotation: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(arg=_aot.NOTHING, annotation=None)
+
+    def __init__(self, *, arg, annotation=None):
+        _setattr(self, "arg", arg)
+        _setattr(self, "annotation", annotation)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(arg={self.arg!r}, annotation={self.annotation!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.arg, self.annotation) == (other.arg, other.annotation)
+
+    def __hash__(self):
+        return hash(("arg", self.arg, self.annotation))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class keyword(AST):
+    __slots__ = ("arg", "value")
+    _fields = ("arg", "value")
+
+    arg: "identifier"
+    value: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(arg=None, value=_aot.NOTHING)
+
+    def __init__(self, *, arg=None, value):
+        _setattr(self, "arg", arg)
+        _setattr(self, "value", value)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(arg={self.arg!r}, value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.arg, self.value) == (other.arg, other.value)
+
+    def __hash__(self):
+        return hash(("keyword", self.arg, self.value))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class alias(AST):
+    __slots__ = ("name", "asname")
+    _fields = ("name", "asname")
+
+    name: "identifier"
+    asname: "identifier"
+
+    __attrs_attrs__ = _aot.LazyFields(name=_aot.NOTHING, asname=None)
+
+    def __init__(self, *, name, asname=None):
+        _setattr(self, "name", name)
+        _setattr(self, "asname", asname)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(name={self.name!r}, asname={self.asname!r})"
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.name, self.asname) == (other.name, other.asname)
+
+    def __hash__(self):
+        return hash(("alias", self.name, self.asname))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+class withitem(AST):
+    __slots__ = ("context_expr", "optional_vars")
+    _fields = ("context_expr", "optional_vars")
+
+    context_expr: "expr"
+    optional_vars: "expr"
+
+    __attrs_attrs__ = _aot.LazyFields(context_expr=_aot.NOTHING, optional_vars=None)
+
+    def __init__(self, *, context_expr, optional_vars=None):
+        _setattr(self, "context_expr", context_expr)
+        _setattr(self, "optional_vars", optional_vars)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(context_expr={self.context_expr!r}, optional_vars={self.optional_vars!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.context_expr, self.optional_vars) == (
+            other.context_expr,
+            other.optional_vars,
+        )
+
+    def __hash__(self):
+        return hash(("withitem", self.context_expr, self.optional_vars))
+
+    __ne__ = _aot.ne
+    __lt__ = _aot.lt
+    __le__ = _aot.le
+    __gt__ = _aot.gt
+    __ge__ = _aot.ge
+    __getstate__ = _aot.getstate
+    __setstate__ = _aot.setstate
+
+
+# attrs gives its classes ``__match_args__`` from Python 3.10 on
+_aot.add_match_args(globals())
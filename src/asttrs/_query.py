@@ -0,0 +1,236 @@
+"""
+Structural patterns over asttrs trees.
+
+Patterns are written with the asttrs classes themselves::
+
+    P(Call, func=P(Attribute, attr="execute"), args=[Capture("sql", P(Constant))])
+
+and compiled once into a plain Python function, generated as source much like
+``attrs`` generates ``__init__``, with every field access and comparison
+unrolled.
+"""
+
+import itertools
+from typing import Any, Callable
+from typing import Dict as DICT
+from typing import Iterable, Iterator
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+from typing import Type
+
+import attr
+
+from ._base import AST, immutable
+from ._index import _INDEXES
+from ._walk import field_names, walk
+
+
+class _Any:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "ANY"
+
+
+ANY = _Any()
+"""Wildcard matching any value, including ``None`` and lists."""
+
+
+class P:
+    """Pattern for nodes of class *cls* (or subclasses) with the given fields.
+
+    Field values are patterns themselves: another ``P``, an asttrs node
+    (compared field by field), a list of patterns (same length), ``ANY`` /
+    ``...``, a :class:`Capture` or a plain value compared with ``==``.
+    Fields left out are not checked.
+    """
+
+    __slots__ = ("cls", "fields")
+
+    def __init__(self, cls: Type[AST], **fields: Any):
+        unknown = set(fields) - set(field_names(cls))
+        if unknown:
+            raise TypeError(f"{cls.__name__} has no field(s): {sorted(unknown)}")
+
+        self.cls = cls
+        self.fields = fields
+
+    def __repr__(self):
+        args = "".join(f", {k}={v!r}" for k, v in self.fields.items())
+        return f"P({self.cls.__name__}{args})"
+
+
+class Capture:
+    """Bind the value matched by *pattern* to *name* in the match captures.
+
+    A name captured twice must match equal values both times.
+    """
+
+    __slots__ = ("name", "pattern")
+
+    def __init__(self, name: str, pattern: Any = ANY):
+        self.name = name
+        self.pattern = pattern
+
+    def __repr__(self):
+        return f"Capture({self.name!r}, {self.pattern!r})"
+
+
+@immutable
+class PatternMatch:
+    node: Any
+    captures: DICT[str, Any] = attr.ib(factory=dict)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.captures[name]
+
+
+class _Compiler:
+    def __init__(self):
+        self.lines: LIST[str] = []
+        self.namespace: DICT[str, Any] = {}
+        self.counter = itertools.count()
+
+    def const(self, value: Any) -> str:
+        name = f"_k{next(self.counter)}"
+        self.namespace[name] = value
+        return name
+
+    def var(self) -> str:
+        return f"v{next(self.counter)}"
+
+    def emit(self, line: str) -> None:
+        self.lines.append("    " + line)
+
+    def fail_unless(self, cond: str) -> None:
+        self.emit(f"if not ({cond}): return False")
+
+    def compile(self, pat: Any, var: str) -> None:
+        if pat is ANY or pat is Ellipsis:
+            return
+
+        if isinstance(pat, Capture):
+            self.compile(pat.pattern, var)
+            key = repr(pat.name)
+            self.emit(f"if {key} in caps and caps[{key}] != {var}: return False")
+            self.emit(f"caps[{key}] = {var}")
+
+        elif isinstance(pat, P):
+            self.fail_unless(f"isinstance({var}, {self.const(pat.cls)})")
+            for name, sub in pat.fields.items():
+                self.field(var, name, sub)
+
+        elif isinstance(pat, AST):
+            self.fail_unless(f"type({var}) is {self.const(type(pat))}")
+            for name in field_names(type(pat)):
+                self.field(var, name, getattr(pat, name))
+
+        elif isinstance(pat, list):
+            self.fail_unless(f"type({var}) is list and len({var}) == {len(pat)}")
+            for idx, sub in enumerate(pat):
+                if sub is ANY or sub is Ellipsis:
+                    continue
+                item = self.var()
+                self.emit(f"{item} = {var}[{idx}]")
+                self.compile(sub, item)
+
+        elif pat is None or isinstance(pat, bool):
+            self.fail_unless(f"{var} is {pat!r}")
+
+        else:
+            self.fail_unless(f"{var} == {self.const(pat)}")
+
+    def field(self, var: str, name: str, sub: Any) -> None:
+        if sub is ANY or sub is Ellipsis:
+            return
+
+        value = self.var()
+        self.emit(f"{value} = {var}.{name}")
+        self.compile(sub, value)
+
+
+class CompiledPattern:
+    """A pattern compiled into a specialized matcher function.
+
+    >>> from asttrs import Attribute, Call, Constant, Module
+    >>> tree = Module.from_source("cur.execute('select 1')\\ncur.close()")
+    >>> pat = compile_pattern(
+    ...     P(Call, func=P(Attribute, attr="execute"), args=[Capture("sql", P(Constant))])
+    ... )
+    >>> [m["sql"].value for m in pat.finditer(tree)]
+    ['select 1']
+    """
+
+    def __init__(self, pattern: Any):
+        self.pattern = pattern
+
+        compiler = _Compiler()
+        compiler.compile(pattern, "node")
+        body = compiler.lines or ["    pass"]
+
+        self.source = "\n".join(
+            ["def _match(node, caps):"] + body + ["    return True"]
+        )
+
+        namespace = dict(compiler.namespace)
+        exec(compile(self.source, f"<pattern {pattern!r}>", "exec"), namespace)
+        self._match: Callable[[Any, DICT[str, Any]], bool] = namespace["_match"]
+
+        self.types = self._root_types(pattern)
+
+    @staticmethod
+    def _root_types(pattern: Any) -> Optional[TUPLE[type, ...]]:
+        while isinstance(pattern, Capture):
+            pattern = pattern.pattern
+
+        if isinstance(pattern, P):
+            return (pattern.cls,)
+
+        if isinstance(pattern, AST):
+            return (type(pattern),)
+
+        return None
+
+    def __repr__(self):
+        return f"compile_pattern({self.pattern!r})"
+
+    def match(self, node: Any) -> Optional[PatternMatch]:
+        """Match *node* itself against the pattern."""
+
+        caps: DICT[str, Any] = {}
+        if self._match(node, caps):
+            return PatternMatch(node=node, captures=caps)
+
+        return None
+
+    def finditer(self, tree: AST) -> Iterator[PatternMatch]:
+        """Yield a :class:`PatternMatch` for every matching node of *tree*, in document order.
+
+        Candidates come from the cached :func:`node_index` of *tree* when one
+        has been built already, otherwise from a pruned :func:`walk`.
+        """
+
+        func = self._match
+
+        idx = _INDEXES.get(tree)
+        if idx is not None and self.types is not None:
+            candidates: Iterable[Any] = idx.of(*self.types)
+        else:
+            candidates = walk(tree, self.types)
+
+        for node in candidates:
+            caps: DICT[str, Any] = {}
+            if func(node, caps):
+                yield PatternMatch(node=node, captures=caps)
+
+    def findall(self, trees: Iterable[AST]) -> LIST[PatternMatch]:
+        """Return the matches over a corpus of trees."""
+
+        return [m for tree in trees for m in self.finditer(tree)]
+
+
+def compile_pattern(pattern: Any) -> CompiledPattern:
+    """Compile *pattern* into a reusable :class:`CompiledPattern`."""
+
+    return CompiledPattern(pattern)
@@ -0,0 +1,629 @@
+"""
+Scope analysis of asttrs trees, the counterpart of ``symtable``.
+
+The names a scope binds, reads and declares only depend on its own subtree, so
+they are collected once per scope node and cached by identity: analyzing a
+tree that shares functions with an already analyzed one (after an edit, say)
+only visits the new scopes. Resolving free, cell and global names is a pass
+over those summaries, cached per scope and enclosing context as well.
+"""
+
+import weakref
+from typing import Any, Iterator
+from typing import Dict as DICT
+from typing import FrozenSet
+from typing import List as LIST
+from typing import Optional, Set
+from typing import Tuple as TUPLE
+
+from ._base import AST, immutable
+from ._cache import IdentityCache
+from ._visitor import NodeVisitor
+
+DEF_LOCAL = 1
+DEF_PARAM = 2
+DEF_GLOBAL = 4
+DEF_NONLOCAL = 8
+DEF_IMPORT = 16
+DEF_ANNOT = 32
+DEF_HOISTED = 64  # assignment expression target in a comprehension
+USE = 128
+USE_ANNOT = 256  # read in an annotation
+
+_BINDING = DEF_LOCAL | DEF_PARAM | DEF_IMPORT
+
+LOCAL = "local"
+CELL = "cell"
+FREE = "free"
+GLOBAL_EXPLICIT = "global_explicit"
+GLOBAL_IMPLICIT = "global_implicit"
+
+_FUNCTION_LIKE = frozenset(
+    {"function", "lambda", "comprehension", "type_params", "type_alias"}
+)
+
+_COMPREHENSIONS = {
+    "ListComp": "listcomp",
+    "SetComp": "setcomp",
+    "DictComp": "dictcomp",
+    "GeneratorExp": "genexpr",
+}
+
+
+@immutable
+class Symbol:
+    """How one name is used in one scope."""
+
+    name: str
+    flags: int
+    kind: str
+    module_level: bool = False
+
+    def is_referenced(self) -> bool:
+        return bool(self.flags & USE)
+
+    def is_assigned(self) -> bool:
+        return bool(self.flags & (DEF_LOCAL | DEF_IMPORT | DEF_HOISTED))
+
+    def is_parameter(self) -> bool:
+        return bool(self.flags & DEF_PARAM)
+
+    def is_imported(self) -> bool:
+        return bool(self.flags & DEF_IMPORT)
+
+    def is_annotated(self) -> bool:
+        return bool(self.flags & DEF_ANNOT)
+
+    def is_nonlocal(self) -> bool:
+        return bool(self.flags & DEF_NONLOCAL)
+
+    def is_declared_global(self) -> bool:
+        return self.kind == GLOBAL_EXPLICIT
+
+    def is_global(self) -> bool:
+        return self.kind in (GLOBAL_EXPLICIT, GLOBAL_IMPLICIT) or (
+            self.module_level and bool(self.flags & _BINDING)
+        )
+
+    def is_local(self) -> bool:
+        return self.kind in (LOCAL, CELL)
+
+    def is_free(self) -> bool:
+        return self.kind == FREE
+
+    def is_cell(self) -> bool:
+        return self.kind == CELL
+
+
+class _Summary:
+    """What one scope does with names, independently of its context."""
+
+    __slots__ = (
+        "kind",
+        "name",
+        "ref",
+        "flags",
+        "children",
+        "hoisted",
+        "postponed",
+        "resolved",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        node: AST,
+        flags: DICT[str, int],
+        children: TUPLE["_Summary", ...],
+        hoisted: FrozenSet[str],
+        postponed: bool,
+    ):
+        self.kind = kind
+        self.name = name
+        self.ref = weakref.ref(node)
+        self.flags = flags
+        self.children = children
+        self.hoisted = hoisted
+        # ``from __future__ import annotations``
+        self.postponed = postponed
+        # resolved scopes by context, see ``_resolve``
+        self.resolved: DICT[Any, Any] = {}
+
+
+class Scope:
+    """One resolved scope, with its nested scopes in document order.
+
+    >>> from asttrs import Module
+    >>> tree = Module.from_source(
+    ...     "import os\\n"
+    ...     "def f(a):\\n"
+    ...     "    b = a\\n"
+    ...     "    return lambda: b + os.sep\\n"
+    ... )
+    >>> f = analyze_scopes(tree).children[0]
+    >>> f.kind, f.name, sorted(f.bound), sorted(f.cells)
+    ('function', 'f', ['a', 'b'], ['b'])
+    >>> lam = f.children[0]
+    >>> sorted(lam.free), sorted(lam.globals)
+    (['b'], ['os'])
+    >>> lam.node is tree.body[1].body[1].value
+    True
+    """
+
+    __slots__ = ("kind", "name", "symbols", "children", "_ref")
+
+    def __init__(
+        self,
+        summary: _Summary,
+        symbols: DICT[str, Symbol],
+        children: TUPLE["Scope", ...],
+    ):
+        self.kind = summary.kind
+        self.name = summary.name
+        self.symbols = symbols
+        self.children = children
+        self._ref = summary.ref
+
+    def __repr__(self):
+        return f"Scope({self.kind} {self.name!r}, {len(self.symbols)} symbols)"
+
+    @property
+    def node(self) -> Optional[AST]:
+        """The node this scope belongs to, if it is still alive."""
+
+        return self._ref()
+
+    def lookup(self, name: str) -> Symbol:
+        return self.symbols[name]
+
+    def _names(self, predicate: Any) -> FrozenSet[str]:
+        return frozenset(n for n, s in self.symbols.items() if predicate(s))
+
+    @property
+    def bound(self) -> FrozenSet[str]:
+        """Names bound in this scope (assigned, imported or parameters)."""
+
+        return self._names(
+            lambda s: s.is_local() or s.flags & _BINDING and s.module_level
+        )
+
+    @property
+    def referenced(self) -> FrozenSet[str]:
+        return self._names(Symbol.is_referenced)
+
+    @property
+    def parameters(self) -> FrozenSet[str]:
+        return self._names(Symbol.is_parameter)
+
+    @property
+    def free(self) -> FrozenSet[str]:
+        """Names closed over from an enclosing function scope."""
+
+        return self._names(Symbol.is_free)
+
+    @property
+    def cells(self) -> FrozenSet[str]:
+        """Local names closed over by a nested scope."""
+
+        return self._names(Symbol.is_cell)
+
+    @property
+    def globals(self) -> FrozenSet[str]:
+        return self._names(Symbol.is_global)
+
+    @property
+    def nonlocals(self) -> FrozenSet[str]:
+        return self._names(Symbol.is_nonlocal)
+
+    def walk(self) -> Iterator["Scope"]:
+        """Yield this scope and all nested scopes, depth first."""
+
+        stack = [self]
+        while stack:
+            scope = stack.pop()
+            yield scope
+            stack.extend(reversed(scope.children))
+
+    def find(self, node: AST) -> Optional["Scope"]:
+        """Return the scope of *node* (by identity) within this one, if any.
+
+        A generic function or class has a ``type_params`` scope holding its
+        own scope; the outermost one is returned.
+        """
+
+        for scope in self.walk():
+            if scope._ref() is node:
+                return scope
+
+        return None
+
+
+_SUMMARIES: IdentityCache[_Summary] = IdentityCache()
+_SCOPES: IdentityCache[Scope] = IdentityCache()
+
+
+def _arguments(args: AST) -> Iterator[AST]:
+    yield from getattr(args, "posonlyargs", None) or ()
+    yield from args.args
+    if args.vararg is not None:
+        yield args.vararg
+    yield from args.kwonlyargs
+    if args.kwarg is not None:
+        yield args.kwarg
+
+
+class _Collector(NodeVisitor):
+    """Collect the names of one scope, summarizing nested scopes apart."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.flags: DICT[str, int] = {}
+        self.children: LIST[_Summary] = []
+        self.hoisted: Set[str] = set()
+        self.postponed = False
+        self.use = USE
+
+    def add(self, name: str, flag: int) -> None:
+        self.flags[name] = self.flags.get(name, 0) | flag
+
+    def visit_all(self, nodes: Any) -> None:
+        for node in nodes or ():
+            if isinstance(node, AST):
+                self.visit(node)
+
+    def summary(self, name: str, node: AST) -> _Summary:
+        return _Summary(
+            self.kind,
+            name,
+            node,
+            self.flags,
+            tuple(self.children),
+            frozenset(self.hoisted),
+            self.postponed,
+        )
+
+    def child(self, node: AST) -> None:
+        summary = _summarize(node)
+        self.children.append(summary)
+
+        for name in summary.hoisted:
+            if self.kind == "comprehension":
+                self.hoisted.add(name)
+                self.add(name, DEF_HOISTED)
+            else:
+                self.add(name, DEF_LOCAL)
+
+    def parameters(self, args: AST) -> None:
+        for arg in _arguments(args):
+            self.add(arg.arg, DEF_PARAM)
+
+    def annotation(self, node: Optional[AST]) -> None:
+        if node is None:
+            return
+
+        self.use = USE_ANNOT
+        try:
+            self.visit(node)
+        finally:
+            self.use = USE
+
+    def annotations(self, args: AST, returns: Optional[AST]) -> None:
+        for arg in _arguments(args):
+            self.annotation(arg.annotation)
+
+        self.annotation(returns)
+
+    def type_params(self, params: LIST[AST]) -> None:
+        for param in params:
+            self.add(param.name, DEF_LOCAL)
+            self.generic_visit(param)
+
+    def visit_Name(self, node: AST) -> None:
+        ctx = type(node.ctx).__name__ if node.ctx is not None else "Load"
+        self.add(node.id, self.use if ctx == "Load" else DEF_LOCAL)
+
+    def visit_FunctionDef(self, node: AST) -> None:
+        self.visit_all(node.decorator_list)
+        self.visit_all(node.args.defaults)
+        self.visit_all(node.args.kw_defaults)
+        if not getattr(node, "type_params", None):
+            self.annotations(node.args, node.returns)
+
+        self.add(node.name, DEF_LOCAL)
+        self.child(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node: AST) -> None:
+        self.visit_all(node.args.defaults)
+        self.visit_all(node.args.kw_defaults)
+        self.child(node)
+
+    def visit_ClassDef(self, node: AST) -> None:
+        self.visit_all(node.decorator_list)
+        if not getattr(node, "type_params", None):
+            self.visit_all(node.bases)
+            self.visit_all(node.keywords)
+
+        self.add(node.name, DEF_LOCAL)
+        self.child(node)
+
+    def _comprehension(self, node: AST) -> None:
+        # the first iterable is evaluated in the enclosing scope
+        self.visit(node.generators[0].iter)
+        self.child(node)
+
+    visit_ListComp = visit_SetComp = _comprehension
+    visit_DictComp = visit_GeneratorExp = _comprehension
+
+    def visit_TypeAlias(self, node: AST) -> None:
+        self.visit(node.name)
+        self.child(node)
+
+    def visit_NamedExpr(self, node: AST) -> None:
+        self.visit(node.value)
+        if self.kind == "comprehension":
+            self.hoisted.add(node.target.id)
+            self.add(node.target.id, DEF_HOISTED)
+        else:
+            self.visit(node.target)
+
+    def visit_AnnAssign(self, node: AST) -> None:
+        if type(node.target).__name__ == "Name":
+            self.add(node.target.id, DEF_ANNOT)
+
+        self.visit(node.target)
+        self.annotation(node.annotation)
+        if node.value is not None:
+            self.visit(node.value)
+
+    def visit_Global(self, node: AST) -> None:
+        for name in node.names:
+            self.add(name, DEF_GLOBAL)
+
+    def visit_Nonlocal(self, node: AST) -> None:
+        for name in node.names:
+            self.add(name, DEF_NONLOCAL)
+
+    def visit_Import(self, node: AST) -> None:
+        for alias in node.names:
+            if alias.name != "*":
+                self.add(alias.asname or alias.name.split(".")[0], DEF_IMPORT)
+
+    def visit_ImportFrom(self, node: AST) -> None:
+        if node.module == "__future__" and self.kind == "module":
+            if any(alias.name == "annotations" for alias in node.names):
+                self.postponed = True
+
+        self.visit_Import(node)
+
+    def visit_ExceptHandler(self, node: AST) -> None:
+        if node.name:
+            self.add(node.name, DEF_LOCAL)
+        self.generic_visit(node)
+
+    def visit_MatchAs(self, node: AST) -> None:
+        if node.name:
+            self.add(node.name, DEF_LOCAL)
+        self.generic_visit(node)
+
+    visit_MatchStar = visit_MatchAs
+
+    def visit_MatchMapping(self, node: AST) -> None:
+        if node.rest:
+            self.add(node.rest, DEF_LOCAL)
+        self.generic_visit(node)
+
+
+def _collect(node: AST) -> _Summary:
+    cls_name = type(node).__name__
+    type_params = getattr(node, "type_params", None)
+
+    if cls_name in ("FunctionDef", "AsyncFunctionDef", "Lambda"):
+        collector = _Collector("lambda" if cls_name == "Lambda" else "function")
+        collector.parameters(node.args)
+        if cls_name == "Lambda":
+            collector.visit(node.body)
+        else:
+            collector.visit_all(node.body)
+        summary = collector.summary(getattr(node, "name", "lambda"), node)
+
+        if not type_params:
+            return summary
+
+        outer = _Collector("type_params")
+        outer.type_params(type_params)
+        outer.annotations(node.args, node.returns)
+        outer.children.append(summary)
+
+        return outer.summary(node.name, node)
+
+    if cls_name == "ClassDef":
+        collector = _Collector("class")
+        collector.visit_all(node.body)
+        summary = collector.summary(node.name, node)
+
+        if not type_params:
+            return summary
+
+        outer = _Collector("type_params")
+        outer.type_params(type_params)
+        outer.visit_all(node.bases)
+        outer.visit_all(node.keywords)
+        outer.children.append(summary)
+
+        return outer.summary(node.name, node)
+
+    if cls_name in _COMPREHENSIONS:
+        collector = _Collector("comprehension")
+        for idx, gen in enumerate(node.generators):
+            collector.visit(gen.target)
+            if idx:
+                collector.visit(gen.iter)
+            collector.visit_all(gen.ifs)
+
+        if cls_name == "DictComp":
+            collector.visit(node.key)
+            collector.visit(node.value)
+        else:
+            collector.visit(node.elt)
+
+        return collector.summary(_COMPREHENSIONS[cls_name], node)
+
+    if cls_name == "TypeAlias":
+        collector = _Collector("type_alias")
+        collector.type_params(type_params or [])
+        collector.visit(node.value)
+
+        return collector.summary(node.name.id, node)
+
+    collector = _Collector("module")
+    collector.generic_visit(node)
+
+    return collector.summary("top", node)
+
+
+def _summarize(node: AST) -> _Summary:
+    summary = _SUMMARIES.get(node)
+    if summary is None:
+        summary = _SUMMARIES.set(node, _collect(node))
+
+    return summary
+
+
+def _mangle(private: Optional[str], name: str) -> str:
+    if not private or not name.startswith("__") or name.endswith("__"):
+        return name
+
+    stripped = private.lstrip("_")
+
+    return f"_{stripped}{name}" if stripped else name
+
+
+def _normalize(
+    flags: DICT[str, int], private: Optional[str], postponed: bool
+) -> DICT[str, int]:
+    result: DICT[str, int] = {}
+
+    for name, flag in flags.items():
+        if flag & USE_ANNOT:
+            flag = flag & ~USE_ANNOT | (0 if postponed else USE)
+            if not flag:
+                continue
+
+        name = _mangle(private, name)
+        result[name] = result.get(name, 0) | flag
+
+    return result
+
+
+def _resolve(
+    summary: _Summary,
+    visible: FrozenSet[str],
+    private: Optional[str] = None,
+    postponed: bool = False,
+) -> TUPLE[Scope, Set[str], Set[str]]:
+    """Resolve *summary* given the names bound by the enclosing function
+    scopes, the name of the enclosing class, which private names are mangled
+    with, and whether annotations are postponed (PEP 563). Return its scope, the free names it needs from them, and
+    the names declared global in it or below."""
+
+    context = (visible, private, postponed)
+    try:
+        return summary.resolved[context]
+    except KeyError:
+        pass
+
+    kind, flags = summary.kind, summary.flags
+
+    if kind == "class":
+        private = summary.name
+
+    postponed = postponed or summary.postponed
+    flags = _normalize(flags, private, postponed)
+
+    declared = {n for n, f in flags.items() if f & DEF_GLOBAL}
+    bound = {
+        n
+        for n, f in flags.items()
+        if f & _BINDING and not f & (DEF_GLOBAL | DEF_NONLOCAL)
+    }
+
+    if kind == "module":
+        inner: FrozenSet[str] = frozenset()
+    elif kind == "class":
+        inner = visible - declared
+    else:
+        inner = (visible | bound) - declared
+
+    children = []
+    needed: Set[str] = set()
+    for child in summary.children:
+        scope, free, child_declared = _resolve(child, inner, private, postponed)
+        children.append(scope)
+        needed |= free
+        declared |= child_declared
+
+    module_level = kind == "module"
+    symbols: DICT[str, Symbol] = {}
+    free_here: Set[str] = set()
+
+    for name, flag in flags.items():
+        if flag & DEF_GLOBAL:
+            sym_kind = GLOBAL_EXPLICIT
+
+        elif flag & DEF_NONLOCAL:
+            sym_kind = FREE
+
+        elif name in bound:
+            sym_kind = CELL if name in needed and kind in _FUNCTION_LIKE else LOCAL
+
+        elif name in visible:
+            sym_kind = FREE
+
+        else:
+            sym_kind = GLOBAL_IMPLICIT
+
+        if sym_kind == FREE:
+            free_here.add(name)
+
+        symbols[name] = Symbol(
+            name=name, flags=flag, kind=sym_kind, module_level=module_level
+        )
+
+    # free names of nested scopes pass through this one
+    for name in needed:
+        if name not in symbols and name in visible:
+            symbols[name] = Symbol(name=name, flags=0, kind=FREE)
+            free_here.add(name)
+
+    if module_level:
+        for name in declared - set(symbols):
+            symbols[name] = Symbol(
+                name=name, flags=DEF_GLOBAL, kind=GLOBAL_EXPLICIT, module_level=True
+            )
+
+    result = summary.resolved[context] = (
+        Scope(summary, symbols, tuple(children)),
+        free_here,
+        declared,
+    )
+
+    return result
+
+
+def analyze_scopes(node: AST) -> Scope:
+    """Return the resolved scope tree of *node*.
+
+    *node* is usually a ``Module``. A function or class is analyzed without
+    its enclosing scopes, so the names it does not bind resolve as globals;
+    use :meth:`Scope.find` on the module's scope to see it in context. The
+    result is cached for as long as *node* is alive.
+    """
+
+    scope = _SCOPES.get(node)
+    if scope is None:
+        scope = _SCOPES.set(node, _resolve(_summarize(node), frozenset())[0])
+
+    return scope
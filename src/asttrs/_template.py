@@ -0,0 +1,322 @@
+"""
+Code templates with ``$name`` placeholders.
+
+:func:`template` parses a source once, locates its placeholders and caches the
+result. :meth:`Template.substitute` then builds a new tree by rebuilding only
+the nodes on the path to each placeholder; everything else is shared with the
+template tree, and nothing is parsed again.
+"""
+
+import ast as _ast
+import functools
+import re
+from operator import attrgetter
+from typing import Any, Callable
+from typing import Dict as DICT
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+
+from ._base import AST, _field_names
+from ._cursor import Path
+from ._edit import _split
+from ._translate import _LEGACY_CONSTANTS
+from ._versions import CURRENT
+
+_PREFIX = "_asttrs_hole_"
+_PLACEHOLDER = re.compile(r"\$(\$|[A-Za-z_]\w*)")
+
+
+def _node_class(name: str) -> Any:
+    return AST.infer_type_from_ast(getattr(_ast, name))
+
+
+def _hole_name(value: str) -> Optional[str]:
+    if not value.startswith(_PREFIX) or not value[len(_PREFIX) :].isidentifier():
+        if _PREFIX in value:
+            raise ValueError(f"placeholder within {value!r}: only whole names work")
+        return None
+
+    return value[len(_PREFIX) :]
+
+
+class _Hole:
+    __slots__ = ("name", "convert", "splice")
+
+    def __init__(self, name: str, convert: Callable[[Any], Any], splice: bool):
+        self.name = name
+        self.convert = convert
+        self.splice = splice
+
+    def one(self, value: Any) -> Any:
+        if value is None:
+            return None
+
+        if isinstance(value, list):
+            raise TypeError(f"${self.name} takes a single value, not a list")
+
+        return self.convert(value)
+
+    def many(self, value: Any) -> LIST[Any]:
+        if value is None:
+            return []
+
+        if isinstance(value, list):
+            if not self.splice:
+                raise TypeError(f"${self.name} takes a single value, not a list")
+            return [self.convert(el) for el in value]
+
+        return [self.convert(value)]
+
+
+def _identifier(name: str) -> Callable[[Any], str]:
+    def convert(value: Any) -> str:
+        if not isinstance(value, str):
+            raise TypeError(f"${name} takes a str, got {value!r}")
+        return value
+
+    return convert
+
+
+def _expression(name: str, node: AST) -> Callable[[Any], AST]:
+    constant = _node_class("Constant")
+
+    # the classes the 3.7 parser makes instead, as ``Num(n=1)``
+    legacy: DICT[type, TUPLE[Any, str]] = {}
+    if CURRENT == "3.7":
+        legacy = {
+            kind: (_node_class(cls), field)
+            for kind, (cls, field) in _LEGACY_CONSTANTS.items()
+        }
+
+    def convert(value: Any) -> AST:
+        if isinstance(value, AST):
+            return value
+        if isinstance(value, str):
+            return node.evolve(id=value)
+        if type(value) in legacy:
+            cls, field = legacy[type(value)]
+            return cls(**{field: value})
+        return constant(value=value)
+
+    return convert
+
+
+def _statement(name: str, node: AST) -> Callable[[Any], AST]:
+    stmt = _node_class("stmt")
+    expression = _expression(name, node.value)
+
+    def convert(value: Any) -> AST:
+        if isinstance(value, stmt):
+            return value
+        return node.evolve(value=expression(value))
+
+    return convert
+
+
+def _argument(name: str, node: AST) -> Callable[[Any], AST]:
+    def convert(value: Any) -> AST:
+        if isinstance(value, str):
+            return node.evolve(arg=value)
+        if isinstance(value, AST):
+            return value
+        raise TypeError(f"${name} takes a str or an arg node, got {value!r}")
+
+    return convert
+
+
+def _find_holes(node: AST, path: Path, found: LIST[TUPLE[Path, _Hole]]) -> None:
+    name_cls, expr_cls, arg_cls = (_node_class(n) for n in ("Name", "Expr", "arg"))
+
+    def visit(value: Any, path: Path, field: str, in_list: bool) -> None:
+        if isinstance(value, str):
+            name = _hole_name(value)
+            if name is not None:
+                found.append((path, _Hole(name, _identifier(name), True)))
+
+        elif isinstance(value, list):
+            for idx, el in enumerate(value):
+                visit(el, path + (idx,), field, True)
+
+        elif isinstance(value, name_cls) and _hole_name(value.id):
+            name = _hole_name(value.id)
+            found.append((path, _Hole(name, _expression(name, value), True)))
+
+        elif (
+            in_list
+            and isinstance(value, expr_cls)
+            and isinstance(value.value, name_cls)
+            and _hole_name(value.value.id)
+        ):
+            name = _hole_name(value.value.id)
+            found.append((path, _Hole(name, _statement(name, value), True)))
+
+        elif isinstance(value, arg_cls) and _hole_name(value.arg):
+            name = _hole_name(value.arg)
+            # keyword-only arguments are paired with their defaults
+            splice = field != "kwonlyargs"
+            found.append((path, _Hole(name, _argument(name, value), splice)))
+
+        elif isinstance(value, AST):
+            for sub in _field_names(type(value)):
+                visit(getattr(value, sub), path + (sub,), sub, False)
+
+    for sub in _field_names(type(node)):
+        visit(getattr(node, sub), path + (sub,), sub, False)
+
+
+class _Step:
+    """The fields to rebuild in a node: ``(field, entry)`` where *entry* is a
+    hole, a step, or for a list ``{index: hole or step}``."""
+
+    __slots__ = ("fields",)
+
+    def __init__(self):
+        self.fields: DICT[str, Any] = {}
+
+
+def _plan(holes: LIST[TUPLE[Path, _Hole]]) -> _Step:
+    root = _Step()
+
+    for path, hole in holes:
+        step = root
+        steps = _split(path)
+        for idx, (field, index) in enumerate(steps):
+            last = idx == len(steps) - 1
+
+            if index is None:
+                entry = step.fields.get(field)
+                if last:
+                    step.fields[field] = hole
+                    break
+                if entry is None:
+                    entry = step.fields[field] = _Step()
+                step = entry
+
+            else:
+                entries = step.fields.setdefault(field, {})
+                if last:
+                    entries[index] = hole
+                    break
+                if index not in entries:
+                    entries[index] = _Step()
+                step = entries[index]
+
+    return root
+
+
+def _fields_getter(cls: type) -> Callable[[AST], DICT[str, Any]]:
+    names = _field_names(cls)
+    getter = attrgetter(*names) if names else (lambda node: ())
+    if len(names) == 1:
+        return lambda node: {names[0]: getter(node)}
+
+    return lambda node: dict(zip(names, getter(node)))
+
+
+_GETTERS: DICT[type, Callable[[AST], DICT[str, Any]]] = {}
+
+
+def _build(node: AST, step: _Step, values: DICT[str, Any]) -> AST:
+    cls = type(node)
+    try:
+        kwargs = _GETTERS[cls](node)
+    except KeyError:
+        kwargs = _GETTERS.setdefault(cls, _fields_getter(cls))(node)
+
+    for field, entry in step.fields.items():
+        if type(entry) is dict:
+            items: LIST[Any] = []
+            for idx, el in enumerate(kwargs[field]):
+                sub = entry.get(idx)
+                if sub is None:
+                    items.append(el)
+                elif type(sub) is _Hole:
+                    items.extend(sub.many(values[sub.name]))
+                else:
+                    items.append(_build(el, sub, values))
+            kwargs[field] = items
+
+        elif type(entry) is _Hole:
+            kwargs[field] = entry.one(values[entry.name])
+
+        else:
+            kwargs[field] = _build(kwargs[field], entry, values)
+
+    return cls(**kwargs)
+
+
+class Template:
+    """A parsed source with ``$name`` placeholders, see :func:`template`."""
+
+    __slots__ = ("tree", "mode", "placeholders", "_plan")
+
+    def __init__(self, tree: AST, mode: str):
+        holes: LIST[TUPLE[Path, _Hole]] = []
+        _find_holes(tree, (), holes)
+
+        self.tree = tree
+        self.mode = mode
+        self.placeholders = tuple(dict.fromkeys(hole.name for _, hole in holes))
+        self._plan = _plan(holes)
+
+    def __repr__(self):
+        return f"Template(placeholders={self.placeholders!r}, mode={self.mode!r})"
+
+    def substitute(self, **values: Any) -> AST:
+        """Return the tree with every placeholder replaced by *values*."""
+
+        missing = [name for name in self.placeholders if name not in values]
+        if missing:
+            raise KeyError(f"no value for {', '.join('$' + n for n in missing)}")
+
+        unknown = [name for name in values if name not in self.placeholders]
+        if unknown:
+            raise TypeError(f"no placeholder {', '.join('$' + n for n in unknown)}")
+
+        tree = _build(self.tree, self._plan, values)
+
+        return tree.body if self.mode == "eval" else tree
+
+
+@functools.lru_cache(maxsize=256)
+def template(source: str, mode: str = "exec") -> Template:
+    """Parse *source* with ``$name`` placeholders into a cached :class:`Template`.
+
+    A placeholder can stand for an expression, a statement, a function
+    argument or an identifier (a name being defined, an attribute, a keyword,
+    an imported module, a whole string literal). Its value in
+    :meth:`Template.substitute` is, depending on where it stands:
+
+    * a node, which replaces the placeholder node,
+    * a ``str``, which is used as the identifier (``Name.id``, ``arg.arg``),
+    * any other value, which becomes a ``Constant`` in expressions (``Num``,
+      ``Bytes`` ... in 3.7, as parsed there),
+    * a list, spliced into the enclosing list (statements, arguments,
+      elements), or ``None``, which removes the placeholder from it.
+
+    ``$$`` stands for a literal ``$``. With *mode* ``"eval"``, *source* is
+    an expression, and ``substitute`` returns the expression node.
+
+    >>> tpl = template("def $name($args):\\n    return $value")
+    >>> tpl.placeholders
+    ('name', 'args', 'value')
+    >>> from asttrs import BinOp, Add, Name, Load, Constant
+    >>> value = BinOp(left=Name(id="a", ctx=Load()), op=Add(), right=Constant(value=1))
+    >>> tpl.substitute(name="inc", args=["a"], value=value).show()
+    def inc(a):
+        return a + 1
+    >>> template("$x * 2", mode="eval").substitute(x=21).to_source().strip()
+    '21 * 2'
+    """
+
+    if mode not in ("exec", "eval"):
+        raise ValueError(f"mode must be 'exec' or 'eval', not {mode!r}")
+
+    code = _PLACEHOLDER.sub(
+        lambda m: "$" if m.group(1) == "$" else _PREFIX + m.group(1), source
+    )
+
+    root = AST.from_ast(_ast.parse(code, mode=mode))
+
+    return Template(root, mode)
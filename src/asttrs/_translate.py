@@ -0,0 +1,304 @@
+"""
+Translation of trees between the node schemas of Python versions.
+
+Every ``_py3_*`` module holds the node classes of one Python version, and they
+differ: ``Num`` / ``Str`` ... became ``Constant`` in 3.8, subscripts lost
+``Index`` and ``ExtSlice`` in 3.9, ``Match`` came in 3.10, ``TryStar`` in 3.11,
+``type_params`` in 3.12, and fields like ``type_comment`` come and go.
+
+:func:`translate` rebuilds a tree with the classes of another version. Which
+fields each class has, is optional or a list, is read from ``_schemas.json``,
+the table ``invoke schemas`` generates from those modules; what the grammar
+alone cannot tell, such as ``Num(n=1)`` being ``Constant(value=1)``, is given
+by the few rules below. A tree unpickled from another interpreter, say, can be
+used on this one without parsing its source again.
+"""
+
+import functools
+import json
+import os
+from typing import Any, Callable
+from typing import Dict as DICT
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+
+from ._base import AST
+from ._versions import CURRENT, load, normalize, version_of
+
+# fields that carry no meaning for the compiler, dropped where they do not exist
+_LOSSY = frozenset({"type_comment", "type_ignores", "kind"})
+
+# the value of a field when unset: None, or 0 as the generated classes default
+# ``int`` fields to, which ``compile()`` rejects for ``conversion``
+_UNSET_DEFAULTS = {("FormattedValue", "conversion"): -1}
+
+# the classes 3.7 parses constants to, by the type of the value, and their field
+_LEGACY_CONSTANTS = {
+    bool: ("NameConstant", "value"),
+    type(None): ("NameConstant", "value"),
+    int: ("Num", "n"),
+    float: ("Num", "n"),
+    complex: ("Num", "n"),
+    str: ("Str", "s"),
+    bytes: ("Bytes", "s"),
+}
+
+Rule = Callable[[AST], Any]
+
+
+class TranslationError(ValueError):
+    """A node, or a field value, has no equivalent in the target version."""
+
+
+@functools.lru_cache(maxsize=None)
+def _table() -> DICT[str, DICT[str, Any]]:
+    path = os.path.join(os.path.dirname(__file__), "_schemas.json")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _key(version: str) -> TUPLE[int, ...]:
+    return tuple(int(part) for part in version.split("."))
+
+
+def _source_version(tree: AST) -> str:
+    module = type(tree).__module__
+
+    version = version_of(module)
+    if version is not None:
+        return version
+
+    if module == "asttrs._ast":
+        return CURRENT
+
+    raise TranslationError(
+        f"cannot tell the version of {type(tree).__name__} from {module!r},"
+        " pass source="
+    )
+
+
+class _Translator:
+    """Rebuild nodes of the *source* schema with the classes of *target*;
+    one rule per source class, made on first use."""
+
+    def __init__(self, source: str, target: str):
+        self.source = source
+        self.target = target
+        self.module = load(target)
+        self.src = _table()[source]
+        self.dst = _table()[target]
+        self.rules: DICT[str, Rule] = {"Comment": lambda node: node}
+
+        # subscripts take an ``Index`` / ``Slice`` / ``ExtSlice`` up to 3.8
+        self.index = _key(target) < (3, 9) <= _key(source)
+        # and constants are ``Num`` / ``Str`` ... in 3.7
+        self.legacy = _key(target) < (3, 8) <= _key(source)
+
+    def __call__(self, value: Any) -> Any:
+        if type(value) is list:
+            return [self(el) for el in value]
+
+        if isinstance(value, AST):
+            name = type(value).__name__
+            rule = self.rules.get(name)
+            if rule is None:
+                rule = self.rules[name] = self._rule(name)
+            return rule(value)
+
+        return value
+
+    def _cls(self, name: str) -> Any:
+        return getattr(self.module, name)
+
+    def _rule(self, name: str) -> Rule:
+        if name not in self.src:
+            raise TranslationError(f"{name} is not a node of Python {self.source}")
+
+        if name == "Constant" and self.legacy:
+            return self._legacy_constant()
+
+        if name in self.dst:
+            return self._fields_rule(name)
+
+        special = getattr(self, f"_rule_{name}", None)
+        if special is not None:
+            return special()
+
+        def missing(node: AST) -> Any:
+            raise TranslationError(f"{name} has no equivalent in Python {self.target}")
+
+        return missing
+
+    def _fields_rule(self, name: str) -> Rule:
+        cls = self._cls(name)
+        src_fields = {fd[0]: fd for fd in self.src[name]["fields"]}
+        dst_fields = self.dst[name]["fields"]
+
+        dropped = [fd for fd in src_fields if fd not in {d[0] for d in dst_fields}]
+        strict = [fd for fd in dropped if fd not in _LOSSY]
+
+        copied: LIST[TUPLE[str, Callable[[Any], Any]]] = []
+        defaults: LIST[TUPLE[str, bool]] = []
+        for field, _, seq, optional in dst_fields:
+            if field not in src_fields:
+                if not (seq or optional):
+                    raise TranslationError(
+                        f"{name}.{field} of Python {self.target} has no value"
+                        f" in Python {self.source}"
+                    )
+                defaults.append((field, seq))
+                continue
+
+            convert: Callable[[Any], Any] = self
+            if self.index and (name, field) == ("Subscript", "slice"):
+                convert = self._index
+
+            fallback = _UNSET_DEFAULTS.get((name, field))
+            if fallback is not None:
+                convert = functools.partial(_or_default, fallback, convert)
+
+            copied.append((field, convert))
+
+        def rule(node: AST) -> AST:
+            for field in strict:
+                if getattr(node, field) not in (None, []):
+                    raise TranslationError(
+                        f"{name}.{field} has no equivalent in Python {self.target}"
+                    )
+
+            kwargs = {field: convert(getattr(node, field)) for field, convert in copied}
+            for field, seq in defaults:
+                kwargs[field] = [] if seq else None
+
+            return cls(**kwargs)
+
+        return rule
+
+    def _index(self, value: Any) -> Any:
+        value = self(value)
+        slice_cls = self._cls("Slice")
+
+        if isinstance(value, slice_cls):
+            return value
+
+        if type(value).__name__ == "Tuple" and any(
+            isinstance(el, slice_cls) for el in value.elts
+        ):
+            index = self._cls("Index")
+            dims = [
+                el if isinstance(el, slice_cls) else index(value=el)
+                for el in value.elts
+            ]
+            return self._cls("ExtSlice")(dims=dims)
+
+        return self._cls("Index")(value=value)
+
+    # the rules of the classes the target version does not have
+
+    def _constant(self, attribute: Optional[str]) -> Rule:
+        constant = self._cls("Constant")
+        fields = {fd[0] for fd in self.dst["Constant"]["fields"]}
+        kind = {"kind": None} if "kind" in fields else {}
+
+        def rule(node: AST) -> AST:
+            value = ... if attribute is None else getattr(node, attribute)
+            return constant(value=value, **kind)
+
+        return rule
+
+    def _legacy_constant(self) -> Rule:
+        constant, ellipsis = self._cls("Constant"), self._cls("Ellipsis")
+        classes = {
+            kind: (self._cls(name), field)
+            for kind, (name, field) in _LEGACY_CONSTANTS.items()
+        }
+
+        def rule(node: AST) -> AST:
+            value = node.value
+            if value is ...:
+                return ellipsis()
+
+            found = classes.get(type(value))
+            if found is None:  # tuples and frozensets, folded by the optimizer
+                return constant(value=value)
+
+            cls, field = found
+            return cls(**{field: value})
+
+        return rule
+
+    def _rule_Num(self) -> Rule:
+        return self._constant("n")
+
+    def _rule_Str(self) -> Rule:
+        return self._constant("s")
+
+    _rule_Bytes = _rule_Str
+
+    def _rule_NameConstant(self) -> Rule:
+        return self._constant("value")
+
+    def _rule_Ellipsis(self) -> Rule:
+        return self._constant(None)
+
+    def _rule_Index(self) -> Rule:
+        return lambda node: self(node.value)
+
+    def _rule_ExtSlice(self) -> Rule:
+        tuple_cls, load = self._cls("Tuple"), self._cls("Load")
+        return lambda node: tuple_cls(elts=self(node.dims), ctx=load())
+
+    def _rule_AugLoad(self) -> Rule:
+        load = self._cls("Load")
+        return lambda node: load()
+
+    def _rule_AugStore(self) -> Rule:
+        store = self._cls("Store")
+        return lambda node: store()
+
+    _rule_Param = _rule_AugStore
+
+
+def _or_default(default: Any, convert: Callable[[Any], Any], value: Any) -> Any:
+    return default if value is None or value == 0 else convert(value)
+
+
+_TRANSLATORS: DICT[TUPLE[str, str], _Translator] = {}
+
+
+def translate(tree: AST, version: Any = None, source: Any = None) -> AST:
+    """Return *tree* built with the node classes of Python *version* instead.
+
+    *version* is like ``"3.8"`` or ``(3, 8)``, the running interpreter's by
+    default, and *source* the version of *tree*, told by its classes unless
+    given. Fields that do not exist in *version* are dropped if empty (or
+    only a type comment); otherwise, and for nodes that have no equivalent
+    (``Match`` before 3.10 ...), :class:`TranslationError` is raised.
+
+    >>> from asttrs import _py3_7 as py37
+    >>> tree = py37.Expression(body=py37.Num(n=42))
+    >>> translate(tree, "3.8").body
+    Constant(value=42, kind=None)
+    >>> from asttrs import Module
+    >>> tree = Module.from_source("x[1:2, 3]")
+    >>> translate(tree, "3.8").body[0].value.slice.dims[1]
+    Index(value=Constant(value=3, kind=None))
+    >>> translate(translate(tree, "3.8")) == tree
+    True
+    """
+
+    target = CURRENT if version is None else normalize(version)
+    origin = _source_version(tree) if source is None else normalize(source)
+
+    translator = _TRANSLATORS.get((origin, target))
+    if translator is None:
+        translator = _TRANSLATORS[origin, target] = _Translator(origin, target)
+
+    # already built with the classes of that version
+    if origin == target and type(tree) is getattr(
+        translator.module, type(tree).__name__, None
+    ):
+        return tree
+
+    return translator(tree)
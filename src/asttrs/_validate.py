@@ -0,0 +1,383 @@
+"""
+Field validation of asttrs nodes, opt-in.
+
+The node classes accept any value in any field, so that a ``FunctionDef`` with
+an expression in its body only fails once ``to_ast()`` or ``compile`` runs.
+A validator is compiled per class, on first use, from the generated field
+annotations (``"expr"``, ``LIST["stmt"]``, ``"identifier"``, ...); it is
+run over a whole tree by :func:`validate`, or on every node constructed while
+a :class:`StrictMode` is enabled.
+"""
+
+import builtins
+import functools
+from typing import Any, Callable
+from typing import Dict as DICT
+from typing import List as LIST
+from typing import Optional
+from typing import Tuple as TUPLE
+from typing import Union
+
+import attr
+
+from ._base import AST
+from ._cursor import Cursor, Path
+from ._walk import _lookup, _subclasses
+
+# the ASDL builtin types, as named in the annotations; ``None`` checks nothing
+_BUILTINS: DICT[str, Any] = {
+    "identifier": str,
+    "string": str,
+    "int": int,
+    "bytes": bytes,
+    "object": None,
+    "singleton": (bool, type(None)),
+}
+
+_CONSTANT = "constant"
+_CONSTANTS = frozenset(
+    (int, float, complex, str, bytes, bool, type(None), type(Ellipsis))
+)
+
+# the lists where ``None`` stands for a missing element: ``{**d}`` and
+# keyword-only arguments without a default
+_NULLABLE_ITEMS = frozenset({("Dict", "keys"), ("arguments", "kw_defaults")})
+
+Check = Callable[[AST, Any, Any], None]
+
+
+def _constant(value: Any) -> bool:
+    if type(value) in _CONSTANTS:
+        return True
+
+    if type(value) in (tuple, frozenset):
+        return all(_constant(el) for el in value)
+
+    return False
+
+
+class ValidationError(TypeError):
+    """A field of *node* holds a *value* of the wrong type.
+
+    *index* is the position of the offending element in a list field, and
+    *path* the position of *node* in the validated tree, as a :class:`Cursor`
+    path, when known.
+    """
+
+    def __init__(
+        self,
+        node: Any,
+        field: Optional[str],
+        expected: str,
+        value: Any,
+        index: Optional[int] = None,
+    ):
+        super().__init__(node, field, expected, value, index)
+        self.node = node
+        self.field = field
+        self.expected = expected
+        self.value = value
+        self.index = index
+        self.path: Optional[Path] = None
+
+    def __str__(self) -> str:
+        where = type(self.node).__name__
+        if self.field is not None:
+            where += f".{self.field}"
+        if self.index is not None:
+            where += f"[{self.index}]"
+        if self.path:
+            where += f" at {_format_path(self.path)}"
+
+        return f"{where}: expected {self.expected}, got {_describe(self.value)}"
+
+
+def _format_path(path: Path) -> str:
+    return "".join(f"[{el}]" if isinstance(el, int) else f".{el}" for el in path)[1:]
+
+
+def _describe(value: Any) -> str:
+    if isinstance(value, AST):
+        return type(value).__name__
+
+    text = repr(value)
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+def _fail(node: AST, field: str, expected: str, value: Any) -> None:
+    raise ValidationError(node, field, expected, value)
+
+
+def _fail_item(node: AST, field: str, expected: str, items: LIST[Any], item: Any):
+    index = next(idx for idx, el in enumerate(items) if el is item)
+    raise ValidationError(node, field, expected, item, index)
+
+
+def _resolve(cls: type, ann: Any) -> TUPLE[bool, Any, str]:
+    """Return ``(is_seq, types, expected)`` for one field annotation, *types*
+    being a type or a tuple of them, ``None`` for any value, or ``"constant"``."""
+
+    if isinstance(ann, str):
+        if ann in _BUILTINS:
+            return False, _BUILTINS[ann], ann
+
+        if ann == _CONSTANT:
+            return False, _CONSTANT, ann
+
+        target = _lookup(cls, ann)
+        if target is None:
+            target = getattr(builtins, ann, None)
+        if isinstance(target, type):
+            return False, target, ann
+
+        return False, None, ann
+
+    forward = getattr(ann, "__forward_arg__", None)
+    if forward is not None:
+        return _resolve(cls, forward)
+
+    if isinstance(ann, type):
+        return False, ann, ann.__name__
+
+    origin = getattr(ann, "__origin__", None)
+    args = getattr(ann, "__args__", None) or ()
+
+    if origin is list:
+        if not args:
+            return True, None, "any"
+
+        _, types, expected = _resolve(cls, args[0])
+        return True, types, expected
+
+    if origin is Union:
+        resolved = [_resolve(cls, arg) for arg in args if arg is not type(None)]
+        if len(resolved) == 1:
+            return resolved[0]
+
+        types = tuple(types for _, types, _ in resolved)
+        if any(not isinstance(t, type) for t in types):
+            return False, None, "any"
+
+        return False, types, " or ".join(expected for _, _, expected in resolved)
+
+    return False, None, "any"
+
+
+def _may_hold_nodes(types: Any) -> bool:
+    if types is None:
+        return True
+
+    if isinstance(types, tuple):
+        return any(_may_hold_nodes(t) for t in types)
+
+    return isinstance(types, type) and (issubclass(types, AST) or types is object)
+
+
+def _test(types: Any, name: str, var: str) -> str:
+    """The condition, on *var*, of a value not matching *types*."""
+
+    if types is None:
+        return "False"
+
+    if types == _CONSTANT:
+        return f"{var}.__class__ not in _CONSTANTS and not _constant({var})"
+
+    return f"not isinstance({var}, {name})"
+
+
+def _source(cls: type, deep: bool) -> TUPLE[str, DICT[str, Any]]:
+    namespace: DICT[str, Any] = {
+        "_fail": _fail,
+        "_fail_item": _fail_item,
+        "_constant": _constant,
+        "_CONSTANTS": _CONSTANTS,
+        "AST": AST,
+    }
+    lines = ["def check(node, push, extend):"]
+
+    for idx, fd in enumerate(attr.fields(cls) if attr.has(cls) else ()):
+        is_seq, types, expected = _resolve(cls, fd.type)
+        optional = not is_seq and fd.default is not attr.NOTHING
+        nodes = deep and _may_hold_nodes(types)
+
+        name = f"t{idx}"
+        namespace[name] = types
+
+        lines.append(f"    value = node.{fd.name}")
+
+        if is_seq:
+            nullable = (cls.__name__, fd.name) in _NULLABLE_ITEMS
+            test = _test(types, name, "el")
+            if nullable and test != "False":
+                test = f"el is not None and {test}"
+
+            lines.append("    if value.__class__ is not list:")
+            lines.append(
+                f"        _fail(node, {fd.name!r}, 'list of {expected}', value)"
+            )
+            if test != "False":
+                lines.append("    for el in value:")
+                lines.append(f"        if {test}:")
+                lines.append(
+                    f"            _fail_item(node, {fd.name!r}, {expected!r}, value, el)"
+                )
+            if nodes:
+                if nullable or types is None:
+                    lines.append(
+                        "    extend([el for el in value if isinstance(el, AST)])"
+                    )
+                else:
+                    lines.append("    extend(value)")
+
+        else:
+            test = _test(types, name, "value")
+            if optional and test != "False":
+                test = f"value is not None and {test}"
+            if test != "False":
+                lines.append(f"    if {test}:")
+                lines.append(f"        _fail(node, {fd.name!r}, {expected!r}, value)")
+            if nodes:
+                if optional or types is None:
+                    lines.append("    if isinstance(value, AST):")
+                    lines.append("        push(value)")
+                else:
+                    lines.append("    push(value)")
+
+    if len(lines) == 1:
+        lines.append("    pass")
+
+    return "\n".join(lines) + "\n", namespace
+
+
+# node class -> validator of its own fields / pushing its child nodes as well
+_SHALLOW: DICT[type, Check] = {}
+_DEEP: DICT[type, Check] = {}
+
+
+def _checker(cls: type, deep: bool) -> Check:
+    cache = _DEEP if deep else _SHALLOW
+
+    check = cache.get(cls)
+    if check is None:
+        source, namespace = _source(cls, deep)
+        exec(
+            compile(source, f"<asttrs validator {cls.__qualname__}>", "exec"),
+            namespace,
+        )
+        check = cache[cls] = namespace["check"]
+
+    return check
+
+
+def validate(tree: AST) -> None:
+    """Check every field of every node in *tree* against its annotation.
+
+    Raise :class:`ValidationError` on the first mismatch found, with its
+    ``path`` in *tree*.
+
+    >>> from asttrs import Module, FunctionDef, arguments, Constant
+    >>> func = FunctionDef(name="f", args=arguments(), body=[Constant(value=1)])
+    >>> validate(Module(body=[func]))
+    Traceback (most recent call last):
+      ...
+    asttrs._validate.ValidationError: FunctionDef.body[0] at body[0]: expected stmt, got Constant
+    >>> validate(Module.from_source("def f():\\n    return 1"))
+    """
+
+    if not isinstance(tree, AST):
+        raise ValidationError(None, None, "an asttrs node", tree)
+
+    stack: LIST[AST] = [tree]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    checks = _DEEP
+
+    try:
+        while stack:
+            node = pop()
+            check = checks.get(node.__class__)
+            if check is None:
+                check = _checker(node.__class__, True)
+            check(node, push, extend)
+
+    except ValidationError as exc:
+        cursor = Cursor.locate(tree, exc.node)
+        exc.path = cursor.path if cursor is not None else None
+        raise
+
+    return None
+
+
+def _wrap_init(init: Callable[..., None]) -> Callable[..., None]:
+    @functools.wraps(init)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+
+        check = _SHALLOW.get(self.__class__)
+        if check is None:
+            check = _checker(self.__class__, False)
+        check(self, None, None)
+
+    __init__._asttrs_strict = True  # type: ignore
+    return __init__
+
+
+class StrictMode:
+    """Validate the fields of every node as it is constructed, while enabled.
+
+    Every node class constructor, ``evolve`` and ``from_ast`` included, raises
+    :class:`ValidationError` on a mismatch. Enabling is process-wide and
+    nests: the checks are removed once every enabled instance is disabled.
+    Classes defined while enabled are not checked. ``ASTTRS_STRICT=1``
+    enables it when the node classes are loaded.
+
+    >>> from asttrs import Return, Pass
+    >>> with StrictMode():
+    ...     Return(value=Pass())
+    Traceback (most recent call last):
+      ...
+    asttrs._validate.ValidationError: Return.value: expected expr, got Pass
+    """
+
+    _depth = 0
+    _saved: LIST[TUPLE[type, Any]] = []
+
+    def __init__(self):
+        self._enabled = False
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self) -> "StrictMode":
+        if self._enabled:
+            return self
+
+        self._enabled = True
+        StrictMode._depth += 1
+        if StrictMode._depth == 1:
+            from . import _ast  # noqa: F401  (loads the node classes)
+
+            for cls in _subclasses(AST) - {AST}:
+                init = cls.__dict__.get("__init__")
+                if init is not None and not getattr(init, "_asttrs_strict", False):
+                    StrictMode._saved.append((cls, init))
+                    cls.__init__ = _wrap_init(init)
+
+        return self
+
+    def disable(self) -> None:
+        if not self._enabled:
+            return
+
+        self._enabled = False
+        StrictMode._depth -= 1
+        if not StrictMode._depth:
+            while StrictMode._saved:
+                cls, init = StrictMode._saved.pop()
+                cls.__init__ = init
+
+    def __enter__(self) -> "StrictMode":
+        return self.enable()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.disable()
@@ -0,0 +1,88 @@
+"""
+The node modules of every supported Python version, and which one is whose.
+
+``_py3_<minor>`` holds the attrs classes generated from the grammar of that
+version, ``_py3_<minor>_aot`` the same classes written out ahead of time.
+``asttrs`` itself exposes those of the running interpreter; the others are only
+imported when asked for, by ``asttrs.v3_<minor>`` or :func:`asttrs.translate`.
+"""
+
+import os
+import re
+import sys
+from typing import Any
+from typing import Dict as DICT
+from typing import Optional
+
+VERSIONS = ("3.7", "3.8", "3.9", "3.10", "3.11", "3.12")
+
+# the schema of the running interpreter, the closest one outside that range
+CURRENT = "%d.%d" % min(max(sys.version_info[:2], (3, 7)), (3, 12))
+
+# The ahead-of-time generated classes are used unless ASTTRS_AOT=0, which
+# falls back to the attrs-decorated ones.
+AOT = os.environ.get("ASTTRS_AOT", "1") != "0"
+
+_MODULE = re.compile(r"asttrs\._py(\d+)_(\d+)(?:_aot)?$")
+
+
+def normalize(value: Any) -> str:
+    """``"3.8"`` for ``"3.8"``, ``"3_8"``, ``(3, 8)`` or a ``sys.version_info``."""
+
+    if isinstance(value, str):
+        text = value.replace("_", ".")
+    else:
+        text = "%d.%d" % tuple(value[:2])
+
+    if text not in VERSIONS:
+        raise ValueError(f"no schema for Python {text}, only {', '.join(VERSIONS)}")
+
+    return text
+
+
+def module_name(version: str) -> str:
+    name = "asttrs._py" + version.replace(".", "_")
+
+    return name + "_aot" if AOT else name
+
+
+def load(version: str) -> Any:
+    name = module_name(version)
+    __import__(name)
+
+    return sys.modules[name]
+
+
+def export(namespace: DICT[str, Any], version: str) -> None:
+    """Fill the namespace of ``asttrs.v3_<minor>`` with the node classes."""
+
+    namespace.update(
+        (name, value)
+        for name, value in vars(load(version)).items()
+        if not name.startswith("_")
+    )
+
+
+_VERSION_OF: DICT[str, Optional[str]] = {}
+
+
+def version_of(module: str) -> Optional[str]:
+    """The version of the node classes defined in *module*, ``None`` if it
+    is not a ``_py3_*`` module."""
+
+    try:
+        return _VERSION_OF[module]
+
+    except KeyError:
+        found = _MODULE.match(module)
+        version = f"{found.group(1)}.{found.group(2)}" if found else None
+        return _VERSION_OF.setdefault(module, version)
+
+
+def foreign(cls: type) -> Optional[str]:
+    """The version of *cls* if it is a node class of another version than the
+    running one, else ``None``."""
+
+    version = version_of(cls.__module__)
+
+    return version if version != CURRENT else None
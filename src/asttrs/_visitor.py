@@ -0,0 +1,144 @@
+"""
+``NodeVisitor`` / ``NodeTransformer`` for asttrs trees, mirroring the classes
+of the same name in ``ast``.
+
+Since asttrs nodes are frozen, ``NodeTransformer`` never mutates: a subtree
+that no ``visit_*`` method changed is returned as the very same object, and
+only the nodes on the path to a change are rebuilt.
+"""
+
+from typing import Any, Callable
+from typing import Dict as DICT
+from typing import List as LIST
+
+from ._base import AST
+from ._walk import _CHILD_FIELDS, child_fields
+
+
+class NodeVisitor:
+    """Walk a tree and call ``visit_<ClassName>`` for every node found.
+
+    Methods are looked up once per (visitor class, node class) pair, falling
+    back to :meth:`generic_visit`, which visits the children of a node.
+    """
+
+    _visit_table: DICT[type, Callable[["NodeVisitor", AST], Any]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._visit_table = {}
+
+    @classmethod
+    def _resolve(cls, node_cls: type) -> Callable[["NodeVisitor", AST], Any]:
+        method = getattr(cls, "visit_" + node_cls.__name__, None)
+        if method is None:
+            method = cls.generic_visit
+
+        cls._visit_table[node_cls] = method
+
+        return method
+
+    def visit(self, node: AST) -> Any:
+        """Visit a node."""
+
+        cls = type(node)
+
+        try:
+            method = self._visit_table[cls]
+        except KeyError:
+            method = self._resolve(cls)
+
+        return method(self, node)
+
+    def generic_visit(self, node: AST) -> Any:
+        """Called if no explicit visitor function exists for a node."""
+
+        cls = type(node)
+
+        try:
+            fields = _CHILD_FIELDS[cls]
+        except KeyError:
+            fields = child_fields(cls)
+
+        for name, _ in fields:
+            value = getattr(node, name)
+
+            if isinstance(value, list):
+                for el in value:
+                    if isinstance(el, AST):
+                        self.visit(el)
+
+            elif isinstance(value, AST):
+                self.visit(value)
+
+
+class NodeTransformer(NodeVisitor):
+    """A :class:`NodeVisitor` that rebuilds the tree from the return values.
+
+    As with ``ast.NodeTransformer``, returning ``None`` from a ``visit_*``
+    method removes the node, and returning a list splices several nodes into
+    a list field. Returning the node unchanged keeps the original subtree, so
+    transforming a tree costs roughly the size of the changed region.
+
+    >>> from asttrs import Constant, Module
+    >>> class Double(NodeTransformer):
+    ...     def visit_Constant(self, node):
+    ...         return node.evolve(value=node.value * 2)
+    >>> tree = Module.from_source("x = 21\\ny = x")
+    >>> new = Double().visit(tree)
+    >>> new.show()
+    x = 42
+    y = x
+    >>> new.body[1] is tree.body[1]
+    True
+    """
+
+    def generic_visit(self, node: AST) -> AST:
+        cls = type(node)
+
+        try:
+            fields = _CHILD_FIELDS[cls]
+        except KeyError:
+            fields = child_fields(cls)
+
+        changes = {}
+
+        for name, _ in fields:
+            old = getattr(node, name)
+
+            if isinstance(old, list):
+                values = self._visit_list(old)
+                if values is not old:
+                    changes[name] = values
+
+            elif isinstance(old, AST):
+                new = self.visit(old)
+                if new is not old:
+                    changes[name] = new
+
+        return node.evolve(**changes) if changes else node
+
+    def _visit_list(self, old: LIST[Any]) -> LIST[Any]:
+        values = None
+
+        for idx, el in enumerate(old):
+            new = self.visit(el) if isinstance(el, AST) else el
+
+            if new is el:
+                if values is not None:
+                    values.append(el)
+                continue
+
+            if values is None:
+                values = old[:idx]
+
+            if new is None:
+                continue
+
+            elif isinstance(new, list):
+                values.extend(new)
+
+            else:
+                values.append(new)
+
+        return old if values is None else values
@@ -0,0 +1,298 @@
+"""
+Traversal helpers over asttrs nodes, the counterparts of ``ast.iter_fields``,
+``ast.iter_child_nodes`` and ``ast.walk``.
+
+Child-bearing fields are looked up once per class from the generated type
+annotations (``"expr"``, ``LIST["stmt"]``, ...), so scalar fields such as
+``identifier`` or ``constant`` are never visited.
+"""
+
+import builtins
+import sys
+from typing import Any
+from typing import Dict as DICT
+from typing import FrozenSet, Iterator, Optional
+from typing import Tuple as TUPLE
+from typing import Type, Union
+
+import attr
+
+from ._base import AST
+
+_ChildField = TUPLE[str, bool]
+
+# ``None`` as a target set means "any node class may show up here".
+_Targets = Optional[FrozenSet[type]]
+
+_SCALAR = (False, False, frozenset())
+
+_FIELD_NAMES: DICT[type, TUPLE[str, ...]] = {}
+_CHILD_FIELDS: DICT[type, TUPLE[_ChildField, ...]] = {}
+_FIELD_TARGETS: DICT[type, DICT[str, _Targets]] = {}
+_REACHABLE: DICT[type, _Targets] = {}
+_MAY_CONTAIN: DICT[TUPLE[type, TUPLE[type, ...]], bool] = {}
+_WALK_TABLES: DICT[Optional[TUPLE[type, ...]], DICT[type, Any]] = {}
+
+
+def _lookup(cls: type, name: str) -> Any:
+    """Return what *name* stands for in the module of *cls*, or of the base
+    class the annotation may come from."""
+
+    for base in cls.__mro__:
+        namespace = vars(sys.modules.get(base.__module__, builtins))
+        if name in namespace:
+            return namespace[name]
+
+    return None
+
+
+def _resolve_annotation(cls: type, ann: Any) -> TUPLE[bool, bool, _Targets]:
+    """Return ``(is_child, is_seq, targets)`` for one field annotation."""
+
+    if isinstance(ann, str):
+        target = _lookup(cls, ann)
+        if target is not None:
+            return _resolve_annotation(cls, target)
+
+        if hasattr(builtins, ann):
+            return _resolve_annotation(cls, getattr(builtins, ann))
+
+        return True, False, None
+
+    forward = getattr(ann, "__forward_arg__", None)
+    if forward is not None:
+        return _resolve_annotation(cls, forward)
+
+    if isinstance(ann, type):
+        if issubclass(ann, AST):
+            return True, False, frozenset([ann])
+
+        return _SCALAR
+
+    if ann is Any or ann is None:
+        return _SCALAR
+
+    origin = getattr(ann, "__origin__", None)
+    args = getattr(ann, "__args__", None) or ()
+
+    if origin in (list, tuple):
+        if not args:
+            return True, True, None
+
+        child, _, targets = _resolve_annotation(cls, args[0])
+        return child, True, targets
+
+    if origin is Union:
+        resolved = [_resolve_annotation(cls, a) for a in args]
+        children = [r for r in resolved if r[0]]
+        if not children:
+            return _SCALAR
+
+        targets: _Targets = frozenset()
+        for _, _, tgt in children:
+            targets = None if (targets is None or tgt is None) else targets | tgt
+
+        return True, any(r[1] for r in children), targets
+
+    return True, False, None
+
+
+def _build_tables(cls: Type[AST]) -> None:
+    fields = attr.fields(cls) if attr.has(cls) else ()
+
+    names = []
+    children = []
+    targets: DICT[str, _Targets] = {}
+
+    for fd in fields:
+        names.append(fd.name)
+        is_child, is_seq, tgt = _resolve_annotation(cls, fd.type)
+        if is_child:
+            children.append((fd.name, is_seq))
+            targets[fd.name] = tgt
+
+    _FIELD_NAMES[cls] = tuple(names)
+    _CHILD_FIELDS[cls] = tuple(children)
+    _FIELD_TARGETS[cls] = targets
+
+
+def field_names(cls: Type[AST]) -> TUPLE[str, ...]:
+    try:
+        return _FIELD_NAMES[cls]
+    except KeyError:
+        _build_tables(cls)
+        return _FIELD_NAMES[cls]
+
+
+def child_fields(cls: Type[AST]) -> TUPLE[_ChildField, ...]:
+    """Return ``(name, is_seq)`` for every field of *cls* that may hold nodes."""
+
+    try:
+        return _CHILD_FIELDS[cls]
+    except KeyError:
+        _build_tables(cls)
+        return _CHILD_FIELDS[cls]
+
+
+def _subclasses(cls: type) -> FrozenSet[type]:
+    found = {cls}
+    todo = [cls]
+    while todo:
+        for sub in todo.pop().__subclasses__():
+            if sub not in found:
+                found.add(sub)
+                todo.append(sub)
+
+    return frozenset(found)
+
+
+def reachable(cls: Type[AST]) -> _Targets:
+    """Return every node class that may appear strictly below an instance of *cls*.
+
+    ``None`` means the annotations could not rule anything out.
+    """
+
+    if cls in _REACHABLE:
+        return _REACHABLE[cls]
+
+    found = set()
+    todo = [cls]
+    seen = {cls}
+
+    while todo:
+        current = todo.pop()
+        child_fields(current)
+
+        for tgt in _FIELD_TARGETS[current].values():
+            if tgt is None:
+                _REACHABLE[cls] = None
+                return None
+
+            for base in tgt:
+                for sub in _subclasses(base):
+                    found.add(sub)
+                    if sub not in seen:
+                        seen.add(sub)
+                        todo.append(sub)
+
+    result = _REACHABLE[cls] = frozenset(found)
+
+    return result
+
+
+def _may_contain(cls: type, types: TUPLE[type, ...]) -> bool:
+    key = (cls, types)
+
+    try:
+        return _MAY_CONTAIN[key]
+    except KeyError:
+        pass
+
+    reach = reachable(cls)
+    result = reach is None or any(issubclass(sub, types) for sub in reach)
+
+    _MAY_CONTAIN[key] = result
+
+    return result
+
+
+def iter_fields(node: AST) -> Iterator[TUPLE[str, Any]]:
+    """Yield ``(name, value)`` for every field of *node*, like ``ast.iter_fields``."""
+
+    for name in field_names(type(node)):
+        yield name, getattr(node, name)
+
+
+def iter_child_nodes(node: AST) -> Iterator[AST]:
+    """Yield the direct child nodes of *node* in field order."""
+
+    for name, _ in child_fields(type(node)):
+        value = getattr(node, name)
+
+        if isinstance(value, list):
+            for el in value:
+                if isinstance(el, AST):
+                    yield el
+
+        elif isinstance(value, AST):
+            yield value
+
+
+def _walk_entry(
+    cls: type, types: Optional[TUPLE[type, ...]]
+) -> TUPLE[bool, TUPLE[_ChildField, ...]]:
+    """Return ``(yield it, fields to enter in reverse order)`` for *cls*."""
+
+    if not (isinstance(cls, type) and issubclass(cls, AST)):
+        return False, ()
+
+    fields = child_fields(cls)
+
+    if types is None:
+        return True, tuple(reversed(fields))
+
+    targets = _FIELD_TARGETS[cls]
+
+    def relevant(name: str) -> bool:
+        if targets[name] is None:
+            return True
+
+        return any(
+            issubclass(sub, types) or _may_contain(sub, types)
+            for base in targets[name]
+            for sub in _subclasses(base)
+        )
+
+    keep = tuple(fd for fd in reversed(fields) if relevant(fd[0]))
+
+    return issubclass(cls, types), keep
+
+
+def walk(
+    node: AST, types: Optional[Union[type, TUPLE[type, ...]]] = None
+) -> Iterator[AST]:
+    """Yield *node* and all its descendants in document (pre-)order.
+
+    When *types* is given only instances of those classes are yielded, and
+    fields that cannot lead to any of them according to the schema
+    annotations are not entered at all.
+
+    >>> from asttrs import Module, Name
+    >>> tree = Module.from_source("x = y + 1")
+    >>> [n.id for n in walk(tree, Name)]
+    ['x', 'y']
+    """
+
+    if types is not None and not isinstance(types, tuple):
+        types = (types,)
+
+    try:
+        table = _WALK_TABLES[types]
+    except KeyError:
+        table = _WALK_TABLES[types] = {}
+
+    stack = [node]
+    pop = stack.pop
+    push = stack.append
+    extend = stack.extend
+
+    while stack:
+        node = pop()
+        cls = type(node)
+
+        try:
+            found, fields = table[cls]
+        except KeyError:
+            found, fields = table[cls] = _walk_entry(cls, types)
+
+        if found:
+            yield node
+
+        for name, is_seq in fields:
+            value = getattr(node, name)
+
+            if is_seq:
+                if value:
+                    extend(reversed(value))
+            else:
+                push(value)
@@ -0,0 +1,207 @@
+"""
+Import graph of a source tree, built from its ``Import`` / ``ImportFrom`` nodes.
+
+Files are parsed in worker processes, and only their import statements are
+converted to asttrs nodes. Results are cached by file content hash, in memory
+and optionally in a JSON file, so a re-run only parses the files that changed.
+"""
+
+import ast as _ast
+import hashlib
+import json
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict as DICT
+from typing import Iterator
+from typing import List as LIST
+from typing import Optional, Set
+from typing import Tuple as TUPLE
+from typing import Union
+
+from ._base import AST
+from ._patch import decode, encode
+
+_CACHE_VERSION = 1
+
+# content hash -> import statements of the file
+_IMPORTS: DICT[str, LIST[AST]] = {}
+
+
+def _import_statements(body: LIST[_ast.stmt]) -> Iterator[_ast.stmt]:
+    # Imports are statements: only statement lists are walked, in order.
+    stack = [iter(body)]
+    while stack:
+        for stmt in stack[-1]:
+            if isinstance(stmt, (_ast.Import, _ast.ImportFrom)):
+                yield stmt
+                continue
+
+            blocks = [getattr(stmt, "body", None)]
+            blocks.extend(h.body for h in getattr(stmt, "handlers", ()))
+            blocks.extend(c.body for c in getattr(stmt, "cases", ()))
+            blocks.append(getattr(stmt, "orelse", None))
+            blocks.append(getattr(stmt, "finalbody", None))
+
+            nested = [s for block in blocks if block for s in block]
+            if nested:
+                stack.append(iter(nested))
+                break
+        else:
+            stack.pop()
+
+
+def scan_imports(source: Union[str, bytes]) -> LIST[AST]:
+    """Return the import statements of *source*, nested ones included.
+
+    >>> nodes = scan_imports("import os\\nif x:\\n    from . import y")
+    >>> [type(n).__name__ for n in nodes]
+    ['Import', 'ImportFrom']
+    """
+
+    if (b"import" if isinstance(source, bytes) else "import") not in source:
+        return []
+
+    try:
+        tree = _ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    return AST.from_ast(list(_import_statements(tree.body)))
+
+
+def _scan_batch(batch: LIST[TUPLE[str, bytes]]) -> LIST[TUPLE[str, LIST[AST]]]:
+    return [(digest, scan_imports(data)) for digest, data in batch]
+
+
+def _module_name(path: pathlib.Path, base: pathlib.Path) -> TUPLE[str, bool]:
+    parts = list(path.relative_to(base).with_suffix("").parts)
+
+    is_package = parts[-1] == "__init__"
+    if is_package:
+        parts.pop()
+
+    return ".".join(parts), is_package
+
+
+def _targets(
+    module: str, is_package: bool, node: AST, known: Set[str]
+) -> Iterator[str]:
+    if type(node).__name__ == "Import":
+        for alias in node.names:
+            yield alias.name
+        return
+
+    if node.level:
+        package = module if is_package else module.rpartition(".")[0]
+        parts = package.split(".") if package else []
+        if node.level > len(parts):
+            # beyond the top-level package
+            return
+
+        base = ".".join(parts[: len(parts) - node.level + 1])
+        target = ".".join(p for p in (base, node.module) if p)
+
+    else:
+        target = node.module or ""
+
+    if not target:
+        return
+
+    # ``from package import module`` imports the submodule
+    found = False
+    for alias in node.names:
+        name = f"{target}.{alias.name}"
+        if name in known:
+            found = True
+            yield name
+
+    if not found:
+        yield target
+
+
+def _load_cache(path: pathlib.Path) -> None:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return
+
+    if data.get("version") != _CACHE_VERSION:
+        return
+
+    for digest, nodes in data.get("files", {}).items():
+        if digest not in _IMPORTS:
+            _IMPORTS[digest] = decode(nodes)
+
+
+def _save_cache(path: pathlib.Path, digests: Set[str]) -> None:
+    files = {digest: encode(_IMPORTS[digest]) for digest in sorted(digests)}
+    path.write_text(json.dumps({"version": _CACHE_VERSION, "files": files}))
+
+
+def build_graph(
+    root_dir: Union[str, os.PathLike],
+    workers: Optional[int] = None,
+    cache: Optional[Union[str, os.PathLike]] = None,
+) -> DICT[str, Set[str]]:
+    """Return the import graph of the python files under *root_dir*.
+
+    The result maps every module name to the names of the modules it imports,
+    external ones included. Names are dotted paths from *root_dir*, or from
+    its parent if *root_dir* is a package itself. Relative imports are
+    resolved, and ``from package import name`` points to ``package.name``
+    when that is a module of the tree.
+
+    Files are parsed by *workers* processes (``os.cpu_count()`` by default,
+    ``1`` parses in this process). Parsed imports are cached by content hash
+    for the lifetime of the process, and in the JSON file *cache* if given.
+    """
+
+    root = pathlib.Path(root_dir)
+    base = root.parent if (root / "__init__.py").is_file() else root
+
+    if cache is not None:
+        _load_cache(pathlib.Path(cache))
+
+    modules: LIST[TUPLE[str, bool, str]] = []
+    missing: DICT[str, bytes] = {}
+
+    for path in sorted(root.rglob("*.py")):
+        data = path.read_bytes()
+        digest = hashlib.sha1(data).hexdigest()
+
+        name, is_package = _module_name(path, base)
+        modules.append((name, is_package, digest))
+
+        if digest not in _IMPORTS:
+            missing[digest] = data
+
+    items = list(missing.items())
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 1 and len(items) > 1:
+        size = max(1, len(items) // (workers * 4))
+        batches = [items[i : i + size] for i in range(0, len(items), size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for results in pool.map(_scan_batch, batches):
+                _IMPORTS.update(results)
+
+    else:
+        _IMPORTS.update(_scan_batch(items))
+
+    if cache is not None:
+        _save_cache(pathlib.Path(cache), {digest for _, _, digest in modules})
+
+    known = {name for name, _, _ in modules}
+    graph: DICT[str, Set[str]] = {}
+
+    for name, is_package, digest in modules:
+        edges = graph.setdefault(name, set())
+        for node in _IMPORTS[digest]:
+            edges.update(_targets(name, is_package, node, known))
+
+        edges.discard(name)
+
+    return graph
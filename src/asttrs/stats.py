@@ -0,0 +1,160 @@
+"""
+Memory accounting of asttrs trees.
+
+:func:`memory_report` sizes every distinct object reachable from the given
+trees through their fields, so that an object referenced from several places
+(a node reused by an edit, the same interned string) is counted once.
+"""
+
+import sys
+from operator import attrgetter
+from typing import Any
+from typing import Dict as DICT
+from typing import List as LIST
+from typing import Tuple as TUPLE
+
+from ._base import AST, Serializable, _field_names, immutable
+
+# not owned by any tree
+_SINGLETONS = frozenset(map(id, (None, True, False, Ellipsis, NotImplemented)))
+
+
+@immutable
+class Usage(Serializable):
+    """*count* distinct objects taking *bytes* bytes."""
+
+    count: int = 0
+    bytes: int = 0
+
+
+@immutable
+class MemoryReport(Serializable):
+    """Bytes used by trees, per node class, container and value type.
+
+    *total* covers every distinct object, *shared* the ones among them that
+    are referenced more than once within the trees.
+    """
+
+    total: Usage
+    shared: Usage
+    nodes: DICT[str, Usage]
+    containers: DICT[str, Usage]
+    strings: Usage
+    other: DICT[str, Usage]
+
+
+# how to reach the children of an object, per type
+_LEAF, _SEQUENCE, _FIELD, _FIELDS = range(4)
+
+
+def _kind(cls: type) -> TUPLE[int, Any]:
+    if cls is list or cls is tuple:
+        return _SEQUENCE, None
+
+    if not issubclass(cls, AST):
+        return _LEAF, None
+
+    names = _field_names(cls)
+    if not names:
+        return _LEAF, None
+
+    return (_FIELD if len(names) == 1 else _FIELDS), attrgetter(*names)
+
+
+def _usage(counters: DICT[type, LIST[int]], types: LIST[type]) -> DICT[str, Usage]:
+    found: DICT[str, Usage] = {}
+    for cls in sorted(types, key=lambda cls: -counters[cls][1]):
+        count, size = counters[cls]
+        name = cls.__name__
+        if name in found:
+            # same name, other schema module
+            count += found[name].count
+            size += found[name].bytes
+
+        found[name] = Usage(count=count, bytes=size)
+
+    return found
+
+
+def memory_report(*trees: AST) -> MemoryReport:
+    """Return the memory used by *trees*, objects shared between them counted
+    once.
+
+    >>> from asttrs import Module
+    >>> tree = Module.from_source("x = 'text'\\ny = x")
+    >>> report = memory_report(tree)
+    >>> report.nodes["Name"].count, report.containers["list"].count
+    (3, 4)
+    >>> report.total.bytes == sum(u.bytes for u in report.nodes.values()) + (
+    ...     report.strings.bytes
+    ...     + sum(u.bytes for u in report.containers.values())
+    ...     + sum(u.bytes for u in report.other.values())
+    ... )
+    True
+    """
+
+    getsizeof = sys.getsizeof
+    seen: DICT[int, Any] = {}  # keeps the objects alive, so ids stay unique
+    shared = set()
+    # type -> [count, bytes, kind, getter, size of every instance or 0]
+    types: DICT[type, LIST[Any]] = {}
+
+    stack: LIST[Any] = list(trees)
+    push, extend = stack.append, stack.extend
+    while stack:
+        obj = stack.pop()
+        key = id(obj)
+
+        if key in seen:
+            shared.add(key)
+            continue
+
+        if key in _SINGLETONS:
+            continue
+
+        seen[key] = obj
+
+        cls = type(obj)
+        info = types.get(cls)
+        if info is None:
+            kind, getter = _kind(cls)
+            # nodes have no variable part: one size per class
+            fixed = getsizeof(obj) if issubclass(cls, AST) else 0
+            info = types[cls] = [0, 0, kind, getter, fixed]
+
+        info[0] += 1
+        if not info[4]:
+            info[1] += getsizeof(obj)
+
+        kind = info[2]
+        if kind == _FIELDS:
+            extend(info[3](obj))
+        elif kind == _FIELD:
+            push(info[3](obj))
+        elif kind == _SEQUENCE:
+            extend(obj)
+
+    counters: DICT[type, LIST[int]] = {
+        cls: [info[0], info[1] or info[0] * info[4]] for cls, info in types.items()
+    }
+
+    node_types = [cls for cls in counters if issubclass(cls, AST)]
+    containers = [cls for cls in counters if cls is list or cls is tuple]
+    others = [
+        cls
+        for cls in counters
+        if cls is not str and cls not in containers and cls not in node_types
+    ]
+
+    strings = counters.get(str, [0, 0])
+
+    return MemoryReport(
+        total=Usage(count=len(seen), bytes=sum(size for _, size in counters.values())),
+        shared=Usage(
+            count=len(shared), bytes=sum(getsizeof(seen[key]) for key in shared)
+        ),
+        nodes=_usage(counters, node_types),
+        containers=_usage(counters, containers),
+        strings=Usage(count=strings[0], bytes=strings[1]),
+        other=_usage(counters, others),
+    )
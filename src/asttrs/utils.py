@@ -1,3 +1,4 @@
+import asyncio
 import pathlib
 import subprocess as sp
 import sys
@@ -40,3 +41,31 @@ def isorting(source_code: str):
         pass
 
     return out.decode()
+
+
+async def _filter(cmd: list, source_code: str) -> str:
+    proc = await asyncio.create_subprocess_exec(*cmd, stdin=sp.PIPE, stdout=sp.PIPE)
+
+    try:
+        out, _ = await proc.communicate(source_code.encode())
+
+    except asyncio.CancelledError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    if proc.returncode:
+        raise sp.CalledProcessError(proc.returncode, cmd, out)
+
+    return out.decode()
+
+
+async def blacking_async(source_code: str):
+
+    return await _filter([sys.executable, "-m", "black", "-q", "-"], source_code)
+
+
+async def isorting_async(source_code: str):
+
+    cmd = [sys.executable, "-m", "isort", "--profile", "black", "-q", "-"]
+    return await _filter(cmd, source_code)
@@ -0,0 +1,12 @@
+"""
+The node classes of the Python 3.10 grammar, importable on any interpreter.
+
+Only ``asttrs.AST`` is shared with the other schemas: the abstract bases, such
+as ``stmt`` or ``expr``, are this module's own, so ``isinstance(v3_10.Pass(),
+asttrs.stmt)`` is false unless 3.10 is the running schema. Test against
+``v3_10.stmt`` instead.
+"""
+
+from asttrs._versions import export as _export
+
+_export(globals(), "3.10")
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import ast
+import importlib
+import inspect
+import json
+import pathlib
 from doctest import DocTestParser
 from doctest import Example as DocExample
 
 import ast_decompiler
-from invoke import task
+import attr
+from invoke import Exit, task
 
 from asttrs._base import Defination, Example
-from cpython.Parser.asdl import ASDLParser, Product, Sum
 
 
 def _assign_default(type_name):
@@ -40,6 +44,8 @@ singleton = Optional[bool]
 def build(
     c, asdl_path="cpython/Parser/Python.asdl", doc_path="cpython/Doc/library/ast.rst"
 ):
+    from cpython.Parser.asdl import ASDLParser, Product, Sum
+
     with open(asdl_path, "r") as f:
         asdl = f.read()
 
@@ -208,3 +214,227 @@ def build(
 
         else:
             raise ValueError(node)
+
+
+AOT_HEADER = """
+# NOTE: This module is auto-generated from '{module}' by 'invoke aot':
+#       the same classes, with the methods attrs generates for them written out.
+#       Their docstrings are kept in the JSON file next to this module.
+
+from typing import Any
+from typing import List as LIST
+from typing import Optional
+
+import attr
+
+from asttrs import _aot
+from asttrs._base import AST, immutable
+
+string = identifier = str
+constant = Any
+singleton = Optional[bool]
+
+_NOTHING = _aot.NOTHING
+_setattr = object.__setattr__
+
+_DOCS = _aot.DocFile(__file__)
+"""
+
+AOT_FOOTER = """
+# attrs gives its classes ``__match_args__`` from Python 3.10 on
+_aot.add_match_args(globals())
+"""
+
+# The formatter of the generated modules, the release pdm.lock pins: another
+# one may lay the same code out differently.
+AOT_BLACK = "23.3.0"
+
+
+def _tuple(items):
+    items = list(items)
+    return "(" + ", ".join(items) + ("," if len(items) == 1 else "") + ")"
+
+
+def _default(field):
+    if field.default is attr.NOTHING:
+        return None, "_aot.NOTHING"
+
+    if isinstance(field.default, attr.Factory):
+        assert field.default.factory is list and not field.default.takes_self
+        return "_NOTHING", "_aot.FACTORY_LIST"
+
+    return repr(field.default), repr(field.default)
+
+
+def _render_class(cls, node, source):
+    base = node.bases[0].id
+    lines = [f"class {cls.__name__}({base}):"]
+
+    if cls.__doc__:
+        lines.append("    __doc__ = _aot.LazyDoc(_DOCS)")
+
+    fields = attr.fields(cls) if "__attrs_attrs__" in cls.__dict__ else ()
+    if not fields:
+        lines.append("    _fields = ()")
+        return "\n".join(lines)
+
+    annotations = {
+        stmt.target.id: ast.get_source_segment(source, stmt.annotation)
+        for stmt in node.body
+        if isinstance(stmt, ast.AnnAssign)
+    }
+
+    names = [fd.name for fd in fields]
+    names_tuple = _tuple(repr(name) for name in names)
+    self_tuple = _tuple(f"self.{name}" for name in names)
+    other_tuple = _tuple(f"other.{name}" for name in names)
+
+    params, lazy, init = [], [], []
+    for fd in fields:
+        param, spec = _default(fd)
+        params.append(fd.name if param is None else f"{fd.name}={param}")
+        lazy.append(f"{fd.name}={spec}")
+
+        value = fd.name
+        if param == "_NOTHING":
+            value = f"list() if {fd.name} is _NOTHING else {fd.name}"
+        init.append(f"        _setattr(self, {fd.name!r}, {value})")
+
+    reprs = ", ".join(f"{name}={{self.{name}!r}}" for name in names)
+
+    lines += [
+        f"    __slots__ = {names_tuple}",
+        f"    _fields = {names_tuple}",
+        "",
+    ]
+    lines += [f"    {name}: {annotations[name]}" for name in names]
+    lines += [
+        "",
+        f"    __attrs_attrs__ = _aot.LazyFields({', '.join(lazy)})",
+        "",
+        f"    def __init__(self, *, {', '.join(params)}):",
+        *init,
+        "",
+        "    def __repr__(self):",
+        f'        return f"{{self.__class__.__qualname__}}({reprs})"',
+        "",
+        "    def __eq__(self, other):",
+        "        if other.__class__ is not self.__class__:",
+        "            return NotImplemented",
+        f"        return {self_tuple} == {other_tuple}",
+        "",
+        "    def __hash__(self):",
+        f"        return hash({_tuple([repr(cls.__name__)] + [f'self.{n}' for n in names])})",
+        "",
+        "    __ne__ = _aot.ne",
+        "    __lt__ = _aot.lt",
+        "    __le__ = _aot.le",
+        "    __gt__ = _aot.gt",
+        "    __ge__ = _aot.ge",
+        "    __getstate__ = _aot.getstate",
+        "    __setstate__ = _aot.setstate",
+    ]
+
+    return "\n".join(lines)
+
+
+def render_aot(module_name):
+    """Return the ahead-of-time variant of the attrs-based node module, and
+    the JSON document of its docstrings."""
+
+    import black
+
+    module = importlib.import_module(module_name)
+    source = inspect.getsource(module)
+
+    chunks = [AOT_HEADER.format(module=module_name)]
+    docs = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef):
+            cls = getattr(module, node.name)
+            chunks.append(_render_class(cls, node, source))
+            if cls.__doc__:
+                docs[cls.__name__] = cls.__doc__
+
+    chunks.append(AOT_FOOTER)
+    code = black.format_str("\n\n\n".join(chunks), mode=black.Mode())
+
+    return code, json.dumps(docs, indent=0, ensure_ascii=False) + "\n"
+
+
+@task()
+def aot(c, version="3_11", out_dir="src/asttrs"):
+    """Write the ahead-of-time variant of asttrs._py<version>, and its docs.
+
+    The classes go to ``_py<version>_aot.py``, their docstrings to
+    ``_py<version>_aot.json``.
+    """
+
+    import black
+
+    if black.__version__ != AOT_BLACK:
+        raise Exit(
+            f"black {AOT_BLACK} formats the generated modules, not {black.__version__}"
+        )
+
+    code, docs = render_aot(f"asttrs._py{version}")
+    path = pathlib.Path(out_dir) / f"_py{version}_aot"
+
+    path.with_suffix(".py").write_text(code)
+    path.with_suffix(".json").write_text(docs)
+
+
+SCHEMA_VERSIONS = ("3_7", "3_8", "3_9", "3_10", "3_11", "3_12")
+
+
+def _field_type(field):
+    args = getattr(field.type, "__args__", None)
+    if args:
+        return getattr(args[0], "__forward_arg__", args[0])
+
+    return field.type
+
+
+def render_schemas():
+    """Return the JSON table of the node classes of every ``_py3_*`` module,
+    themselves generated from the ASDL of that version: for each class, its
+    base and its fields as ``[name, type, sequence, optional]``."""
+
+    table = {}
+    for version in SCHEMA_VERSIONS:
+        module = importlib.import_module(f"asttrs._py{version}")
+        source = inspect.getsource(module)
+
+        classes = {}
+        for node in ast.parse(source).body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+
+            cls = getattr(module, node.name)
+            fields = []
+            for fd in attr.fields(cls) if "__attrs_attrs__" in cls.__dict__ else ():
+                seq = isinstance(fd.default, attr.Factory)
+                opt = not seq and fd.default is not attr.NOTHING
+                fields.append([fd.name, _field_type(fd), seq, opt])
+
+            classes[node.name] = {"base": node.bases[0].id, "fields": fields}
+
+        table[version.replace("_", ".")] = classes
+
+    # one class per line
+    versions = []
+    for version, classes in table.items():
+        rows = ",\n".join(
+            f"  {json.dumps(name)}: {json.dumps(entry)}"
+            for name, entry in classes.items()
+        )
+        versions.append(f" {json.dumps(version)}: {{\n{rows}\n }}")
+
+    return "{\n" + ",\n".join(versions) + "\n}\n"
+
+
+@task()
+def schemas(c, out="src/asttrs/_schemas.json"):
+    """Write the field table of every schema version, used by asttrs.translate."""
+
+    pathlib.Path(out).write_text(render_schemas())
@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from asttrs import FunctionDef, Module, from_files_async, to_files_async
+
+SOURCE = "import sys, os\ndef f(x):\n    return (x+1)\n"
+
+
+def test_from_file_async(tmp_path):
+    path = tmp_path / "m.py"
+    path.write_text(SOURCE)
+
+    tree = asyncio.run(Module.from_file_async(str(path)))
+
+    assert tree == Module.from_source(SOURCE)
+
+
+def test_to_file_async(tmp_path):
+    tree = Module.from_source(SOURCE)
+    tree.to_file(tmp_path / "sync.py", formatted=True)
+
+    async def main():
+        semaphore = asyncio.Semaphore(1)
+        await tree.to_file_async(tmp_path / "plain.py", semaphore=semaphore)
+        await tree.to_file_async(tmp_path / "formatted.py", formatted=True)
+
+    asyncio.run(main())
+
+    assert (tmp_path / "plain.py").read_text() == tree.to_source()
+    formatted = (tmp_path / "formatted.py").read_text()
+    assert formatted == (tmp_path / "sync.py").read_text()
+    assert formatted.startswith("import os\nimport sys\n")
+
+
+def test_bulk_bounded(tmp_path, monkeypatch):
+    import asttrs._aio as aio
+
+    running, peak = [0], [0]
+    render = aio._render
+
+    def counting(tree):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        try:
+            return render(tree)
+        finally:
+            running[0] -= 1
+
+    monkeypatch.setattr(aio, "_render", counting)
+
+    trees = [Module.from_source(f"x = {i}") for i in range(20)]
+    items = [(tmp_path / f"m{i}.py", tree) for i, tree in enumerate(trees)]
+
+    asyncio.run(to_files_async(items, limit=3))
+    assert 1 <= peak[0] <= 3
+
+    loaded = asyncio.run(from_files_async([path for path, _ in items], limit=None))
+    assert loaded == trees
+
+
+def test_bulk_process_executor(tmp_path):
+    paths = []
+    for i in range(4):
+        paths.append(tmp_path / f"f{i}.py")
+        paths[-1].write_text(f"def f{i}():\n    return {i}\n")
+
+    async def main():
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            return await from_files_async(paths, cls=FunctionDef, executor=pool)
+
+    trees = asyncio.run(main())
+
+    assert [tree.name for tree in trees] == ["f0", "f1", "f2", "f3"]
+
+
+def test_bulk_errors(tmp_path):
+    with pytest.raises(ValueError):
+        asyncio.run(to_files_async([], limit=0))
+
+    paths = [tmp_path / "missing.py"]
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(from_files_async(paths))
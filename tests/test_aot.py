@@ -0,0 +1,194 @@
+import copy
+import importlib
+import pathlib
+import pickle
+import sys
+
+import attr
+import pytest
+
+import asttrs
+from asttrs import _ast
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+SOURCE = """
+import os
+from typing import List as LIST
+
+@decorator(1, key="value")
+async def f(a, b: int = 2, *args, c, **kwargs) -> LIST[int]:
+    global x
+    async with a as b, c:
+        yield [i ** 2 for i in range(10) if i % 2]
+    try:
+        x = {k: v for k, v in kwargs.items()}
+    except (ValueError, TypeError) as e:
+        raise RuntimeError(f"{e!r:>10}") from None
+    finally:
+        del x
+
+class C(Base, metaclass=Meta):
+    x: int = 0
+    def g(self, y, *, z=None):
+        return lambda q=1: (q, y, z, ..., b"bytes", 1j, not self)
+"""
+
+if sys.version_info >= (3, 8):
+    SOURCE += """
+def h(a, /, b):
+    return (b := a)
+"""
+
+attrs_module = importlib.import_module(_ast._module.replace("_aot", ""))
+aot_module = importlib.import_module(attrs_module.__name__ + "_aot")
+
+
+def classes(module):
+    return {
+        name: value
+        for name, value in vars(module).items()
+        if isinstance(value, type) and value.__module__ == module.__name__
+    }
+
+
+def test_aot_is_default():
+    assert _ast._asttrs is aot_module
+    assert asttrs.Module is aot_module.Module
+
+
+def test_same_classes():
+    expected, actual = classes(attrs_module), classes(aot_module)
+    assert list(expected) == list(actual)
+
+    for name, cls in expected.items():
+        aot = actual[name]
+        assert aot.__doc__ == cls.__doc__
+        assert [b.__name__ for b in aot.__mro__] == [b.__name__ for b in cls.__mro__]
+        assert attr.has(aot) == attr.has(cls)
+
+        if attr.has(cls):
+            assert attr.fields(aot) == attr.fields(cls)
+            assert vars(aot).get("__annotations__") == vars(cls).get("__annotations__")
+            # only on 3.10+, as attrs does
+            assert getattr(aot, "__match_args__", None) == getattr(
+                cls, "__match_args__", None
+            )
+
+
+def test_public_names():
+    def public(module):
+        # CI collects the attrs module for its doctests: pytest then rewrites
+        # its asserts, which adds ``@py_builtins`` and ``@pytest_ar``
+        return {
+            name
+            for name in vars(module)
+            if name.isidentifier() and not name.startswith("_")
+        }
+
+    assert public(aot_module) == public(attrs_module)
+
+
+def test_attrs_api():
+    node = asttrs.Name(id="x", ctx=asttrs.Load())
+
+    assert attr.fields(asttrs.Name).id.name == "id"
+    assert attr.fields_dict(asttrs.Name)["ctx"].default is attr.NOTHING
+    assert attr.fields(asttrs.Module).body.default == attr.Factory(list)
+    assert attr.asdict(node) == {"id": "x", "ctx": {}}
+    assert attr.evolve(node, id="y") == asttrs.Name(id="y", ctx=asttrs.Load())
+
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        node.id = "y"
+
+    with pytest.raises(TypeError):
+        asttrs.Name("x", asttrs.Load())
+
+    with pytest.raises(TypeError):
+        asttrs.Name(ctx=asttrs.Load())
+
+
+def test_subclasses():
+    @asttrs.immutable
+    class Named(asttrs.Name):
+        note: str = ""
+
+    node = Named(id="x", ctx=asttrs.Load(), note="n")
+    assert [f.name for f in attr.fields(Named)] == ["id", "ctx", "note"]
+    assert repr(node) == "Named(id='x', ctx=Load(), note='n')"
+    assert node.evolve(note="m").note == "m"
+
+    class Plain(asttrs.Constant):
+        pass
+
+    assert attr.fields(Plain) == attr.fields(asttrs.Constant)
+    assert Plain(value=1) != asttrs.Constant(value=1)
+
+
+def convert(module, source):
+    # the same conversion with the classes of *module*
+    def from_ast(obj):
+        if isinstance(obj, list):
+            return [from_ast(el) for el in obj]
+        if not isinstance(obj, _ast._ast.AST):
+            return obj
+
+        cls = getattr(module, type(obj).__name__)
+        return cls(
+            **{f.name: from_ast(getattr(obj, f.name, None)) for f in attr.fields(cls)}
+        )
+
+    return from_ast(_ast._ast.parse(source))
+
+
+def test_behaviour():
+    expected = convert(attrs_module, SOURCE)
+    actual = asttrs.Module.from_source(SOURCE)
+
+    assert repr(actual) == repr(expected)
+    assert actual.to_dict() == expected.to_dict()
+    assert actual.to_source() == expected.to_source()
+    assert pickle.loads(pickle.dumps(actual)) == actual
+    assert copy.deepcopy(actual) == actual
+
+    a, b = asttrs.Constant(value=1), asttrs.Constant(value=2)
+    assert a < b and a <= b and b > a and b >= a and a != b
+    assert hash(a) == hash(asttrs.Constant(value=1))
+    assert (a == asttrs.Name(id="x", ctx=asttrs.Load())) is False
+    assert (a.__lt__(asttrs.Name(id="x", ctx=asttrs.Load()))) is NotImplemented
+
+    with pytest.raises(TypeError):
+        hash(actual)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="ast.get_source_segment")
+def test_generated_modules_are_up_to_date():
+    pytest.importorskip("invoke")
+    sys.path.insert(0, str(ROOT))
+    try:
+        tasks = importlib.import_module("tasks")
+    finally:
+        sys.path.remove(str(ROOT))
+
+    black = pytest.importorskip("black")
+    if black.__version__ != tasks.AOT_BLACK:
+        pytest.skip(f"formatted with black {tasks.AOT_BLACK}, not {black.__version__}")
+
+    code, docs = tasks.render_aot(attrs_module.__name__)
+
+    path = pathlib.Path(aot_module.__file__)
+    assert code == path.read_text()
+    assert docs == path.with_suffix(".json").read_text()
+
+
+@pytest.mark.skipif(
+    attrs_module.Constant.__doc__ is None, reason="no docstrings in this schema"
+)
+def test_docs_are_loaded_lazily():
+    doc = attrs_module.Constant.__doc__
+    assert doc and asttrs.Constant.__doc__ == doc
+    assert asttrs.Constant(value=1).__doc__ == doc
+    assert "__doc__" in vars(aot_module.Constant)
+
+    assert aot_module.Load.__doc__ == attrs_module.Load.__doc__
+    assert aot_module.stmt.__doc__ is None
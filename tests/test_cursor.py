@@ -0,0 +1,57 @@
+import pytest
+
+from asttrs import ClassDef, Constant, Cursor, FunctionDef, Module, Name, Return, walk
+
+SOURCE = """
+class A:
+    def f(self, x):
+        y = x + 1
+        return y
+
+    def g(self):
+        pass
+"""
+
+
+def test_navigation():
+    tree = Module.from_source(SOURCE)
+    ret = next(Cursor(tree).find(Return))
+
+    assert ret.path == ("body", 0, "body", 0, "body", 1)
+    assert ret.parent.node is tree.body[0].body[0]
+    assert ret.enclosing(FunctionDef).node.name == "f"
+    assert ret.enclosing(ClassDef).node.name == "A"
+    assert ret.root() is tree
+    assert ret.depth == 3
+
+    assert [type(c.node).__name__ for c in ret.siblings] == ["Assign"]
+    assert ret.prev_sibling.node is tree.body[0].body[0].body[0]
+    assert ret.next_sibling is None
+
+    assert Cursor.at(tree, ret.path).node is ret.node
+    assert Cursor.locate(tree, ret.node).path == ret.path
+    assert [c.node for c in Cursor(tree).find(Name)] == list(walk(tree, Name))
+
+
+def test_replace_rebuilds_only_the_path():
+    tree = Module.from_source(SOURCE)
+    ret = next(Cursor(tree).find(Return))
+
+    new = ret.replace(Return(value=Constant(value=None)))
+    root = new.root()
+
+    assert root is not tree
+    assert new.path == ret.path
+    assert root.body[0].body[0].body[1] == Return(value=Constant(value=None))
+    assert root.body[0].body[0].body[0] is tree.body[0].body[0].body[0]
+    assert root.body[0].body[1] is tree.body[0].body[1]
+    assert root.body[0].body[0].args is tree.body[0].body[0].args
+
+    assert Cursor(tree).replace(root).root() is root
+
+
+def test_child_errors():
+    tree = Module.from_source(SOURCE)
+
+    with pytest.raises(TypeError):
+        Cursor(tree).child("body", 0).child("name")
@@ -0,0 +1,86 @@
+import sys
+
+import pytest
+
+from asttrs import Constant, Expr, Module, apply_edits, apply_patch, diff, make_patch
+from asttrs._diff import DELETE, INSERT, MOVE, UPDATE
+
+OLD = """
+import os
+
+def f(x):
+    return x + 1
+
+def g():
+    pass
+
+print(f(2))
+"""
+
+
+def test_identical_trees():
+    assert diff(Module.from_source(OLD), Module.from_source(OLD)) == []
+
+    tree = Module.from_source(OLD)
+    assert diff(tree, tree) == []
+
+
+def test_insert_delete_update():
+    old = Module.from_source(OLD)
+    new = Module.from_source(
+        OLD.replace("import os\n", "").replace("x + 1", "x + 2") + "\nprint(g())\n"
+    )
+
+    ops = diff(old, new)
+    kinds = [op.kind for op in ops]
+
+    assert kinds == [DELETE, UPDATE, INSERT]
+    assert ops[0].old_path == ("body", 0) and ops[0].old is old.body[0]
+    assert ops[1].old_path == ("body", 1, "body", 0, "value", "right")
+    assert ops[1].new_path == ("body", 0, "body", 0, "value", "right")
+    assert ops[1].fields == (("n",) if sys.version_info < (3, 8) else ("value",))
+    assert ops[2].old_path == ("body", 4) and ops[2].new_path == ("body", 3)
+
+
+def test_moves_and_replacements():
+    old = Module.from_source(OLD)
+    new = apply_edits(
+        old,
+        [
+            (("body", 2), None),
+            (("body", 0), [old.body[0], old.body[2]]),
+            (("body", 3, "value", "args", 0), Constant(value="x")),
+        ],
+    )
+
+    ops = diff(old, new)
+
+    assert [op.kind for op in ops] == [MOVE, UPDATE]
+    assert ops[0].old_path == ("body", 2) and ops[0].new_path == ("body", 1)
+    assert ops[0].anchor == ("body", 1)
+    assert ops[1].fields == () and ops[1].new == Constant(value="x")
+
+    assert [op.kind for op in diff(old, new, detect_moves=False)] == [
+        INSERT,
+        DELETE,
+        UPDATE,
+    ]
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [(-1, -2), (0, 2**61 - 1), (1, True), (0.0, -0.0)],
+)
+def test_colliding_hashes(a, b):
+    # hash(-1) == hash(-2), and 1 == True, 0.0 == -0.0
+    old = Module(body=[Expr(value=Constant(value=a))])
+    new = Module(body=[Expr(value=Constant(value=b))])
+
+    ops = diff(old, new)
+
+    assert [(op.kind, op.fields) for op in ops] == [(UPDATE, ("value",))]
+    assert repr(apply_patch(old, make_patch(old, new))) == repr(new)
+
+    old = Module(body=[Expr(value=Constant(value=b)), Expr(value=Constant(value=a))])
+    new = Module(body=[Expr(value=Constant(value=a)), Expr(value=Constant(value=b))])
+    assert repr(apply_patch(old, make_patch(old, new))) == repr(new)
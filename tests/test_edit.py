@@ -0,0 +1,82 @@
+import pytest
+
+from asttrs import Call, Constant, Cursor, Insert, Module, Name, Pass, apply_edits, walk
+
+SOURCE = """
+def f():
+    g(1)
+    g(2)
+
+g(3)
+"""
+
+
+def test_batch_matches_sequential():
+    tree = Module.from_source(SOURCE)
+    calls = [c for c in Cursor(tree).find(Call)]
+
+    sequential = tree
+    for cur in calls:
+        new = cur.node.evolve(func=Name(id="h", ctx=cur.node.func.ctx))
+        sequential = Cursor.at(sequential, cur.path).replace(new).root()
+
+    batch = apply_edits(
+        tree,
+        [
+            (cur.path, cur.node.evolve(func=Name(id="h", ctx=cur.node.func.ctx)))
+            for cur in calls
+        ],
+    )
+
+    assert batch == sequential
+    assert "g" not in [n.id for n in walk(batch, Name)]
+
+
+def test_identity_targets_and_sharing():
+    tree = Module.from_source(SOURCE)
+    first, second = tree.body[0].body
+
+    new = apply_edits(tree, {id(second): None})
+
+    assert new.body[0].body == [first]
+    assert new.body[0].body[0] is first
+    assert new.body[1] is tree.body[1]
+
+    same = apply_edits(tree, [(first, [first, Pass()])])
+    assert [type(n) for n in same.body[0].body] == [type(first), Pass, type(second)]
+
+
+def test_insert_and_field_replacement():
+    tree = Module.from_source(SOURCE)
+
+    new = apply_edits(
+        tree,
+        [
+            (("body", 0, "body", 0), Insert(Pass())),
+            (("body", 0, "body", 2), Insert([Pass(), Pass()])),
+            (("body", 1, "value", "args"), [Constant(value=4)]),
+        ],
+    )
+
+    assert [type(n).__name__ for n in new.body[0].body] == [
+        "Pass",
+        "Expr",
+        "Expr",
+        "Pass",
+        "Pass",
+    ]
+    assert new.body[1].value.args == [Constant(value=4)]
+    assert apply_edits(tree, []) is tree
+
+
+def test_errors():
+    tree = Module.from_source(SOURCE)
+
+    with pytest.raises(ValueError):
+        apply_edits(tree, [(("body", 0), Pass()), (("body", 0, "name"), "x")])
+
+    with pytest.raises(IndexError):
+        apply_edits(tree, [(("body", 5), Pass())])
+
+    with pytest.raises(LookupError):
+        apply_edits(tree, [(Pass(), None)])
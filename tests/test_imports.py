@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from asttrs import ImportFrom
+from asttrs.imports import _targets, build_graph, scan_imports
+
+FILES = {
+    "pkg/__init__.py": "from .core import run\n",
+    "pkg/core.py": "import os, sys\nfrom . import util\nfrom .sub.deep import thing\n",
+    "pkg/util.py": "def f():\n    from .core import run\n    import json.decoder\n",
+    "pkg/sub/__init__.py": (
+        "from .. import util\nfrom ... import beyond\nfrom ...beyond import name\n"
+    ),
+    "pkg/sub/deep.py": "from ..core import run\nfrom pkg import sub\n",
+}
+
+
+@pytest.fixture
+def package(tmp_path):
+    for name, source in FILES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+
+    return tmp_path / "pkg"
+
+
+EXPECTED = {
+    "pkg": {"pkg.core"},
+    "pkg.core": {"os", "sys", "pkg.util", "pkg.sub.deep"},
+    "pkg.util": {"pkg.core", "json.decoder"},
+    "pkg.sub": {"pkg.util"},
+    "pkg.sub.deep": {"pkg.core", "pkg.sub"},
+}
+
+
+def test_scan_imports():
+    nodes = scan_imports("from ..a import b as c\n")
+
+    assert nodes == [
+        ImportFrom(module="a", names=nodes[0].names, level=2),
+    ]
+    assert nodes[0].names[0].asname == "c"
+
+
+@pytest.mark.parametrize(
+    "module, is_package, source, expected",
+    [
+        ("pkg.sub", True, "from ..x import y", ["pkg.x"]),
+        ("pkg.sub", True, "from ...x import y", []),
+        ("pkg.sub.deep", False, "from ...x import y", []),
+        ("top", True, "from . import x", ["top"]),
+        ("top", False, "from . import x", []),
+        ("top", False, "from .x import y", []),
+    ],
+)
+def test_relative_imports_stop_at_the_top_level(module, is_package, source, expected):
+    node = scan_imports(source)[0]
+
+    assert list(_targets(module, is_package, node, set())) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_graph(package, workers):
+    assert build_graph(package, workers=workers) == EXPECTED
+
+
+def test_build_graph_from_source_dir(package):
+    graph = build_graph(package.parent, workers=1)
+
+    assert graph == EXPECTED
+
+
+def test_build_graph_cache_file(package, tmp_path):
+    cache = tmp_path / "imports.json"
+
+    assert build_graph(package, workers=1, cache=cache) == EXPECTED
+    assert len(json.loads(cache.read_text())["files"]) == len(FILES)
+
+    (package / "util.py").write_text("import re\n")
+    graph = build_graph(package, workers=1, cache=cache)
+
+    assert graph["pkg.util"] == {"re"}
+    assert len(json.loads(cache.read_text())["files"]) == len(FILES)
@@ -0,0 +1,65 @@
+import os
+import pathlib
+import subprocess as sp
+import sys
+
+SRC = str(pathlib.Path(__file__).resolve().parent.parent / "src")
+
+HEAVY = ("attr", "cattr", "cattrs", "ast_decompiler", "black", "isort", "typing")
+
+
+def importtime(code):
+    """Return ``{module: cumulative microseconds}`` of ``python -X importtime``."""
+
+    env = dict(os.environ, PYTHONPATH=SRC)
+    cmd = [sys.executable, "-X", "importtime", "-W", "ignore", "-c", code]
+    out = sp.run(cmd, env=env, stderr=sp.PIPE, check=True).stderr.decode()
+
+    result = {}
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            result[name.strip()] = int(cumulative)
+
+    return result
+
+
+def test_import_asttrs_is_lightweight():
+    times = importtime("import asttrs")
+
+    assert not [name for name in times if name.split(".")[0] in HEAVY]
+    assert not [name for name in times if name.startswith("asttrs._py3_")]
+
+
+def test_nodes_load_on_first_access():
+    times = importtime("import asttrs; asttrs.Module; asttrs.walk")
+
+    assert any(name.startswith("asttrs._py3_") for name in times)
+    assert "asttrs._walk" in times
+    assert "asttrs._diff" not in times
+    assert not [n for n in times if n.split(".")[0] in ("black", "isort", "cattr")]
+
+
+def test_lazy_namespace():
+    import asttrs
+
+    assert "Module" in dir(asttrs)
+    assert "walk" in asttrs.__all__ and "Constant" in asttrs.__all__
+    assert asttrs.imports.build_graph
+
+    namespace = {}
+    exec("from asttrs import *", namespace)
+    assert namespace["Constant"] is asttrs.Constant
+
+
+def test_versions_load_separately():
+    import asttrs._versions
+
+    other = "3_8" if asttrs._versions.CURRENT != "3.8" else "3_9"
+    times = importtime(f"import asttrs.v{other}")
+
+    assert [n for n in times if n.startswith("asttrs._py3_")] == [
+        f"asttrs._py{other}_aot"
+    ]
@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from asttrs import Module, TextEdit, reparse
+
+SOURCE = """import os
+
+@property
+@staticmethod
+def f(x):
+    return (x +
+            1)
+
+class A:
+    a = 1; b = 2
+
+    def g(self):
+        pass
+
+print(f(1)); y = [
+    1,
+    2,
+]
+"""
+
+
+def edit_at(source, needle, text, length=None):
+    start = source.index(needle)
+    end = start + (len(needle) if length is None else length)
+    return TextEdit(start=start, end=end, text=text)
+
+
+def test_reparse_reuses_untouched_statements():
+    mod = Module.from_source(SOURCE)
+    edit = edit_at(SOURCE, "import os", "import sys")
+    new = reparse(mod, SOURCE, edit)
+
+    assert new == Module.from_source(edit.apply(SOURCE))
+    assert new.body[0] is not mod.body[0]
+    assert all(a is b for a, b in zip(new.body[2:], mod.body[2:]))
+
+
+def test_reparse_chain():
+    mod, source = Module.from_source(SOURCE), SOURCE
+
+    for needle, text in [
+        ("import os", "import sys"),
+        ("@staticmethod\n", ""),
+        ("\nclass", "\nz = 3\n\nclass"),
+        ("b = 2", "b = 2; c = 3"),
+        ("    2,\n", "    2, 3,\n"),
+    ]:
+        edit = edit_at(source, needle, text)
+        mod, source = reparse(mod, source, edit), edit.apply(source)
+
+        assert mod == Module.from_source(source)
+
+
+def test_reparse_spill_over_and_syntax_error():
+    mod = Module.from_source(SOURCE)
+
+    edit = edit_at(SOURCE, "import os", 's = """')
+    with pytest.raises(SyntaxError):
+        reparse(mod, SOURCE, edit)
+
+    # a string opened in the edited statement and closed far below it
+    source = 'a = 1\nb = 2\nc = 3\nd = 4  # """\n'
+    edit = edit_at(source, "1", '"""')
+    new = reparse(Module.from_source(source), source, edit)
+
+    assert new == Module.from_source(edit.apply(source))
+    assert len(new.body) == 1
+
+
+def test_reparse_random_edits():
+    rnd = random.Random(0)
+    pieces = ["x", "1", "\n", " ", "(", ")", ":", "pass", "\n    ", "#"]
+    mod, source = Module.from_source(SOURCE), SOURCE
+
+    for _ in range(300):
+        start = rnd.randrange(len(source) + 1)
+        end = min(len(source), start + rnd.randrange(4))
+        edit = TextEdit(start=start, end=end, text=rnd.choice(pieces))
+        edited = edit.apply(source)
+
+        try:
+            expected = Module.from_source(edited)
+        except SyntaxError:
+            with pytest.raises(SyntaxError):
+                reparse(mod, source, edit)
+            continue
+
+        mod, source = reparse(mod, source, edit), edited
+        assert mod == expected
+
+
+def test_reparse_within_definition_body():
+    source = SOURCE + "\n\nclass B:\n    def h(self):\n        return 1\n\n    i = 2\n"
+    mod = Module.from_source(source)
+    edit = edit_at(source, "return 1", "return 2")
+    new = reparse(mod, source, edit)
+
+    assert new == Module.from_source(edit.apply(source))
+    assert all(a is b for a, b in zip(new.body[:-1], mod.body[:-1]))
+    assert new.body[-1].body[0] is not mod.body[-1].body[0]
+    assert new.body[-1].body[1] is mod.body[-1].body[1]
+
+    # dedenting the last statement moves it out of the class
+    edit = edit_at(source, "    i = 2", "i = 2")
+    assert reparse(mod, source, edit) == Module.from_source(edit.apply(source))
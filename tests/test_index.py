@@ -0,0 +1,59 @@
+import gc
+
+from asttrs import (
+    Call,
+    ClassDef,
+    FunctionDef,
+    ImportFrom,
+    Module,
+    Name,
+    NodeIndex,
+    expr,
+    node_index,
+    stmt,
+    walk,
+)
+from asttrs._index import _INDEXES
+
+SOURCE = """
+from os import path
+
+class A:
+    def f(self):
+        return path.join(g(1), h())
+
+print(A().f())
+"""
+
+
+def test_of_matches_walk():
+    tree = Module.from_source(SOURCE)
+    idx = NodeIndex(tree)
+
+    for types in [(Call,), (ImportFrom,), (stmt,), (expr,), (Name, ClassDef)]:
+        assert list(idx.of(*types)) == list(walk(tree, types))
+
+    assert idx.of(Module) == (tree,)
+    assert idx.count(FunctionDef) == 1
+    assert Call in idx and ImportFrom in idx
+
+
+def test_queries_are_cached():
+    idx = NodeIndex(Module.from_source(SOURCE))
+
+    assert idx.of(stmt) is idx.of(stmt)
+    assert idx.of(Call) is idx.of(Call)
+
+
+def test_node_index_is_cached_per_tree():
+    tree = Module.from_source(SOURCE)
+
+    assert node_index(tree) is node_index(tree)
+    assert node_index(tree) is not node_index(Module.from_source(SOURCE))
+
+    size = len(_INDEXES)
+    node_index(tree).of(Module)
+    del tree
+    gc.collect()
+
+    assert len(_INDEXES) < size
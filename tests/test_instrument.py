@@ -0,0 +1,99 @@
+import ast
+import collections
+import json
+
+import pytest
+
+from asttrs import Comment, Module
+from asttrs._base import AST
+from asttrs._instrument import Instrumentation
+
+SOURCE = """
+import os
+
+def f(a, *, b=1):
+    # comment
+    return [x + b for x in a if x]
+
+class C:
+    y: int = f([1, 2])
+"""
+
+
+def test_same_results():
+    expected = Module.from_source(SOURCE)
+
+    with Instrumentation():
+        actual = Module.from_source(SOURCE)
+        tree = actual.to_ast()
+
+    assert actual == expected
+    assert ast.dump(tree) == ast.dump(expected.to_ast())
+
+
+def test_counts():
+    counts = collections.Counter(type(n).__name__ for n in ast.walk(ast.parse(SOURCE)))
+
+    with Instrumentation() as inst:
+        Module.from_source(SOURCE).to_ast()
+
+    report = inst.report()
+    for kind in ("from_ast", "to_ast"):
+        assert {k: v["count"] for k, v in report[kind].items()} == counts
+
+    stats = report["from_ast"]["Module"]
+    assert stats["count"] == 1
+    assert stats["self_time"] <= stats["time"]
+    assert set(stats["fields"]) == set(ast.Module._fields)
+    assert sum(stats["fields"].values()) <= stats["time"]
+
+    assert report["conversions"] == {"from_ast": 1, "to_ast": 1}
+    assert json.loads(inst.to_json()) == report
+
+
+def test_disabled_restores_methods():
+    from_ast, to_ast = AST.__dict__["from_ast"], AST.__dict__["to_ast"]
+    comment_to_ast = Comment.__dict__["to_ast"]
+
+    with Instrumentation() as inst:
+        assert inst.enabled
+        assert AST.__dict__["to_ast"] is not to_ast
+
+        with pytest.raises(RuntimeError):
+            Instrumentation().enable()
+
+    assert not inst.enabled
+    assert AST.__dict__["from_ast"] is from_ast
+    assert AST.__dict__["to_ast"] is to_ast
+    assert Comment.__dict__["to_ast"] is comment_to_ast
+
+    Module.from_source(SOURCE)
+    assert inst.report()["conversions"] == {"from_ast": 0, "to_ast": 0}
+
+
+def test_callbacks_and_own_to_ast():
+    events = []
+    inst = Instrumentation(
+        on_begin=lambda kind, obj: events.append(("begin", kind)),
+        on_end=lambda kind, obj, result, seconds: events.append(("end", kind)),
+    )
+
+    tree = Module(body=[Comment(body="note")])
+    with inst:
+        tree.to_ast()
+        Module.from_source("x = 1")
+
+    assert events == [
+        ("begin", "to_ast"),
+        ("end", "to_ast"),
+        ("begin", "from_ast"),
+        ("end", "from_ast"),
+    ]
+    assert inst.report()["to_ast"]["Comment"]["count"] == 1
+
+    inst.reset()
+    assert inst.report() == {
+        "conversions": {"from_ast": 0, "to_ast": 0},
+        "from_ast": {},
+        "to_ast": {},
+    }
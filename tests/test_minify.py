@@ -0,0 +1,143 @@
+import ast
+
+import pytest
+
+from asttrs import Comment, Module, minify
+
+SOURCE = '''\
+"""Module docstring."""
+import os
+
+
+class Point:
+    """A point."""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def norm(self):
+        total = self.x ** 2 + self.y ** 2
+        return total ** 0.5
+
+
+def collect(values, *, limit=10):
+    """Collect the values."""
+    result = []
+    for value in values:
+        if value is None:
+            continue
+        elif len(result) >= limit:
+            break
+        result.append(value)
+    squares = [item * item for item in result if item > 0]
+    return result, squares, os.sep
+'''
+
+
+def run(source):
+    namespace = {}
+    exec(compile(source, "<test>", "exec"), namespace)
+    point = namespace["Point"](3, 4)
+    return point.norm(), namespace["collect"]([1, None, -2, 3], limit=2)
+
+
+def test_minify_parses_equal():
+    tree = Module.from_source(SOURCE)
+    out = minify(tree)
+
+    assert ast.dump(ast.parse(out)) == ast.dump(ast.parse(SOURCE))
+    assert len(out) < len(SOURCE) * 0.8
+    assert tree.to_source(minified=True) == out
+
+
+def test_minify_compact():
+    out = minify(Module.from_source(SOURCE), docstrings=False)
+
+    assert out.splitlines()[:4] == [
+        "import os",
+        "class Point:",
+        " def __init__(self,x,y):self.x=x;self.y=y",
+        " def norm(self):total=self.x**2+self.y**2;return total**0.5",
+    ]
+    assert '"""' not in out
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("x = 1 if y else 2", "x=1 if y else 2"),
+        ("x = 1 .real", "x=1 .real"),
+        ("x = 1.0.real", "x=1.0 .real"),
+        ("x = not (a and b)", "x=not(a and b)"),
+        ("x = f'{a!r:>{w}}' + 'b'", "x=f'{a!r:>{w}}'+'b'"),
+        ("@dec\ndef f(): pass", "@dec\ndef f():pass"),
+        ("if a:\n    pass\nelse:\n    b = 1\n    c = 2", "if a:pass\nelse:b=1;c=2"),
+        ("lambda: (yield)", "lambda:(yield)"),
+    ],
+)
+def test_minify_tokens(source, expected):
+    out = minify(Module.from_source(source))
+
+    assert ast.dump(ast.parse(out)) == ast.dump(ast.parse(source))
+    assert len(out) <= len(expected) + 3
+
+
+def test_minify_drops_comments():
+    tree = Module.from_source("if x:\n    y = 1\n")
+    body = [Comment(body="only a comment")]
+    tree = tree.evolve(body=[tree.body[0].evolve(body=body)])
+
+    assert "#" in tree.to_source()
+    assert minify(tree) == "if x:pass\n"
+
+
+def test_minify_empty_blocks():
+    source = 'def f():\n    """Doc."""\nclass C:\n    "Doc."\n'
+    out = minify(Module.from_source(source), docstrings=False)
+
+    assert out == "def f():pass\nclass C:pass\n"
+
+
+def test_minify_rename_locals():
+    out = minify(Module.from_source(SOURCE), docstrings=False, rename_locals=True)
+
+    assert run(out) == run(SOURCE)
+    assert "total" not in out and "result" not in out
+    # parameters, attributes and globals keep their names
+    assert "limit" in out and "self.x" in out and "os.sep" in out
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        # read by a nested function
+        "def f():\n    value = 1\n    def g():\n        return value\n    return g",
+        # declared nonlocal by a nested function
+        "def f():\n    value = 1\n    def g():\n"
+        "        nonlocal value\n        value = 2\n    g()\n    return value",
+        # declared global
+        "def f():\n    global value\n    value = 1",
+        # read back through locals()
+        "def f():\n    value = 1\n    return locals()",
+        # bound by an except clause and an import
+        "def f():\n    try:\n        import os as value\n"
+        "    except ImportError as value:\n        pass",
+    ],
+)
+def test_minify_rename_keeps(source):
+    out = minify(Module.from_source(source), rename_locals=True)
+
+    assert "value" in out
+    assert ast.dump(ast.parse(out)) == ast.dump(ast.parse(source))
+
+
+def test_minify_rename_avoids_free_names():
+    source = "def f(b):\n    value = a + len(b)\n    return [c for c in b] + [value, a]"
+    out = minify(Module.from_source(source), rename_locals=True)
+
+    namespace = {"a": 10}
+    exec(out, namespace)
+
+    assert namespace["f"]([1, 2]) == [1, 2, 12, 10]
+    assert "value" not in out
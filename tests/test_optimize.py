@@ -0,0 +1,342 @@
+import sys
+
+import pytest
+
+from asttrs import Module, optimize, remove_dead_code
+
+
+def run(source):
+    namespace = {"y": 2, "z": 3, "a": "A", "b": "B"}
+    exec(compile(source, "<test>", "exec"), namespace)
+    return {k: v for k, v in namespace.items() if k != "__builtins__"}
+
+
+def show(source):
+    return optimize(Module.from_source(source)).to_source().strip()
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("x = 24 * 60 * 60", "x = 86400"),
+        ("x = 'a' + 'b' * 2", "x = 'abb'"),
+        ("x = -(2 ** 2)", "x = -4"),
+        ("x = (1 - 2) ** 2", "x = 1"),
+        ("x = (0 - 1).bit_length()", "x = (-1).bit_length()"),
+        ("x = -0.0 * 1", "x = -0.0"),
+        ("x = 1 + 2j", "x = (1+2j)"),
+        ("x = not 0", "x = True"),
+        ("x = ~5", "x = -6"),
+        ("x = 1 < 2 <= 2 != 3", "x = True"),
+        ("x = 'a' in 'abc'", "x = True"),
+        ("x = True and y", "x = y"),
+        ("x = 0 and y", "x = 0"),
+        ("x = None or 0 or y or z", "x = y or z"),
+        ("x = y and True", "x = y and True"),
+        ("x = a if 1 else b", "x = a"),
+        ("x = f'{1 + 1}-{\"a\"!r:>4}'", "x = '2- \\'a\\''"),
+        ("x = f'{y:{\"<\"}{4}}'", "x = f'{y:<4}'"),
+        ("x = f''", "x = ''"),
+    ],
+)
+def test_folding(source, expected):
+    assert show(source) == expected
+    assert run(expected) == run(source)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "x = 1 / 0",
+        "x = 'a' + 1",
+        "x = 2 ** 1000",
+        "x = 'ab' * 10000",
+        "x = 1 << 1000",
+        "x = (1,) * 1000",
+        "x = 1 is 1",
+        "x = f'{1:bad}'",
+        "x = [1] + [2]",
+        # no literal reads back as these
+        "x = 0j * -1",
+        "x = 0 - 1j",
+        "x = 1e1000 - 1e1000",
+    ],
+)
+def test_left_for_runtime(source):
+    tree = Module.from_source(source)
+    assert optimize(tree) is tree
+
+
+def test_dead_branches():
+    source = """
+if 1 + 1 == 2:
+    a = 1
+else:
+    a = 2
+if False:
+    b = 1
+elif 0:
+    b = 2
+else:
+    b = 3
+if None:
+    c = 1
+def f():
+    if True:
+        pass
+    else:
+        return 1
+    if not True:
+        while True:
+            if 0:
+                print(1)
+"""
+    expected = """
+a = 1
+b = 3
+
+def f():
+    pass
+"""
+    assert show(source) == expected.strip()
+    assert run(source)["a"] == 1
+
+
+def test_empty_blocks():
+    assert show("for x in y:\n    if 0:\n        z()") == "for x in y:\n    pass"
+    assert show("try:\n    x()\nfinally:\n    if 0:\n        y()") == (
+        "try:\n    x()\nfinally:\n    pass"
+    )
+    assert show("if 0:\n    x()").strip() == ""
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        # still a generator, a local, a global declaration
+        "def f():\n    if 0:\n        yield\n",
+        "def f():\n    if False:\n        x = 1\n    return x\n",
+        "def f():\n    if False:\n        global x\n    x = 1\n",
+        "def f():\n    if 0:\n        import os\n    return os\n",
+        pytest.param(
+            "def f():\n    return (x := 1) if 0 else 2\n",
+            marks=pytest.mark.skipif(sys.version_info < (3, 8), reason="walrus"),
+        ),
+        pytest.param(
+            "f = lambda: (x := 1) if 0 else 2\n",
+            marks=pytest.mark.skipif(sys.version_info < (3, 8), reason="walrus"),
+        ),
+    ],
+)
+def test_dead_code_changing_functions(source):
+    tree = Module.from_source(source)
+    assert optimize(tree) is tree
+
+
+def test_dead_code_bound_in_both_branches():
+    source = (
+        "def f():\n    if 1:\n        x = 1\n    else:\n        import x\n    return x"
+    )
+
+    assert show(source) == "def f():\n    x = 1\n    return x"
+
+
+def test_no_new_docstring():
+    tree = Module.from_source("def f():\n    'a' + 'b'\n    return 1")
+    assert optimize(tree) is tree
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["if True:\n    'hello'\nx = 1", "if 0:\n    x = 1\n'hello'"],
+)
+def test_no_new_module_docstring(source):
+    expected = show(source)
+
+    assert "__doc__" not in run(expected)
+    assert run(expected) == run(source)
+
+
+@pytest.mark.parametrize("keyword", ["def f()", "async def f()", "class f"])
+def test_no_new_function_docstring(keyword):
+    source = f"{keyword}:\n    if 1:\n        'hello'\n    x = 1"
+
+    assert run(show(source))["f"].__doc__ is None
+    assert run(source)["f"].__doc__ is None
+
+
+def test_shares_unchanged_subtrees():
+    tree = Module.from_source("def f(a):\n    return a + 1\nx = 2 * 3\ndef g(): pass")
+    new = optimize(tree)
+
+    assert new.body[0] is tree.body[0]
+    assert new.body[2] is tree.body[2]
+    assert new.body[1] == Module.from_source("x = 6").body[0]
+    assert optimize(new) is new
+
+
+def strip(source, **kwargs):
+    return remove_dead_code(Module.from_source(source), **kwargs).to_source().strip()
+
+
+def test_unused_imports():
+    source = """
+from __future__ import annotations
+import os, os.path, sys as system, json
+from typing import Any, List
+from collections import *
+from io import __all__
+
+def f(x: Any) -> None:
+    return os.sep
+"""
+    expected = """
+from __future__ import annotations
+import os, os.path
+from typing import Any
+from collections import *
+from io import __all__
+
+def f(x: Any) -> None:
+    return os.sep
+"""
+    assert strip(source) == expected.strip()
+
+
+def test_unused_private_definitions():
+    source = """
+import re
+
+def _a():
+    return _b()
+
+def _b():
+    return _a()
+
+def _c():
+    return re
+
+class _D:
+    pass
+
+class _E(object):
+    pass
+
+@decorator
+def _f():
+    pass
+
+def __getattr__(name):
+    pass
+
+def public():
+    return _g()
+
+def _g():
+    pass
+"""
+    expected = """
+class _E(object):
+    pass
+
+@decorator
+def _f():
+    pass
+
+def __getattr__(name):
+    pass
+
+def public():
+    return _g()
+
+def _g():
+    pass
+"""
+    assert strip(source) == expected.strip()
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "import os\n__all__ = ['os']\n",
+        "import os\n__all__ = []\n__all__ += ['os']\n",
+        "import os\nclass C:\n    os = os\n",
+        "import os\ndef f():\n    global os\n    os = 1\n",
+        "import os\ndel os\n",
+        "import os\nx = globals()['os']\n",
+        "def _f():\n    pass\ndef g():\n    return eval('_f')\n",
+        "import os\n[os for _ in 'ab']\n",
+        "import os\nf = lambda: os\n",
+        "import typing\nx: typing.Any = 1\n",
+    ],
+)
+def test_kept_names(source):
+    tree = Module.from_source(source)
+    assert remove_dead_code(tree) is tree
+
+
+def test_keep():
+    assert strip("import os, sys", keep=["sys"]) == "import sys"
+
+
+def test_local_names_do_not_count():
+    assert strip("import os\ndef f(os):\n    return os") == "def f(os):\n    return os"
+
+
+def test_unreachable_statements():
+    source = """
+def f(x):
+    for y in x:
+        if y:
+            continue
+            y()
+        else:
+            break
+            z()
+        raise ValueError
+        print(y)
+    return x
+    x = 1
+    x()
+"""
+    expected = """
+def f(x):
+    for y in x:
+        if y:
+            continue
+        else:
+            break
+        raise ValueError
+    return x
+"""
+    assert strip(source) == expected.strip()
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "def f():\n    return\n    yield\n",
+        "def f():\n    return x\n    x = 1\n",
+        "def f():\n    x = 1\n    return\n    global y\n",
+        "def f():\n    def g():\n        return x\n    return g\n    x = 1\n",
+    ],
+)
+def test_unreachable_statements_changing_functions(source):
+    tree = Module.from_source(source)
+    assert remove_dead_code(tree) is tree
+
+
+def test_unreachable_bound_elsewhere():
+    source = "def f(a):\n    b = 1\n    if a:\n        return\n        a = b = 2\n    return a + b"
+    assert (
+        strip(source)
+        == "def f(a):\n    b = 1\n    if a:\n        return\n    return a + b"
+    )
+
+    # ``b`` is bound twice in dead code only, and must stay a local
+    source = (
+        "def f():\n    if x:\n        return\n        b = 1\n" "    return b\n    b = 2"
+    )
+    assert (
+        strip(source) == "def f():\n    if x:\n        return\n    return b\n    b = 2"
+    )
@@ -0,0 +1,104 @@
+import json
+import random
+
+from asttrs import (
+    Constant,
+    Cursor,
+    Dict,
+    Insert,
+    Module,
+    Name,
+    Pass,
+    apply_edits,
+    apply_patch,
+    make_patch,
+)
+from asttrs._patch import decode, encode
+
+SOURCE = '''
+import os
+
+class A:
+    """doc"""
+
+    def f(self, x=b"raw", *, y=1j):
+        global counter
+        return {**x, "k": (1, ...)}
+
+def g():
+    return A().f()
+
+print(g(), os.sep)
+'''
+
+
+def roundtrip(old, new):
+    patch = json.loads(json.dumps(make_patch(old, new)))
+    result = apply_patch(old, patch)
+
+    assert result == new
+    return patch
+
+
+def test_encode_decode():
+    tree = Module.from_source(SOURCE)
+
+    assert decode(json.loads(json.dumps(encode(tree)))) == tree
+    assert decode(encode(Constant(value=(1, b"x", frozenset([2]))))) == Constant(
+        value=(1, b"x", frozenset([2]))
+    )
+    assert encode(Constant(value=1)) == {"_": "Constant", "value": 1}
+
+
+def test_roundtrip_edits():
+    old = Module.from_source(SOURCE)
+    cls = old.body[1]
+
+    new = apply_edits(
+        old,
+        [
+            (("body", 0), None),
+            (("body", 1, "name"), "B"),
+            (("body", 1, "body", 1, "body", 0, "names", 0), "total"),
+            (("body", 2), Insert(Pass())),
+            (("body", 3), Insert([cls])),
+        ],
+    )
+
+    roundtrip(old, new)
+
+    dict_path = next(Cursor(old).find(Dict)).path
+    roundtrip(
+        old,
+        apply_edits(
+            old, [(dict_path + ("keys", 1), None), (dict_path + ("values", 1), None)]
+        ),
+    )
+    roundtrip(old, apply_edits(old, [(dict_path + ("keys", 1), [None])]))
+
+
+def test_roundtrip_move_is_compact():
+    old = Module.from_source(SOURCE)
+    new = apply_edits(old, [(("body", 1), None), (("body", 4), Insert(old.body[1]))])
+
+    patch = roundtrip(old, new)
+
+    assert patch == [["m", ["body", 1], ["body", 4]]]
+
+
+def test_roundtrip_random():
+    rng = random.Random(0)
+    old = Module.from_source(SOURCE * 3)
+    names = list(Cursor(old).find(Name))
+
+    for _ in range(20):
+        edits = [
+            (cur.path, cur.node.evolve(id=cur.node.id + "_"))
+            for cur in rng.sample(names, 5)
+        ]
+        new = apply_edits(old, edits)
+
+        stmt = rng.randrange(len(old.body))
+        change = None if rng.random() < 0.5 else Insert(Pass())
+
+        roundtrip(old, apply_edits(new, [(("body", stmt), change)]))
@@ -0,0 +1,88 @@
+import sys
+
+import pytest
+
+from asttrs import (
+    ANY,
+    Attribute,
+    Call,
+    Capture,
+    Constant,
+    Load,
+    Module,
+    Name,
+    P,
+    compile_pattern,
+    expr,
+    node_index,
+)
+
+SOURCE = """
+cur.execute("select 1")
+cur.execute(query, args)
+db.execute("drop table x")
+cur.fetchall()
+"""
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="strings are Str nodes")
+def test_match_with_captures():
+    tree = Module.from_source(SOURCE)
+    pat = compile_pattern(
+        P(
+            Call,
+            func=P(Attribute, value=Capture("obj"), attr="execute"),
+            args=[Capture("sql", P(Constant))],
+        )
+    )
+
+    matches = list(pat.finditer(tree))
+
+    assert [m["sql"].value for m in matches] == ["select 1", "drop table x"]
+    assert [m["obj"].id for m in matches] == ["cur", "db"]
+    assert matches[0].node is tree.body[0].value
+
+    node_index(tree)
+    assert [m.node for m in pat.finditer(tree)] == [m.node for m in matches]
+
+
+def test_literal_nodes_and_wildcards():
+    tree = Module.from_source(SOURCE)
+
+    by_node = compile_pattern(
+        P(Call, func=P(Attribute, value=Name(id="cur", ctx=Load())))
+    )
+    assert len(by_node.findall([tree, tree])) == 6
+
+    two_args = compile_pattern(P(Call, args=[ANY, ...]))
+    assert len(list(two_args.finditer(tree))) == 1
+
+    every = list(compile_pattern(ANY).finditer(tree))
+    exprs = list(compile_pattern(P(expr)).finditer(tree))
+
+    assert [m.node for m in exprs] == [
+        m.node for m in every if isinstance(m.node, expr)
+    ]
+
+
+def test_repeated_capture_must_agree():
+    pat = compile_pattern(P(Call, args=[Capture("x"), Capture("x")]))
+
+    assert pat.match(Module.from_source("f(a, a)").body[0].value)
+    assert pat.match(Module.from_source("f(a, b)").body[0].value) is None
+
+
+def test_unknown_field():
+    with pytest.raises(TypeError):
+        P(Call, function=ANY)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="match statement")
+def test_match_statement_node_is_not_shadowed():
+    import asttrs
+
+    tree = asttrs.Module.from_source("match x:\n    case 1:\n        pass")
+
+    assert asttrs.Match is asttrs._ast.Match
+    assert isinstance(tree.body[0], asttrs.Match)
+    assert tree.body[0].subject == asttrs.Name(id="x", ctx=asttrs.Load())
@@ -0,0 +1,139 @@
+import symtable
+import sys
+
+import pytest
+
+from asttrs import Module, analyze_scopes
+
+SOURCE = """
+import os.path as osp
+from sys import *
+
+x = 1
+
+@decorate(x)
+def f(a, /, *b, c=x, **d) -> int:
+    global g
+    y: int = a
+    def h():
+        nonlocal y
+        def k():
+            return y + z
+        y = 2
+        return k
+    [w := i for i in b if i]
+    return h, w, {k: v for k, v in d.items()}, (lambda q: q + y)
+
+class C(Base, metaclass=Meta):
+    q = 1
+    def m(self):
+        return q, [q for _ in range(3)]
+
+try:
+    pass
+except Exception as err:
+    del err
+"""
+
+
+def _symbols(table):
+    result = {}
+    for sym in table.get_symbols():
+        name = sym.get_name()
+        if name.startswith(".") or name == "__class__":
+            continue
+        result[name] = _flags(sym)
+    return result
+
+
+def _flags(sym):
+    return (
+        sym.is_local(),
+        sym.is_global(),
+        sym.is_declared_global(),
+        sym.is_free(),
+        sym.is_parameter(),
+        sym.is_imported(),
+        sym.is_referenced(),
+    )
+
+
+INLINED = {"listcomp", "setcomp", "dictcomp"}
+
+
+def _inlined(scope):
+    # Since 3.12, symtable has no table for list, set and dict comprehensions
+    # (PEP 709): their names are in the enclosing one, where not already.
+    symbols = {name: _flags(sym) for name, sym in scope.symbols.items()}
+    children = []
+    for child in scope.children:
+        if sys.version_info < (3, 12) or child.name not in INLINED:
+            children.append(child)
+            continue
+
+        names, grandchildren = _inlined(child)
+        for name, flags in names.items():
+            symbols.setdefault(name, flags)
+        children.extend(grandchildren)
+
+    return symbols, children
+
+
+def _compare(table, scope):
+    assert scope.name == table.get_name()
+
+    symbols, scope_children = _inlined(scope)
+    assert symbols == _symbols(table)
+
+    children = table.get_children()
+    assert len(children) == len(scope_children)
+    for child_table, child in zip(children, scope_children):
+        _compare(child_table, child)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="positional-only, walrus")
+def test_scopes_match_symtable():
+    tree = Module.from_source(SOURCE)
+    scope = analyze_scopes(tree)
+
+    _compare(symtable.symtable(SOURCE, "<test>", "exec"), scope)
+
+    f = scope.children[0]
+    assert f.node is tree.body[3]
+    assert f.globals == {"g", "int"}
+    assert f.cells == {"w", "y"}
+    assert f.children[0].nonlocals == {"y"}
+    assert f.children[0].children[0].free == {"y"}
+    assert f.children[1].lookup("w").is_free()
+    assert "w" in f.bound
+
+    cls = scope.children[1]
+    assert cls.kind == "class"
+    assert cls.children[0].lookup("q").is_global()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="positional-only, walrus")
+def test_scopes_are_cached_per_subtree():
+    tree = Module.from_source(SOURCE)
+    scope = analyze_scopes(tree)
+
+    assert analyze_scopes(tree) is scope
+
+    edited = tree.evolve(body=tree.body + Module.from_source("z = 3").body)
+    new = analyze_scopes(edited)
+
+    assert new is not scope
+    assert new.lookup("z").is_local()
+    assert new.children[0].node is scope.children[0].node
+    assert new.children[0].children[0].children[0].lookup("z").is_global()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="type parameters")
+def test_type_params():
+    source = "type A[T] = list[T]\ndef f[T: int](x: T) -> T:\n    return x\n"
+    scope = analyze_scopes(Module.from_source(source))
+
+    alias, generic = scope.children
+    assert alias.kind == "type_alias" and alias.lookup("T").is_local()
+    assert generic.kind == "type_params" and generic.lookup("T").is_local()
+    assert generic.children[0].kind == "function"
@@ -0,0 +1,60 @@
+import sys
+
+import asttrs
+from asttrs import Constant, Load, Module, Name
+from asttrs.stats import MemoryReport, Usage, memory_report
+
+
+def test_counts_each_object_once():
+    name = Name(id="x", ctx=Load())
+    tree = Module(body=[asttrs.Expr(value=name), asttrs.Expr(value=name)])
+
+    report = memory_report(tree)
+
+    assert report.nodes["Expr"] == Usage(count=2, bytes=2 * sys.getsizeof(tree.body[0]))
+    assert report.nodes["Name"].count == 1
+    assert report.nodes["Load"].count == 1
+    assert report.shared == Usage(count=1, bytes=sys.getsizeof(name))
+    assert report.strings == Usage(count=1, bytes=sys.getsizeof("x"))
+
+    lists = [tree.body]
+    if sys.version_info >= (3, 8):
+        lists.append(tree.type_ignores)
+    assert report.containers["list"] == Usage(
+        count=len(lists), bytes=sum(sys.getsizeof(el) for el in lists)
+    )
+
+
+def test_shared_between_trees():
+    source = "def f(a):\n    return a + 1\n"
+    first = Module.from_source(source)
+    second = first.evolve(body=first.body + Module.from_source("b = 2").body)
+
+    alone = memory_report(first)
+    both = memory_report(first, second)
+
+    assert both.nodes["FunctionDef"].count == 1
+    assert both.nodes["Module"].count == 2
+    assert both.shared.count >= 1
+    assert both.total.bytes < alone.total.bytes * 2
+
+
+def test_values_and_export():
+    tree = Module.from_source("x = (1, 2.5, b'raw', None)")
+    report = memory_report(tree)
+
+    assert report.other["int"].count == 1
+    assert report.other["float"].count == 1
+    assert report.other["bytes"].count == 1
+    assert "NoneType" not in report.other
+
+    data = report.to_dict()
+    if sys.version_info < (3, 8):  # as Num, Bytes and NameConstant
+        assert data["nodes"]["Num"]["count"] == 2
+    else:
+        assert data["nodes"]["Constant"]["count"] == 4
+    assert isinstance(report, MemoryReport)
+    assert asttrs.stats.memory_report is memory_report
+
+    assert memory_report().total == Usage()
+    assert memory_report(Constant(value=None)).total.count == 1
@@ -0,0 +1,110 @@
+import pytest
+
+from asttrs import Load, Module, Name, Pass, template
+
+SOURCE = """
+import $module
+
+def $name(self, $args, *, key=None):
+    '''$doc'''
+    $body
+    return $module.$attr(key=$value, $kw=1)
+"""
+
+
+def test_substitute_matches_from_source():
+    tpl = template(SOURCE)
+    assert tpl.placeholders == (
+        "module",
+        "name",
+        "args",
+        "doc",
+        "body",
+        "attr",
+        "value",
+        "kw",
+    )
+
+    tree = tpl.substitute(
+        module="os",
+        name="run",
+        args=["a", "b"],
+        doc="Run it.",
+        body=Module.from_source("x = a + b\ny = x").body,
+        attr="path",
+        value=Name(id="x", ctx=Load()),
+        kw="flag",
+    )
+
+    expected = Module.from_source("""
+import os
+
+def run(self, a, b, *, key=None):
+    '''Run it.'''
+    x = a + b
+    y = x
+    return os.path(key=x, flag=1)
+""")
+    assert tree == expected
+
+
+def test_values():
+    tpl = template("def f():\n    $first\n    return [$items]")
+
+    node = Name(id="s", ctx=Load())
+    tree = tpl.substitute(first=None, items=[1, "name", b"", node])
+    assert tree == Module.from_source("def f():\n    return [1, name, b'', s]")
+
+    tree = tpl.substitute(first=Pass(), items=Name(id="x", ctx=Load()))
+    assert tree == Module.from_source("def f():\n    pass\n    return [x]")
+
+    tree = tpl.substitute(first=3, items=[])
+    assert tree == Module.from_source("def f():\n    3\n    return []")
+
+    assert template("'$$' + $x", mode="eval").substitute(x="y").to_source().strip() in (
+        "'$' + y",
+        '"$" + y',
+    )
+
+
+def test_only_the_paths_are_rebuilt():
+    tpl = template("import os\n\ndef f():\n    return $value\n\nclass C:\n    pass")
+    tree = tpl.substitute(value=1)
+
+    assert tree.body[0] is tpl.tree.body[0]
+    assert tree.body[2] is tpl.tree.body[2]
+    assert tree.body[1] is not tpl.tree.body[1]
+    assert tree.body[1].args is tpl.tree.body[1].args
+
+    assert (
+        tpl.substitute(value=2).body[1]
+        == Module.from_source("def f():\n    return 2").body[0]
+    )
+    assert tpl.tree.body[1].body[0].value.id.endswith("value")
+
+
+def test_cached():
+    assert template("x = $y") is template("x = $y")
+    assert template("$y") is not template("$y", mode="eval")
+
+
+def test_errors():
+    tpl = template("$name = $value")
+
+    with pytest.raises(KeyError):
+        tpl.substitute(name="x")
+
+    with pytest.raises(TypeError):
+        tpl.substitute(name="x", value=1, other=2)
+
+    with pytest.raises(TypeError):
+        template("x = $value").substitute(value=[1, 2])
+
+    with pytest.raises(TypeError):
+        template("import $module").substitute(module=1)
+
+    with pytest.raises(ValueError):
+        template("x = 'costs $price'")
+
+    with pytest.raises(TypeError):
+        template("def f(*, $kw): pass").substitute(kw=["a", "b"])
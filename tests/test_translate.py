@@ -0,0 +1,172 @@
+import importlib
+import pathlib
+import pickle
+import sys
+
+import pytest
+
+import asttrs
+from asttrs import Module, TranslationError, translate
+from asttrs import _py3_7 as py37
+from asttrs import _py3_8 as py38
+from asttrs import _py3_10 as py310
+from asttrs import _py3_12 as py312
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+SOURCE = """
+import os
+
+def f(a, *args, b=1, **kwargs) -> int:
+    with open(a) as fh:
+        data = fh.read()[1:-1]
+    return {k: v[::2, 0] for k, v in kwargs.items() if k}
+
+class C(Base, metaclass=Meta):
+    x: int = 3
+    y = f'{x!r:>{width}}'
+"""
+
+
+@pytest.mark.parametrize("version", ["3.7", "3.8", "3.9", "3.10", "3.11", "3.12"])
+def test_round_trip(version):
+    tree = Module.from_source(SOURCE)
+
+    other = translate(tree, version)
+    assert type(other).__module__.startswith("asttrs._py" + version.replace(".", "_"))
+    assert translate(other) == tree
+
+
+def test_same_version_is_unchanged():
+    tree = Module.from_source(SOURCE)
+
+    assert translate(tree) is tree
+    assert translate(tree, sys.version_info) is tree
+
+
+def test_legacy_constants():
+    tree = py37.Module(
+        body=[
+            py37.Expr(
+                value=py37.Tuple(
+                    elts=[
+                        py37.Num(n=1),
+                        py37.Str(s="a"),
+                        py37.Bytes(s=b"b"),
+                        py37.NameConstant(value=None),
+                        py37.Ellipsis(),
+                    ],
+                    ctx=py37.Load(),
+                )
+            )
+        ]
+    )
+
+    new = translate(tree, "3.8")
+
+    assert [el.value for el in new.body[0].value.elts] == [1, "a", b"b", None, ...]
+    assert new.to_source().strip() == "1, 'a', b'b', None, ..."
+    assert repr(translate(new, "3.7")) == repr(tree)
+
+
+def test_subscripts():
+    tree = Module.from_source("x[1]; x[1:2]; x[1:2, 3]; x[a, b]")
+    old = translate(tree, (3, 8))
+
+    slices = [stmt.value.slice for stmt in old.body]
+    assert [type(el).__name__ for el in slices] == [
+        "Index",
+        "Slice",
+        "ExtSlice",
+        "Index",
+    ]
+    assert type(slices[1]).__bases__[0].__name__ == "slice"
+    assert [type(el).__name__ for el in slices[2].dims] == ["Slice", "Index"]
+    assert type(slices[3].value).__name__ == "Tuple"
+
+    assert translate(old) == tree
+
+
+@pytest.mark.parametrize("version", ["3.7", "3.9", "3.12"])
+def test_formatted_value_conversion(version):
+    # unset, the generated classes default it to 0, which compile() rejects
+    value = py38.FormattedValue(value=py38.Name(id="x", ctx=py38.Load()))
+
+    assert translate(value, version).conversion == -1
+    assert translate(value.evolve(conversion=None), version).conversion == -1
+    assert translate(value.evolve(conversion=114), version).conversion == 114
+
+
+def test_untranslatable():
+    match = py310.Match(
+        subject=py310.Name(id="x", ctx=py310.Load()),
+        cases=[
+            py310.match_case(
+                pattern=py310.MatchValue(value=py310.Constant(value=1)),
+                body=[py310.Pass()],
+            )
+        ],
+    )
+    with pytest.raises(TranslationError, match="Match has no equivalent in Python 3.9"):
+        translate(match, "3.9")
+
+    posonly = py38.FunctionDef(
+        name="f",
+        args=py38.arguments(posonlyargs=[py38.arg(arg="a")]),
+        body=[py38.Pass()],
+    )
+    with pytest.raises(TranslationError, match="arguments.posonlyargs"):
+        translate(posonly, "3.7")
+
+    generic = py312.FunctionDef(
+        name="f",
+        args=py312.arguments(),
+        body=[py312.Pass()],
+        type_params=[py312.TypeVar(name="T")],
+    )
+    with pytest.raises(TranslationError, match="FunctionDef.type_params"):
+        translate(generic, "3.11")
+
+    plain = generic.evolve(type_params=[])
+    assert translate(plain, "3.11").to_source().strip() == "def f():\n    pass"
+
+
+def test_versions_and_sources():
+    with pytest.raises(ValueError):
+        translate(Module(), "3.6")
+
+    tree = translate(Module.from_source("x = 1"), "3.12")
+    assert translate(tree, "3.8", source="3.12") == translate(tree, "3.8")
+
+    class Custom(asttrs.AST):
+        pass
+
+    with pytest.raises(TranslationError, match="pass source="):
+        translate(Custom())
+
+
+def test_unpickled_from_another_version():
+    tree = translate(Module.from_source(SOURCE), "3.8")
+    data = pickle.dumps(tree)
+
+    loaded = pickle.loads(data)
+
+    assert translate(loaded) == Module.from_source(SOURCE)
+
+
+def test_comments_are_kept():
+    tree = Module(body=[asttrs.Comment(body="note"), asttrs.Pass()])
+
+    assert translate(tree, "3.9").body[0] == tree.body[0]
+
+
+def test_schema_table_is_up_to_date():
+    pytest.importorskip("invoke")
+    sys.path.insert(0, str(ROOT))
+    try:
+        tasks = importlib.import_module("tasks")
+    finally:
+        sys.path.remove(str(ROOT))
+
+    path = pathlib.Path(asttrs.__file__).with_name("_schemas.json")
+    assert tasks.render_schemas() == path.read_text()
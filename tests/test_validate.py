@@ -0,0 +1,155 @@
+import ast
+import sys
+
+import pytest
+
+from asttrs import (
+    Call,
+    Constant,
+    Dict,
+    Expr,
+    FunctionDef,
+    Load,
+    Module,
+    Name,
+    Pass,
+    Return,
+    StrictMode,
+    ValidationError,
+    arguments,
+    immutable,
+    validate,
+)
+
+SOURCE = """
+import os
+
+def f(a, *args, b, c=1, **kw):
+    global g
+    return {**kw, "a": a, 1: (1, 2.0, b"x", ...)}
+
+class C(object, metaclass=type):
+    y: int = f([1, 2], b=None)
+"""
+
+
+def test_valid_trees():
+    validate(Module.from_source(SOURCE))
+
+    path = ast.__file__
+    with open(path) as f:
+        validate(Module.from_source(f.read()))
+
+
+def test_wrong_node():
+    func = FunctionDef(name="f", args=arguments(), body=[Pass(), Constant(value=1)])
+    tree = Module(body=[Expr(value=Constant(value=0)), func])
+
+    with pytest.raises(ValidationError) as exc:
+        validate(tree)
+
+    err = exc.value
+    assert isinstance(err, TypeError)
+    assert err.node is func
+    assert (err.field, err.index, err.expected) == ("body", 1, "stmt")
+    assert err.path == ("body", 1)
+    assert str(err) == "FunctionDef.body[1] at body[1]: expected stmt, got Constant"
+
+
+@pytest.mark.parametrize(
+    "node, field, expected",
+    [
+        (Name(id=1, ctx=Load()), "id", "identifier"),
+        (Name(id="x", ctx=None), "ctx", "expr_context"),
+        (Return(value=Pass()), "value", "expr"),
+        (Module(body=(Pass(),)), "body", "list of stmt"),
+        (Constant(value=[1]), "value", "constant"),
+        (Constant(value=(1, object())), "value", "constant"),
+    ],
+)
+def test_wrong_fields(node, field, expected):
+    with pytest.raises(ValidationError) as exc:
+        validate(node)
+
+    assert (exc.value.field, exc.value.expected) == (field, expected)
+    assert exc.value.path == ()
+
+
+def test_optional_fields():
+    validate(Return(value=None))
+    validate(FunctionDef(name="f", args=arguments(), body=[Pass()], returns=None))
+
+    # ``None`` keys stand for ``**d``
+    validate(Dict(keys=[None], values=[Name(id="d", ctx=Load())]))
+
+    with pytest.raises(ValidationError):
+        validate(Dict(keys=[Constant(value=1)], values=[None]))
+
+
+def test_not_a_node():
+    with pytest.raises(ValidationError):
+        validate(ast.parse("x"))
+
+
+def test_subclasses():
+    @immutable
+    class Named(Name):
+        note: str = ""
+
+    validate(Named(id="x", ctx=Load(), note="n"))
+
+    with pytest.raises(ValidationError) as exc:
+        validate(Named(id="x", ctx=Name(id="y", ctx=Load())))
+    assert exc.value.field == "ctx"
+
+    with pytest.raises(ValidationError) as exc:
+        validate(Named(id="x", ctx=Load(), note=1))
+    assert exc.value.field == "note"
+
+
+def test_strict_mode():
+    assert Return(value=Pass()).value == Pass()
+
+    with StrictMode() as strict:
+        assert strict.enabled
+
+        with pytest.raises(ValidationError):
+            Return(value=Pass())
+
+        node = Call(func=Name(id="f", ctx=Load()))
+        with pytest.raises(ValidationError):
+            node.evolve(args=Constant(value=1))
+
+        tree = Module.from_source(SOURCE)
+
+    assert not strict.enabled
+    assert tree == Module.from_source(SOURCE)
+    assert Return(value=Pass()).value == Pass()
+
+
+def test_strict_mode_nests():
+    outer = StrictMode().enable()
+
+    with StrictMode():
+        pass
+
+    with pytest.raises(ValidationError):
+        Return(value=Pass())
+
+    outer.disable()
+    outer.disable()
+
+    Return(value=Pass())
+
+
+def test_strict_mode_from_env():
+    import subprocess
+
+    code = "import asttrs; asttrs.Return(value=asttrs.Pass())"
+    env = {"ASTTRS_STRICT": "1", "PYTHONPATH": ":".join(sys.path)}
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code], env=env, capture_output=True
+    )
+
+    assert proc.returncode == 1
+    assert b"ValidationError: Return.value: expected expr" in proc.stderr
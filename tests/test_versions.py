@@ -0,0 +1,79 @@
+import importlib
+
+import pytest
+
+import asttrs
+from asttrs import TranslationError, _versions, walk
+
+OTHER = "3.8" if _versions.CURRENT != "3.8" else "3.9"
+
+
+def v(version):
+    return importlib.import_module("asttrs.v" + version.replace(".", "_"))
+
+
+@pytest.mark.parametrize("version", _versions.VERSIONS)
+def test_every_version_is_importable(version):
+    module = v(version)
+
+    assert module.Module.__module__ == _versions.module_name(version)
+    assert issubclass(module.Module, asttrs.AST)
+    assert getattr(asttrs, "v" + version.replace(".", "_")) is module
+
+
+def test_running_version_is_asttrs():
+    module = v(_versions.CURRENT)
+
+    assert module.Constant is asttrs.Constant
+    assert module.Module.from_source("x = 1") == asttrs.Module.from_source("x = 1")
+
+
+def test_parse_into_another_version():
+    module = v(OTHER)
+
+    tree = module.Module.from_source("def f(x):\n    return x[1]")
+
+    name = _versions.module_name(OTHER)
+    assert all(type(node).__module__ == name for node in walk(tree))
+    assert module.FunctionDef.from_source("def g(): pass").name == "g"
+    assert tree.to_source() == asttrs.Module.from_source(tree.to_source()).to_source()
+
+
+def test_build_for_another_version():
+    py312 = v("3.12")
+
+    func = py312.FunctionDef(
+        name="f",
+        args=py312.arguments(args=[py312.arg(arg="x")]),
+        body=[py312.Return(value=py312.Name(id="x", ctx=py312.Load()))],
+    )
+    assert func.to_source().strip() == "def f(x):\n    return x"
+
+    alias = py312.TypeAlias(
+        name=py312.Name(id="T", ctx=py312.Store()),
+        value=py312.Name(id="int", ctx=py312.Load()),
+    )
+    if _versions.CURRENT == "3.12":
+        assert alias.to_source().strip() == "type T = int"
+    else:
+        with pytest.raises(TranslationError, match="TypeAlias"):
+            alias.to_source()
+
+
+def test_normalize():
+    assert _versions.normalize((3, 10, 2)) == "3.10"
+    assert _versions.normalize("3_9") == "3.9"
+
+    with pytest.raises(ValueError, match="only 3.7"):
+        _versions.normalize("2.7")
+
+
+def test_only_other_versions_convert_through_the_running_one():
+    module = v(OTHER)
+
+    assert "to_ast" not in vars(asttrs.stmt)
+    assert "to_ast" in vars(module.stmt) and "from_ast" in vars(module.stmt)
+    assert module.Pass.to_ast is not asttrs.Pass.to_ast
+
+    assert isinstance(module.Pass(), module.stmt)
+    assert not isinstance(module.Pass(), asttrs.stmt)
@@ -0,0 +1,70 @@
+from asttrs import Constant, Expr, Module, Name, NodeTransformer, NodeVisitor, Pass
+
+SOURCE = """
+def foo(a):
+    print(a)
+    return a + 1
+
+x = foo(2)
+"""
+
+
+def test_visitor_dispatch():
+    class Collect(NodeVisitor):
+        def __init__(self):
+            self.names = []
+
+        def visit_Name(self, node):
+            self.names.append(node.id)
+
+    visitor = Collect()
+    visitor.visit(Module.from_source(SOURCE))
+
+    assert visitor.names == ["print", "a", "a", "x", "foo"]
+    assert Name in Collect._visit_table
+    assert Name not in NodeVisitor._visit_table
+
+
+def test_transformer_shares_unchanged_subtrees():
+    class Bump(NodeTransformer):
+        def visit_Constant(self, node):
+            return node.evolve(value=node.value + 1)
+
+        def visit_Num(self, node):  # as 3.7 parses numbers
+            return node.evolve(n=node.n + 1)
+
+    tree = Module.from_source(SOURCE)
+    new = Bump().visit(tree)
+
+    expected = SOURCE.replace("a + 1", "a + 2").replace("foo(2)", "foo(3)")
+
+    assert new.to_source() == Module.from_source(expected).to_source()
+    assert new is not tree
+    func, new_func = tree.body[0], new.body[0]
+    assert new_func.body[0] is func.body[0]
+    assert new_func.args is func.args
+    assert new.body[1].targets[0] is tree.body[1].targets[0]
+
+
+def test_transformer_identity():
+    tree = Module.from_source(SOURCE)
+
+    assert NodeTransformer().visit(tree) is tree
+
+
+def test_transformer_remove_and_splice():
+    class Rewrite(NodeTransformer):
+        def visit_Expr(self, node):
+            return None
+
+        def visit_Return(self, node):
+            return [Expr(value=Constant(value="bye")), node]
+
+    new = Rewrite().visit(Module.from_source(SOURCE))
+    body = new.body[0].body
+
+    assert [type(n) for n in body] == [Expr, type(new.body[0].body[1])]
+    assert body[0].value == Constant(value="bye")
+
+    assert Rewrite().visit(Module(body=[Expr(value=Name(id="x", ctx=None))])).body == []
+    assert Rewrite().visit(Pass()) == Pass()
@@ -0,0 +1,88 @@
+import ast
+
+from asttrs import (
+    AST,
+    Call,
+    ClassDef,
+    Constant,
+    FunctionDef,
+    Module,
+    Name,
+    alias,
+    arguments,
+    expr,
+    iter_child_nodes,
+    iter_fields,
+    stmt,
+    walk,
+)
+from asttrs._walk import child_fields, reachable
+
+SOURCE = """
+import os
+from sys import path as p
+
+class Foo(Base):
+    def bar(self, x=1):
+        return [os.path.join(p, y) for y in x]
+
+print(Foo().bar())
+"""
+
+
+def test_iter_fields():
+
+    node = Name(id="x", ctx=None)
+
+    assert list(iter_fields(node)) == [("id", "x"), ("ctx", None)]
+
+
+def test_child_fields_skip_scalars():
+
+    assert child_fields(FunctionDef)[0][0] == "args"
+    assert ("name", False) not in child_fields(FunctionDef)
+    assert ("body", True) in child_fields(FunctionDef)
+    assert child_fields(Constant) == ()
+
+
+def test_iter_child_nodes():
+
+    tree = Module.from_source("x = f(1)")
+    assign = tree.body[0]
+
+    children = list(iter_child_nodes(assign))
+
+    assert [type(c).__name__ for c in children] == ["Name", "Call"]
+
+
+def test_walk_matches_ast_walk():
+
+    tree = Module.from_source(SOURCE)
+
+    names = sorted(type(n).__name__ for n in walk(tree))
+    expected = sorted(type(n).__name__ for n in ast.walk(ast.parse(SOURCE)))
+
+    assert names == expected
+
+
+def test_walk_document_order():
+
+    tree = Module.from_source(SOURCE)
+
+    names = [n.id for n in walk(tree, Name)]
+
+    assert names == ["Base", "os", "p", "y", "y", "x", "print", "Foo"]
+    assert [n.name for n in walk(tree, (ClassDef, FunctionDef))] == ["Foo", "bar"]
+    assert [type(n) for n in walk(tree, stmt)][0] is type(tree.body[0])
+
+
+def test_walk_prunes():
+
+    assert alias not in reachable(Call)
+    assert expr in reachable(Call)
+
+    tree = Module.from_source(SOURCE)
+
+    assert [a.name for a in walk(tree, alias)] == ["os", "path"]
+    assert list(walk(tree.body[-1], alias)) == []
+    assert all(isinstance(n, AST) for n in walk(arguments()))